@@ -4,18 +4,38 @@ OVITO Workflow Backend Package
 Modular backend for thermomechanical analysis of LAMMPS simulation data
 """
 
-from .processors import NVEProcessor, NVTProcessor, process_nve_simulation, process_nvt_simulation
-from .core.elastic_constants import ElasticConstantsProcessor, load_elastic_constants_from_directory
-from .core.thermomechanical import ThermomechanicalProcessor
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "OVITO Workflow Team"
 __description__ = "Modular backend for thermomechanical analysis"
 
+# Public name -> module defining it, imported on first access (PEP 562) so a
+# CLI command only loads the code it runs
+_LAZY_EXPORTS = {
+    'NVEProcessor': '.processors',
+    'NVTProcessor': '.processors',
+    'process_nve_simulation': '.processors',
+    'process_nvt_simulation': '.processors',
+    'ElasticConstantsProcessor': '.core.elastic_constants',
+    'load_elastic_constants_from_directory': '.core.elastic_constants',
+    'ThermomechanicalProcessor': '.core.thermomechanical',
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access and keep it"""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'NVEProcessor',
     'NVTProcessor',
-    'ElasticConstantsProcessor', 
+    'ElasticConstantsProcessor',
     'ThermomechanicalProcessor',
     'process_nve_simulation',
     'process_nvt_simulation',
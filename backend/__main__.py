@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Command-line entry point for ``python -m backend``
+"""
+
+import sys
+
+from .main import main
+
+sys.exit(main())
@@ -13,6 +13,12 @@ __all__ = [
     'SMALL_NUMBER',
     'DEFAULT_SFTP_PORT',
     'OTP_LENGTH',
+    'DEFAULT_MAX_UNCONFIRMED_READS',
+    'DEFAULT_SFTP_BUFFER_SIZE',
+    'MAX_SFTP_DOWNLOAD_WORKERS',
+    'SSH_KEEPALIVE_INTERVAL',
+    'RECONNECT_MAX_ATTEMPTS',
+    'RECONNECT_MAX_DELAY',
     'SUPPORTED_FORMATS',
     'DEFAULT_DELIMITER',
     'CSV_DELIMITER',
@@ -22,6 +28,9 @@ __all__ = [
     'NVT_DATA_HEADERS',
     'OUTPUT_HEADERS',
     'ELASTIC_FILES',
+    'DEFAULT_ELASTIC_FILES',
+    'ELASTIC_FILE_IDENTIFIERS',
+    'CACHE_DIR',
     'STRAIN_FILTER_THRESHOLD',
     'ELASTIC_ANALYSIS_THRESHOLD',
     'BETA_ANALYSIS_THRESHOLD'
@@ -4,6 +4,8 @@ Configuration module for OVITO workflow backend
 Contains constants and configuration settings
 """
 
+import os
+
 # Energy conversion constants
 EV_TO_J = 1.602e-19  # eV to Joules
 ANGSTROM3_TO_M3 = 1e-30  # Å³ to m³
@@ -19,42 +21,68 @@ SMALL_NUMBER = 1e-25  # For division protection
 DEFAULT_SFTP_PORT = 22
 OTP_LENGTH = 6
 
+# SFTP transfer tuning: read requests kept in flight, bytes per read request,
+# and concurrent file downloads over one authenticated session
+DEFAULT_MAX_UNCONFIRMED_READS = 64
+DEFAULT_SFTP_BUFFER_SIZE = 32768
+MAX_SFTP_DOWNLOAD_WORKERS = 8
+
+# Long-running SSH sessions: keepalive interval (s) so idle links are not cut,
+# and reconnect attempts with exponential backoff capped at the given delay (s)
+SSH_KEEPALIVE_INTERVAL = 30
+RECONNECT_MAX_ATTEMPTS = 8
+RECONNECT_MAX_DELAY = 300
+
 # File format settings
-SUPPORTED_FORMATS = ['.txt', '.csv']
+SUPPORTED_FORMATS = ('.txt', '.csv')
 DEFAULT_DELIMITER = ' '
 CSV_DELIMITER = ','
 COMMENT_CHAR = '#'
 
 # Column headers for different data types
-ELASTIC_CONSTANT_HEADERS = [
+ELASTIC_CONSTANT_HEADERS = (
     "delta_exx", "delta_eyy", "delta_ezz", "delta_exy", "delta_eyz", "delta_exz", 
     "delta_pxx", "delta_pyy", "delta_pzz", "delta_pxy", "delta_pyz", "delta_pxz"
-]
+)
 
-NVE_DATA_HEADERS = [
+NVE_DATA_HEADERS = (
     "step", "l_1", "l_2", "l_3", "l_4", "l_5", "l_6", 
     "p_1", "p_2", "p_3", "p_4", "p_5", "p_6", 
     "vol", "ep", "ek", "u", "t", "rho", "entropy"
-]
+)
 
-NVT_DATA_HEADERS = [
-    "step", "l_1", "l_2", "l_3", "l_4", "l_5", "l_6", 
-    "p_1", "p_2", "p_3", "p_4", "p_5", "p_6", 
-    "vol", "ep", "ek", "u", "t", "rho", "entropy", "etally"
-]
+# NVT output adds the thermostat energy tally to the NVE columns
+NVT_DATA_HEADERS = NVE_DATA_HEADERS + ("etally",)
 
-OUTPUT_HEADERS = [
+OUTPUT_HEADERS = (
     "#step", "#e_xz", "#s_xz", "#dW", "#W", "#We", "#Wp", "#dWp", "#dWe", 
     "#Delta_Ep", "#Delta_Ek", "#Delta_U", "#Delta_T", "#Delta_Q", 
     "#Delta_Etot", "#Delta_Ttally", "#dQ", "#dU", 
     "#Beta_0_diff", "#Beta_0_int", "#Beta_1_diff", "#Beta_1_int"
-]
+)
 
 # Elastic constant file names
-ELASTIC_FILES = [
+ELASTIC_FILES = (
     "c1144.txt", "c2255.txt", "c3366.txt", 
     "c1144r.txt", "c2255r.txt", "c3366r.txt"
-]
+)
+
+# Files fetched from a remote elastic directory when no explicit list is given
+DEFAULT_ELASTIC_FILES = (
+    "c1144.txt", "c2255.txt", "c3366.txt", 
+    "c1255.txt", "c1366.txt", "c2366.txt"
+)
+
+# Known file name -> constant identifier (e.g. 'c1144.txt' -> 'c1144')
+ELASTIC_FILE_IDENTIFIERS = {
+    name: name.rsplit('.', 1)[0] for name in ELASTIC_FILES + DEFAULT_ELASTIC_FILES
+}
+
+# Persistent caches (derived results keyed by input file signatures)
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'autoresearchrobot'
+)
 
 # Processing thresholds
 STRAIN_FILTER_THRESHOLD = 0.002
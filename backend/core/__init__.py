@@ -1,35 +1,66 @@
 #!/usr/bin/env python3
 """
 Core modules for OVITO workflow backend
+
+Exports are imported from their submodules on first access (PEP 562), so
+e.g. the elastic constants code runs without loading the OVITO analysis.
 """
 
-from .elastic_constants import ElasticConstantsProcessor, load_elastic_constants_from_directory
-from .thermomechanical import ThermomechanicalProcessor
+import importlib
+
+# Public name -> module defining it (relative to this package)
+_LAZY_EXPORTS = {
+    'ElasticConstantsProcessor': '.elastic_constants',
+    'load_elastic_constants_from_directory': '.elastic_constants',
+    'ThermomechanicalProcessor': '.thermomechanical',
+}
+
+# OVITO analysis modules (optional - require OVITO)
+_OVITO_EXPORTS = (
+    'DislocationAnalysis',
+    'WignerSeitzAnalysis',
+    'OvitoGPUConfig',
+    'save_dislocation_results',
+    'save_vacancy_results',
+    'OVITO_AVAILABLE'
+)
+
+
+def _ovito_core_available() -> bool:
+    """Import the OVITO analysis module once; False if it cannot be imported"""
+    if 'OVITO_CORE_AVAILABLE' not in globals():
+        try:
+            module = importlib.import_module('.ovito_analysis', __name__)
+        except ImportError:
+            globals()['OVITO_CORE_AVAILABLE'] = False
+        else:
+            globals().update({name: getattr(module, name) for name in _OVITO_EXPORTS})
+            globals()['OVITO_CORE_AVAILABLE'] = True
+    return globals()['OVITO_CORE_AVAILABLE']
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access and keep it"""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == 'OVITO_CORE_AVAILABLE':
+        return _ovito_core_available()
+    if name in _OVITO_EXPORTS and _ovito_core_available():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# OVITO analysis modules (optional imports - require OVITO)
-try:
-    from .ovito_analysis import (
-        DislocationAnalysis, WignerSeitzAnalysis, OvitoGPUConfig,
-        save_dislocation_results, save_vacancy_results, OVITO_AVAILABLE
-    )
-    OVITO_CORE_AVAILABLE = True
-except ImportError:
-    OVITO_CORE_AVAILABLE = False
 
 __all__ = [
     'ElasticConstantsProcessor',
-    'ThermomechanicalProcessor', 
-    'load_elastic_constants_from_directory'
+    'ThermomechanicalProcessor',
+    'load_elastic_constants_from_directory',
+    'DislocationAnalysis',
+    'WignerSeitzAnalysis',
+    'OvitoGPUConfig',
+    'save_dislocation_results',
+    'save_vacancy_results',
+    'OVITO_AVAILABLE',
+    'OVITO_CORE_AVAILABLE'
 ]
-
-# Add OVITO exports if available
-if OVITO_CORE_AVAILABLE:
-    __all__.extend([
-        'DislocationAnalysis',
-        'WignerSeitzAnalysis', 
-        'OvitoGPUConfig',
-        'save_dislocation_results',
-        'save_vacancy_results',
-        'OVITO_AVAILABLE',
-        'OVITO_CORE_AVAILABLE'
-    ])
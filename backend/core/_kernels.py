@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Numerical kernels for the core analysis modules
+JIT-compiled with Numba when available, with NumPy fallbacks otherwise
+"""
+
+import functools
+
+import numpy as np
+
+# Handle Numba imports safely (optional dependency)
+NUMBA_AVAILABLE = False
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def slope_through_origin(x, y):
+        """Least-squares slope of y vs x with zero intercept: (x·y)/(x·x)"""
+        s_xy = 0.0
+        s_xx = 0.0
+        for i in range(x.shape[0]):
+            s_xy += x[i] * y[i]
+            s_xx += x[i] * x[i]
+        return s_xy / s_xx
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def batch_slopes_through_origin(x_block, y_block):
+        """Row-wise slopes through the origin for stacked (M, N) x and y arrays"""
+        slopes = np.empty(x_block.shape[0])
+        for row in prange(x_block.shape[0]):
+            s_xy = 0.0
+            s_xx = 0.0
+            for i in range(x_block.shape[1]):
+                s_xy += x_block[row, i] * y_block[row, i]
+                s_xx += x_block[row, i] * x_block[row, i]
+            slopes[row] = s_xy / s_xx
+        return slopes
+
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def ws_site_counts(occupancy, structure_types, n_types):
+        """Vacant-site count and structure-type histogram in a single pass over the sites"""
+        n_sites = occupancy.shape[0]
+        n_chunks = min(64, max(1, n_sites))
+        chunk = (n_sites + n_chunks - 1) // n_chunks
+        vacant = np.zeros(n_chunks, dtype=np.int64)
+        hist = np.zeros((n_chunks, n_types), dtype=np.int64)
+        for c in prange(n_chunks):
+            count = 0
+            for i in range(c * chunk, min((c + 1) * chunk, n_sites)):
+                if occupancy[i] == 0:
+                    count += 1
+                hist[c, structure_types[i]] += 1
+            vacant[c] = count
+        
+        total = np.zeros(n_types, dtype=np.int64)
+        for c in range(n_chunks):
+            for t in range(n_types):
+                total[t] += hist[c, t]
+        return vacant.sum(), total
+
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def von_mises_strain_block(e):
+        """Von Mises equivalent strain per row of an (N, 6) Voigt strain array"""
+        n_rows = e.shape[0]
+        out = np.empty(n_rows, dtype=e.dtype)
+        for i in prange(n_rows):
+            d12 = e[i, 0] - e[i, 1]
+            d23 = e[i, 1] - e[i, 2]
+            d13 = e[i, 0] - e[i, 2]
+            shear = e[i, 3] * e[i, 3] + e[i, 4] * e[i, 4] + e[i, 5] * e[i, 5]
+            out[i] = np.sqrt(2.0) / 3.0 * np.sqrt(d12 * d12 + d23 * d23 + d13 * d13 + 1.5 * shear)
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def von_mises_stress_block(s):
+        """Von Mises equivalent stress per row of an (N, 6) Voigt stress array"""
+        n_rows = s.shape[0]
+        out = np.empty(n_rows, dtype=s.dtype)
+        for i in prange(n_rows):
+            d12 = s[i, 0] - s[i, 1]
+            d23 = s[i, 1] - s[i, 2]
+            d13 = s[i, 0] - s[i, 2]
+            shear = s[i, 3] * s[i, 3] + s[i, 4] * s[i, 4] + s[i, 5] * s[i, 5]
+            out[i] = np.sqrt(0.5 * (d12 * d12 + d23 * d23 + d13 * d13 + 6.0 * shear))
+        return out
+
+    # No fastmath: the running sums must accumulate in the same order as np.cumsum.
+    # The six accumulators are float64 scalars whatever the block dtype
+    @njit(cache=True, nogil=True)
+    def elastic_plastic_split(stress_rates, total, S11, S12, S44):
+        """
+        Cubic-compliance elastic strain increments, their running sum and the plastic
+        remainder in one pass over (N, 6) stress-rate and total-strain arrays
+        """
+        n_rows = stress_rates.shape[0]
+        elastic = np.empty((n_rows, 6), dtype=stress_rates.dtype)
+        plastic = np.empty((n_rows, 6), dtype=stress_rates.dtype)
+        e0 = e1 = e2 = e3 = e4 = e5 = 0.0
+        for i in range(n_rows):
+            ds0 = stress_rates[i, 0]
+            ds1 = stress_rates[i, 1]
+            ds2 = stress_rates[i, 2]
+            e0 += S11 * ds0 + S12 * (ds1 + ds2)
+            e1 += S11 * ds1 + S12 * (ds0 + ds2)
+            e2 += S11 * ds2 + S12 * (ds0 + ds1)
+            e3 += S44 * stress_rates[i, 3]
+            e4 += S44 * stress_rates[i, 4]
+            e5 += S44 * stress_rates[i, 5]
+            elastic[i, 0] = e0
+            elastic[i, 1] = e1
+            elastic[i, 2] = e2
+            elastic[i, 3] = e3
+            elastic[i, 4] = e4
+            elastic[i, 5] = e5
+            for j in range(6):
+                plastic[i, j] = total[i, j] - elastic[i, j]
+        return elastic, plastic
+
+else:
+    def slope_through_origin(x, y):
+        """Least-squares slope of y vs x with zero intercept: (x·y)/(x·x)"""
+        return float(x @ y) / float(x @ x)
+
+    def batch_slopes_through_origin(x_block, y_block):
+        """Row-wise slopes through the origin for stacked (M, N) x and y arrays"""
+        return (np.einsum('ij,ij->i', x_block, y_block) /
+                np.einsum('ij,ij->i', x_block, x_block))
+
+    def ws_site_counts(occupancy, structure_types, n_types):
+        """Vacant-site count and structure-type histogram in a single pass over the sites"""
+        return (np.count_nonzero(occupancy == 0),
+                np.bincount(structure_types, minlength=n_types))
+
+    def von_mises_strain_block(e):
+        """Von Mises equivalent strain per row of an (N, 6) Voigt strain array"""
+        e1, e2, e3, e4, e5, e6 = e.T
+        return (np.sqrt(2)/3 *
+                np.sqrt((e1 - e2)**2 + (e2 - e3)**2 + (e1 - e3)**2 +
+                        3/2 * (e4**2 + e5**2 + e6**2)))
+
+    def von_mises_stress_block(s):
+        """Von Mises equivalent stress per row of an (N, 6) Voigt stress array"""
+        s1, s2, s3, s4, s5, s6 = s.T
+        return np.sqrt(0.5 * ((s1 - s2)**2 + (s2 - s3)**2 + (s1 - s3)**2 +
+                              6 * (s4**2 + s5**2 + s6**2)))
+
+    def elastic_plastic_split(stress_rates, total, S11, S12, S44):
+        """
+        Cubic-compliance elastic strain increments, their running sum and the plastic
+        remainder in one pass over (N, 6) stress-rate and total-strain arrays
+        """
+        ds = stress_rates
+        elastic = np.empty((ds.shape[0], 6))  # float64 running sums, as in the Numba kernel
+        elastic[:, 0] = S11 * ds[:, 0] + S12 * (ds[:, 1] + ds[:, 2])
+        elastic[:, 1] = S11 * ds[:, 1] + S12 * (ds[:, 0] + ds[:, 2])
+        elastic[:, 2] = S11 * ds[:, 2] + S12 * (ds[:, 0] + ds[:, 1])
+        np.multiply(ds[:, 3:], S44, out=elastic[:, 3:])
+        np.cumsum(elastic, axis=0, out=elastic)
+        elastic = elastic.astype(total.dtype, copy=False)
+        return elastic, total - elastic
+
+
+def set_num_threads(n_threads: int) -> None:
+    """Cap the threads used by the parallel Numba kernels (no-op without Numba)"""
+    if NUMBA_AVAILABLE:
+        numba.set_num_threads(max(1, min(n_threads, numba.config.NUMBA_NUM_THREADS)))
+
+
+@functools.lru_cache(maxsize=16)
+def make_elastic_plastic_kernel(S11: float, S12: float, S44: float):
+    """
+    elastic_plastic_split specialised for one cubic material, memoized per (S11, S12, S44)
+    
+    With Numba the compliance values are closure constants of the compiled wrapper,
+    so LLVM can fold them into the inlined matvec. Numba's on-disk cache keys the
+    wrapper by those constants, so later runs on the same material skip the compile.
+    
+    Returns:
+        Function (stress_rates, total) -> (elastic, plastic)
+    """
+    if NUMBA_AVAILABLE:
+        @njit(cache=True, fastmath=False, nogil=True)
+        def split(stress_rates, total):
+            return elastic_plastic_split(stress_rates, total, S11, S12, S44)
+    else:
+        def split(stress_rates, total):
+            return elastic_plastic_split(stress_rates, total, S11, S12, S44)
+    return split
@@ -4,16 +4,255 @@ Core module for elastic constants calculations
 Provides functionality to calculate elastic constants from stress-strain data
 """
 
+from __future__ import annotations
+
+import fnmatch
+import functools
+import io
+import logging
+import re
 import numpy as np
-import pandas as pd
-from sklearn.linear_model import LinearRegression
-from typing import Tuple, List, Dict, Optional
 import os
-import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from ._kernels import slope_through_origin, batch_slopes_through_origin
+from ..utils.sftp_utils import SFTPManager, is_remote_path
+from ..utils.file_utils import read_data_file, read_data_bytes, determine_file_format
+from ..config.constants import (
+    ELASTIC_CONSTANT_HEADERS, CSV_DELIMITER, COMMENT_CHAR,
+    DEFAULT_ELASTIC_FILES, ELASTIC_FILE_IDENTIFIERS
+)
+
+if TYPE_CHECKING:
+    from typing import IO, Callable, Dict, List, Mapping, Optional, Tuple, Union
+    
+    import pandas as pd
+    import paramiko
+
+# Only the strain (first) and stress (second) columns feed the regression,
+# so parse just those two straight into float64
+_STRESS_STRAIN_READ_PARAMS = {'usecols': [0, 1], 'dtype': np.float64}
+
+# Constants consumed by build_rigidity_matrix (a missing one silently becomes 0)
+_RIGIDITY_CONSTANTS = ('c1144', 'c2255', 'c3366', 'c1255', 'c1366', 'c2366')
+
+# Remote files are fetched concurrently over channels of one authenticated session
+_MAX_DOWNLOAD_WORKERS = 8
+
+# Local files are parsed in worker processes only when there is enough text to
+# amortise the pool start-up (every worker re-imports NumPy)
+_PARALLEL_LOAD_MIN_BYTES = 8 * 1024 * 1024
+
+# Entries that are zero when the rigidity matrix has the normal/shear block form
+# [[A, 0], [0, diag(c44, c55, c66)]] produced by build_rigidity_matrix
+_BLOCK_ZERO_MASK = np.ones((6, 6), dtype=bool)
+_BLOCK_ZERO_MASK[:3, :3] = False
+_BLOCK_ZERO_MASK[3, 3] = _BLOCK_ZERO_MASK[4, 4] = _BLOCK_ZERO_MASK[5, 5] = False
+
+logger = logging.getLogger(__name__)
+
+
+def _column_array(column: pd.Series) -> np.ndarray:
+    """
+    C-contiguous float64 array for a DataFrame column (no copy when already laid out so)
+    
+    Raises:
+        ValueError: If the column cannot be converted to a contiguous float64 array
+    """
+    array = np.ascontiguousarray(column.to_numpy(dtype=np.float64, copy=False))
+    if array.ndim != 1 or not array.flags['C_CONTIGUOUS'] or array.dtype != np.float64:
+        raise ValueError(f"Column {column.name!r} is not a contiguous 1-D float64 array")
+    return array
+
+
+def _check_fit_input(strain: np.ndarray, source: str) -> None:
+    """
+    Make sure a slope through the origin can be fitted to a strain column
+    
+    Raises:
+        ValueError: If the column is empty or all zeros (x·x == 0)
+    """
+    if strain.size == 0:
+        raise ValueError(f"No data rows in {source}")
+    if float(strain @ strain) == 0.0:
+        raise ValueError(f"Strain column of {source} is all zeros; the elastic constant is undefined")
+
+
+def _parse_arrays(source: Union[str, IO[bytes]], file_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the strain and stress columns into two contiguous float64 arrays
+    
+    NumPy's C tokenizer reading just the two columns outpaces
+    pandas.read_csv on these small numeric tables, and local and remote
+    files parse to identical values.
+    
+    Args:
+        source: Local file path or binary file-like object
+        file_name: File name used for format detection
+        
+    Returns:
+        Tuple of (strain, stress) arrays
+    """
+    delimiter = CSV_DELIMITER if determine_file_format(file_name) == 'csv' else None
+    strain, stress = np.loadtxt(source, comments=COMMENT_CHAR, delimiter=delimiter,
+                                usecols=(0, 1), dtype=np.float64, ndmin=2, unpack=True)
+    return np.ascontiguousarray(strain), np.ascontiguousarray(stress)
+
+
+def _read_local_arrays(file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a local file's strain and stress columns into two contiguous float64 arrays"""
+    return _parse_arrays(file_path, file_path)
+
+
+def _load_local_one(file_path: str) -> Tuple[Optional[Tuple[np.ndarray, np.ndarray]], Optional[Exception]]:
+    """Process-pool worker: load one local file, returning the error instead of raising"""
+    try:
+        return _read_local_arrays(file_path), None
+    except Exception as e:
+        return None, e
+
+
+def _local_load_size(file_paths: List[str]) -> int:
+    """Total bytes of a set of local files (0 if any is remote or cannot be stat'ed)"""
+    try:
+        return sum(os.stat(path).st_size for path in file_paths if not is_remote_path(path))
+    except OSError:
+        return 0
+
+
+def _invert_3x3(a: np.ndarray) -> np.ndarray:
+    """
+    Invert a 3x3 matrix by closed-form cofactor expansion
+    
+    Args:
+        a: 3x3 matrix
+        
+    Returns:
+        3x3 inverse
+        
+    Raises:
+        ValueError: If the matrix is singular
+    """
+    a00, a01, a02 = a[0, 0], a[0, 1], a[0, 2]
+    a10, a11, a12 = a[1, 0], a[1, 1], a[1, 2]
+    a20, a21, a22 = a[2, 0], a[2, 1], a[2, 2]
+    
+    # Cofactors of the first row give the determinant
+    c00 = a11 * a22 - a12 * a21
+    c01 = a12 * a20 - a10 * a22
+    c02 = a10 * a21 - a11 * a20
+    det = a00 * c00 + a01 * c01 + a02 * c02
+    if det == 0:
+        raise ValueError("Rigidity matrix is singular and cannot be inverted")
+    
+    inv_det = 1.0 / det
+    inverse = np.empty((3, 3), dtype=np.float64)
+    inverse[0, 0] = c00 * inv_det
+    inverse[1, 0] = c01 * inv_det
+    inverse[2, 0] = c02 * inv_det
+    inverse[0, 1] = (a02 * a21 - a01 * a22) * inv_det
+    inverse[1, 1] = (a00 * a22 - a02 * a20) * inv_det
+    inverse[2, 1] = (a01 * a20 - a00 * a21) * inv_det
+    inverse[0, 2] = (a01 * a12 - a02 * a11) * inv_det
+    inverse[1, 2] = (a02 * a10 - a00 * a12) * inv_det
+    inverse[2, 2] = (a00 * a11 - a01 * a10) * inv_det
+    return inverse
 
-from ..utils.sftp_utils import SFTPManager
-from ..utils.file_utils import read_data_file
-from ..config.constants import ELASTIC_CONSTANT_HEADERS
+
+def _fast_inv_6x6(rigidity_matrix: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Invert a block-structured rigidity matrix without a general 6x6 factorization
+    
+    The normal block is inverted in closed form and the shear diagonal by
+    reciprocals.
+    
+    Args:
+        rigidity_matrix: 6x6 rigidity matrix
+        
+    Returns:
+        6x6 compliance matrix, or None if the matrix lacks the block structure
+        
+    Raises:
+        ValueError: If the matrix is singular
+    """
+    if rigidity_matrix.shape != (6, 6) or rigidity_matrix[_BLOCK_ZERO_MASK].any():
+        return None
+    
+    shear = np.diagonal(rigidity_matrix)[3:]
+    if not shear.all():
+        raise ValueError("Rigidity matrix is singular and cannot be inverted")
+    
+    compliance = np.zeros((6, 6), dtype=np.float64)
+    compliance[:3, :3] = _invert_3x3(rigidity_matrix[:3, :3])
+    compliance[3, 3] = 1.0 / shear[0]
+    compliance[4, 4] = 1.0 / shear[1]
+    compliance[5, 5] = 1.0 / shear[2]
+    return compliance
+
+
+def _rigidity_from_constants(elastic_constants: Mapping[str, float]) -> np.ndarray:
+    """
+    Build the 6x6 rigidity matrix from elastic constants
+    
+    Args:
+        elastic_constants: Mapping of elastic constant identifiers to values
+        
+    Returns:
+        6x6 rigidity matrix
+    """
+    # Extract constants
+    c11 = elastic_constants.get('c1144', 0.0)  # Note: this maps to C11 based on file naming
+    c22 = elastic_constants.get('c2255', 0.0)  # C22
+    c33 = elastic_constants.get('c3366', 0.0)  # C33
+    c12 = elastic_constants.get('c1255', 0.0)  # C12
+    c13 = elastic_constants.get('c1366', 0.0)  # C13
+    c23 = elastic_constants.get('c2366', 0.0)  # C23
+    
+    # For cubic crystals, we need to determine C44
+    # Assuming isotropic material: C44 = (C11 - C12) / 2
+    c44 = 0.5 * (c11 - c12) if c11 > c12 else elastic_constants.get('c4455', 0.0)
+    
+    # Build symmetric rigidity matrix in place (only the unique entries are written)
+    rigidity = np.zeros((6, 6), dtype=np.float64)
+    rigidity[0, 0] = c11
+    rigidity[1, 1] = c22
+    rigidity[2, 2] = c33
+    rigidity[0, 1] = rigidity[1, 0] = c12
+    rigidity[0, 2] = rigidity[2, 0] = c13
+    rigidity[1, 2] = rigidity[2, 1] = c23
+    rigidity[3, 3] = rigidity[4, 4] = rigidity[5, 5] = c44
+    return rigidity
+
+
+def _analyze_fused(elastic_constants: Mapping[str, float]) -> Dict:
+    """
+    Rigidity matrix, compliance matrix and compliance parameters in one pass
+    
+    Args:
+        elastic_constants: Mapping of elastic constant identifiers to values
+        
+    Returns:
+        Dictionary with elastic constants, rigidity matrix, compliance matrix, and parameters
+        
+    Raises:
+        ValueError: If the rigidity matrix is singular
+    """
+    rigidity = _rigidity_from_constants(elastic_constants)
+    # _rigidity_from_constants always yields the normal/shear block form
+    compliance = _fast_inv_6x6(rigidity)
+    
+    return {
+        'elastic_constants': dict(elastic_constants),
+        'rigidity_matrix': rigidity,
+        'compliance_matrix': compliance,
+        'compliance_parameters': {
+            'S11': compliance[0, 0],
+            'S12': compliance[0, 1],
+            'S44': compliance[3, 3]
+        }
+    }
 
 
 class ElasticConstantsProcessor:
@@ -28,98 +267,255 @@ class ElasticConstantsProcessor:
         Args:
             sftp_config: SFTP configuration dictionary
         """
-        self.sftp_manager = SFTPManager() if sftp_config else None
+        self.sftp_manager = SFTPManager.from_config(sftp_config) if sftp_config else None
         self.rigidity_matrix = None
         self.compliance_matrix = None
+        self._rigidity_factor = None
         
-    def load_stress_strain_data(self, file_path: str, remote: bool = False) -> pd.DataFrame:
+    def load_stress_strain_data(self, file_path: str, remote: bool = False,
+                                sftp_channel: Optional[paramiko.SFTPClient] = None) -> pd.DataFrame:
         """
         Load stress-strain data from file
         
         Args:
             file_path: Path to the stress-strain data file
             remote: Whether to load from remote server
+            sftp_channel: Channel on the open session to read through (one per thread)
             
         Returns:
             DataFrame with stress-strain data
         """
         if remote and self.sftp_manager:
-            # Download and process remote file
-            username, hostname, remote_path = self.sftp_manager.parse_sftp_url(file_path)
-            if self.sftp_manager.authenticate(hostname, username):
-                with tempfile.NamedTemporaryFile(mode='w+b', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                self.sftp_manager.download_file(remote_path, temp_path)
-                data = read_data_file(temp_path, ELASTIC_CONSTANT_HEADERS)
-                os.unlink(temp_path)  # Clean up temp file
-                self.sftp_manager.close()
-                return data
-            else:
-                raise Exception("Failed to authenticate to remote server")
+            content, remote_path = self._read_remote_bytes(file_path, sftp_channel)
+            return read_data_bytes(content, ELASTIC_CONSTANT_HEADERS, remote_path,
+                                   **_STRESS_STRAIN_READ_PARAMS)
         else:
-            return read_data_file(file_path, ELASTIC_CONSTANT_HEADERS)
+            return read_data_file(file_path, ELASTIC_CONSTANT_HEADERS, **_STRESS_STRAIN_READ_PARAMS)
+    
+    def _read_remote_bytes(self, file_path: str,
+                           sftp_channel: Optional[paramiko.SFTPClient] = None) -> Tuple[bytes, str]:
+        """
+        Read a remote file into memory, through the batch session when one is open
+        
+        Args:
+            file_path: SFTP URL of the file
+            sftp_channel: Channel on the open session to read through
+            
+        Returns:
+            Tuple of (file content, remote path)
+        """
+        username, hostname, remote_path = self.sftp_manager.parse_sftp_url(file_path)
+        
+        # Parse the streamed bytes directly instead of round-tripping a temp file
+        if self.sftp_manager.is_connected():
+            # Reuse the session opened for the current batch
+            return self.sftp_manager.read_bytes(remote_path, sftp_channel), remote_path
+        if self.sftp_manager.authenticate(hostname, username):
+            try:
+                return self.sftp_manager.read_bytes(remote_path), remote_path
+            finally:
+                self.sftp_manager.close()
+        raise Exception("Failed to authenticate to remote server")
     
-    def calculate_elastic_constant(self, stress_strain_data: pd.DataFrame, 
-                                 stress_col: str, strain_col: str) -> float:
+    def _load_stress_strain_arrays(self, file_path: str, remote: bool = False,
+                                   sftp_channel: Optional[paramiko.SFTPClient] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load the strain and stress columns as two contiguous float64 arrays
+        
+        Args:
+            file_path: Path to the stress-strain data file
+            remote: Whether to load from remote server
+            sftp_channel: Channel on the open session to read through
+            
+        Returns:
+            Tuple of (strain, stress) arrays
+        """
+        if remote and self.sftp_manager:
+            content, remote_path = self._read_remote_bytes(file_path, sftp_channel)
+            arrays = _parse_arrays(io.BytesIO(content), remote_path)
+            print(f"✅ Successfully read {len(arrays[0])} rows from {os.path.basename(remote_path)}")
+            return arrays
+        
+        if remote or is_remote_path(file_path):
+            data = self.load_stress_strain_data(file_path, remote, sftp_channel)
+            return _column_array(data.iloc[:, 0]), _column_array(data.iloc[:, 1])
+        
+        return _read_local_arrays(file_path)
+    
+    def _load_one(self, file_path: str, remote: bool = False,
+                  sftp_channel: Optional[Callable[[], paramiko.SFTPClient]] = None
+                  ) -> Tuple[Optional[Tuple[np.ndarray, np.ndarray]], Optional[Exception]]:
+        """Load one file's (strain, stress) arrays, returning the error instead of raising"""
+        try:
+            channel = sftp_channel() if sftp_channel is not None else None
+            return self._load_stress_strain_arrays(file_path, remote, channel), None
+        except Exception as e:
+            return None, e
+    
+    def _load_remote_concurrently(self, file_paths: List[str]) -> List[Tuple[Optional[Tuple[np.ndarray, np.ndarray]],
+                                                                           Optional[Exception]]]:
+        """
+        Load remote files on worker threads, each reading through one channel it reuses
+        
+        Remote reads are latency-bound, so the round trips overlap; a worker
+        opens its channel on first use instead of one channel per file, and
+        the file sizes come from one directory listing instead of a stat each.
+        
+        Args:
+            file_paths: Remote file paths, all on the authenticated session
+            
+        Returns:
+            (arrays, error) per file, in input order
+        """
+        remote_paths = []
+        for path in file_paths:
+            try:
+                remote_paths.append(self.sftp_manager.parse_sftp_url(path)[2])
+            except ValueError:
+                continue  # reported when the file itself is loaded
+        self.sftp_manager.stat_many(remote_paths)
+        
+        worker_state = threading.local()
+        channels: List[paramiko.SFTPClient] = []
+        channels_lock = threading.Lock()
+        
+        def worker_channel() -> paramiko.SFTPClient:
+            channel = getattr(worker_state, 'channel', None)
+            if channel is None:
+                channel = self.sftp_manager.open_sftp_channel()
+                worker_state.channel = channel
+                with channels_lock:
+                    channels.append(channel)
+            return channel
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOAD_WORKERS, len(file_paths))) as executor:
+                return list(executor.map(
+                    lambda path: self._load_one(path, True, worker_channel), file_paths
+                ))
+        finally:
+            for channel in channels:
+                channel.close()
+    
+    def calculate_elastic_constant(self, stress_strain_data: pd.DataFrame | Tuple[np.ndarray, np.ndarray], 
+                                 stress_col: Optional[str] = None, 
+                                 strain_col: Optional[str] = None) -> float:
         """
         Calculate elastic constant from stress-strain data using linear regression
         
         Args:
-            stress_strain_data: DataFrame with stress and strain data
-            stress_col: Name of stress column
-            strain_col: Name of strain column
+            stress_strain_data: DataFrame with stress and strain data, or a
+                (strain, stress) tuple of arrays as returned by the array loader
+            stress_col: Name of stress column (DataFrame input only)
+            strain_col: Name of strain column (DataFrame input only)
             
         Returns:
             Elastic constant value (slope of stress-strain curve)
+            
+        Raises:
+            ValueError: If the strain column is empty or all zeros
         """
-        if stress_col not in stress_strain_data.columns or strain_col not in stress_strain_data.columns:
-            raise ValueError(f"Required columns {stress_col}, {strain_col} not found in data")
+        if isinstance(stress_strain_data, tuple):
+            strain, stress = stress_strain_data
+            _check_fit_input(strain, 'stress-strain data')
+            return float(slope_through_origin(strain, stress))
         
-        # Prepare data for linear regression
-        strain = np.array(stress_strain_data[strain_col].values).reshape(-1, 1)
-        stress = np.array(stress_strain_data[stress_col].values)
+        if __debug__:
+            columns = stress_strain_data.columns
+            if stress_col not in columns or strain_col not in columns:
+                raise ValueError(f"Required columns {stress_col}, {strain_col} not found in data")
         
-        # Fit linear regression (force intercept through origin for elastic constants)
-        model = LinearRegression(fit_intercept=False)
-        model.fit(strain, stress)
+        strain = _column_array(stress_strain_data[strain_col])
+        stress = _column_array(stress_strain_data[stress_col])
+        _check_fit_input(strain, f"column {strain_col!r}")
         
-        return model.coef_[0]
+        return float(slope_through_origin(strain, stress))
     
     def process_elastic_constants_from_files(self, file_paths: List[str], 
-                                           remote: bool = False) -> Dict[str, float]:
+                                           remote: bool = False,
+                                           n_jobs: int = 1) -> Dict[str, float]:
         """
         Process multiple elastic constant files and extract constants
         
         Args:
             file_paths: List of file paths for elastic constant data
             remote: Whether files are on remote server
+            n_jobs: Worker processes for parsing local files (used only when
+                the files are large enough to amortise the pool start-up)
             
         Returns:
             Dictionary mapping file identifiers to elastic constants
+            
+        Raises:
+            ValueError: If files failed to load and a rigidity-matrix constant is missing
         """
-        elastic_constants = {}
+        identifiers = []
+        strains = []
+        stresses = []
+        failed = []
+        
+        # Authenticate once for the whole batch rather than once per file
+        owns_session = False
+        if remote and self.sftp_manager and file_paths and not self.sftp_manager.is_connected():
+            username, hostname, _ = self.sftp_manager.parse_sftp_url(file_paths[0])
+            if not self.sftp_manager.authenticate(hostname, username):
+                raise Exception("Failed to authenticate to remote server")
+            owns_session = True
+        
+        try:
+            # Load strain (first column) and stress (second column) from each file
+            if remote and self.sftp_manager and len(file_paths) > 1:
+                loaded = self._load_remote_concurrently(file_paths)
+            elif (not remote and n_jobs > 1 and len(file_paths) > 1
+                  and _local_load_size(file_paths) >= _PARALLEL_LOAD_MIN_BYTES):
+                # Text parsing holds the GIL, so large local files go to processes
+                with ProcessPoolExecutor(max_workers=min(n_jobs, len(file_paths))) as executor:
+                    loaded = list(executor.map(_load_local_one, file_paths, chunksize=1))
+            else:
+                loaded = [self._load_one(path, remote) for path in file_paths]
+        finally:
+            if owns_session:
+                self.sftp_manager.close()
         
-        for file_path in file_paths:
+        for file_path, (arrays, error) in zip(file_paths, loaded):
+            if error is None:
+                try:
+                    _check_fit_input(arrays[0], file_path)
+                except ValueError as e:
+                    error = e
+            if error is not None:
+                # Failed files stay out of the slope kernels and are reported below
+                logger.error("Error processing %s: %s", file_path, error)
+                failed.append(file_path)
+                continue
+            
             # Extract identifier from filename (e.g., 'c1144' from 'c1144.txt')
             file_name = os.path.basename(file_path)
-            identifier = os.path.splitext(file_name)[0]
+            identifiers.append(ELASTIC_FILE_IDENTIFIERS.get(file_name) or os.path.splitext(file_name)[0])
+            strains.append(arrays[0])
+            stresses.append(arrays[1])
+        
+        elastic_constants = {}
+        if identifiers:
+            # Compute all slopes through the origin in one pass when the files line up
+            if len({len(strain) for strain in strains}) == 1:
+                strain_block = np.vstack(strains)
+                stress_block = np.vstack(stresses)
+                slopes = batch_slopes_through_origin(strain_block, stress_block)
+            else:
+                slopes = [slope_through_origin(strain, stress)
+                          for strain, stress in zip(strains, stresses)]
             
-            try:
-                # Load data
-                data = self.load_stress_strain_data(file_path, remote)
-                
-                # Calculate elastic constant (assuming standard stress-strain columns)
-                if len(data.columns) >= 2:
-                    strain_col = data.columns[0]  # First column is strain
-                    stress_col = data.columns[1]  # Second column is stress
-                    
-                    constant = self.calculate_elastic_constant(data, stress_col, strain_col)
-                    elastic_constants[identifier] = constant
-                    
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
-                continue
-                
+            elastic_constants = {identifier: float(slope) for identifier, slope in zip(identifiers, slopes)}
+        
+        if failed:
+            missing = [key for key in _RIGIDITY_CONSTANTS if key not in elastic_constants]
+            if missing:
+                raise ValueError(
+                    f"Failed to process {len(failed)} elastic constant file(s) "
+                    f"({', '.join(failed)}); missing constants: {', '.join(missing)}"
+                )
+        
         return elastic_constants
     
     def build_rigidity_matrix(self, elastic_constants: Dict[str, float]) -> np.ndarray:
@@ -132,28 +528,7 @@ class ElasticConstantsProcessor:
         Returns:
             6x6 rigidity matrix
         """
-        # Extract constants
-        c11 = elastic_constants.get('c1144', 0)  # Note: this maps to C11 based on file naming
-        c22 = elastic_constants.get('c2255', 0)  # C22
-        c33 = elastic_constants.get('c3366', 0)  # C33
-        c12 = elastic_constants.get('c1255', 0)  # C12
-        c13 = elastic_constants.get('c1366', 0)  # C13
-        c23 = elastic_constants.get('c2366', 0)  # C23
-        
-        # For cubic crystals, we need to determine C44
-        # Assuming isotropic material: C44 = (C11 - C12) / 2
-        c44 = (c11 - c12) / 2 if c11 > c12 else elastic_constants.get('c4455', 0)
-        
-        # Build symmetric rigidity matrix
-        rigidity = np.array([
-            [c11, c12, c13,   0,   0,   0],
-            [c12, c22, c23,   0,   0,   0],
-            [c13, c23, c33,   0,   0,   0],
-            [  0,   0,   0, c44,   0,   0],
-            [  0,   0,   0,   0, c44,   0],
-            [  0,   0,   0,   0,   0, c44]
-        ])
-        
+        rigidity = _rigidity_from_constants(elastic_constants)
         self.rigidity_matrix = rigidity
         return rigidity
     
@@ -166,6 +541,9 @@ class ElasticConstantsProcessor:
             
         Returns:
             6x6 compliance matrix
+            
+        Raises:
+            ValueError: If the matrix is singular
         """
         if rigidity_matrix is None:
             rigidity_matrix = self.rigidity_matrix
@@ -173,12 +551,58 @@ class ElasticConstantsProcessor:
         if rigidity_matrix is None:
             raise ValueError("No rigidity matrix available. Build rigidity matrix first.")
         
-        try:
-            compliance = np.linalg.inv(rigidity_matrix)
+        # Normal/shear block form (as built by build_rigidity_matrix) needs no LAPACK call
+        compliance = _fast_inv_6x6(rigidity_matrix)
+        if compliance is not None:
+            self._rigidity_factor = None
             self.compliance_matrix = compliance
             return compliance
-        except np.linalg.LinAlgError:
-            raise ValueError("Rigidity matrix is singular and cannot be inverted")
+        
+        from scipy.linalg import solve_triangular
+        
+        # Cholesky reads only the lower triangle, so it is only valid for symmetric matrices
+        lower = None
+        if np.allclose(rigidity_matrix, rigidity_matrix.T):
+            try:
+                lower = np.linalg.cholesky(rigidity_matrix)
+            except np.linalg.LinAlgError:
+                lower = None
+        
+        if lower is not None:
+            # Physical stiffness is symmetric positive-definite: C^-1 = L^-T L^-1
+            lower_inv = solve_triangular(lower, np.eye(rigidity_matrix.shape[0]), 
+                                         lower=True, check_finite=False)
+            compliance = lower_inv.T @ lower_inv
+            self._rigidity_factor = (lower, True)
+        else:
+            # Not symmetric positive-definite, fall back to a general LU inverse
+            self._rigidity_factor = None
+            try:
+                compliance = np.linalg.inv(rigidity_matrix)
+            except np.linalg.LinAlgError:
+                raise ValueError("Rigidity matrix is singular and cannot be inverted")
+        
+        self.compliance_matrix = compliance
+        return compliance
+    
+    def solve_for_strain(self, stress: np.ndarray) -> np.ndarray:
+        """
+        Solve C·ε = σ for the strain without forming the compliance matrix product
+        
+        Args:
+            stress: Stress vector (6,) or stacked stress vectors (6, N) in Voigt notation
+            
+        Returns:
+            Strain with the same shape as the input
+        """
+        if self._rigidity_factor is not None:
+            from scipy.linalg import cho_solve
+            return cho_solve(self._rigidity_factor, stress, check_finite=False)
+        
+        if self.compliance_matrix is None:
+            raise ValueError("No compliance matrix available. Calculate compliance matrix first.")
+        
+        return self.compliance_matrix @ stress
     
     def get_compliance_parameters(self) -> Tuple[float, float, float]:
         """
@@ -197,39 +621,35 @@ class ElasticConstantsProcessor:
         return S11, S12, S44
     
     def process_complete_elastic_analysis(self, file_paths: List[str], 
-                                        remote: bool = False) -> Dict:
+                                        remote: bool = False,
+                                        persist: bool = True,
+                                        n_jobs: int = 1) -> Dict:
         """
         Complete elastic analysis pipeline
         
         Args:
             file_paths: List of elastic constant data files
             remote: Whether files are on remote server
+            persist: Store the rigidity and compliance matrices on the processor, as
+                get_compliance_parameters / solve_for_strain need afterwards (False to
+                leave the processor untouched)
+            n_jobs: Worker processes for parsing large local files
             
         Returns:
             Dictionary with elastic constants, rigidity matrix, compliance matrix, and parameters
         """
         # Calculate elastic constants
-        elastic_constants = self.process_elastic_constants_from_files(file_paths, remote)
-        
-        # Build rigidity matrix
-        rigidity = self.build_rigidity_matrix(elastic_constants)
-        
-        # Calculate compliance matrix
-        compliance = self.calculate_compliance_matrix(rigidity)
-        
-        # Get compliance parameters
-        S11, S12, S44 = self.get_compliance_parameters()
-        
-        return {
-            'elastic_constants': elastic_constants,
-            'rigidity_matrix': rigidity,
-            'compliance_matrix': compliance,
-            'compliance_parameters': {
-                'S11': S11,
-                'S12': S12,
-                'S44': S44
-            }
-        }
+        elastic_constants = self.process_elastic_constants_from_files(file_paths, remote, n_jobs)
+        
+        # Build, invert and extract parameters in one pass
+        results = _analyze_fused(elastic_constants)
+        
+        if persist:
+            self.rigidity_matrix = results['rigidity_matrix']
+            self.compliance_matrix = results['compliance_matrix']
+            self._rigidity_factor = None
+        
+        return results
     
     def close_connections(self):
         """Close SFTP connections"""
@@ -237,41 +657,105 @@ class ElasticConstantsProcessor:
             self.sftp_manager.close()
 
 
+# Local analysis results keyed by (directory, pattern, per-file stat signature)
+_ELASTIC_RESULTS_CACHE: Dict[tuple, Dict] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_file_pattern(pattern: str):
+    """Compile a glob-style file pattern to a regex matcher (once per pattern)"""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _find_local_files(directory_path: str, pattern: str) -> List[str]:
+    """
+    List files in a directory whose names match a glob-style pattern
+    
+    Args:
+        directory_path: Directory to scan
+        pattern: File name pattern (e.g. 'c*.txt')
+        
+    Returns:
+        Sorted list of matching file paths
+    """
+    matches = _compile_file_pattern(pattern)
+    try:
+        with os.scandir(directory_path) as entries:
+            return sorted(entry.path for entry in entries 
+                          if not entry.name.startswith('.') and matches(entry.name) 
+                          and entry.is_file())
+    except FileNotFoundError:
+        return []
+
+
+def _elastic_cache_key(directory_path: str, pattern: str, file_paths: List[str]) -> tuple:
+    """Build a cache key that changes whenever any input file is touched"""
+    signature = []
+    for path in sorted(file_paths):
+        stat = os.stat(path)
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return (directory_path, pattern, tuple(signature))
+
+
+def _copy_elastic_results(results: Dict) -> Dict:
+    """Fresh result dicts around the shared, read-only matrices"""
+    return {
+        'elastic_constants': dict(results['elastic_constants']),
+        'rigidity_matrix': results['rigidity_matrix'],
+        'compliance_matrix': results['compliance_matrix'],
+        'compliance_parameters': dict(results['compliance_parameters'])
+    }
+
+
 def load_elastic_constants_from_directory(directory_path: str, 
                                         pattern: str = "c*.txt",
                                         remote: bool = False,
                                         sftp_config: Optional[Dict] = None,
-                                        file_list: Optional[List[str]] = None) -> Dict:
+                                        file_list: Optional[List[str]] = None,
+                                        n_jobs: int = 1) -> Dict:
     """
     Load all elastic constant files from a directory
     
+    Local results are cached until one of the matched files changes
+    (mtime or size); remote directories are always reprocessed.
+    
     Args:
         directory_path: Path to directory containing elastic constant files
         pattern: File pattern to match
         remote: Whether directory is on remote server
         sftp_config: SFTP configuration if remote
+        n_jobs: Worker processes for parsing large local files
         
     Returns:
         Complete elastic analysis results
     """
-    processor = ElasticConstantsProcessor(sftp_config)
-    
-    try:
-        if remote:
-            # For remote files, use provided file list or default names
-            if file_list:
-                file_paths = [f"{directory_path}/{f}" if not f.startswith(directory_path) else f for f in file_list]
-            else:
-                # Default elastic constant files
-                default_files = ['c1144.txt', 'c2255.txt', 'c3366.txt', 'c1255.txt', 'c1366.txt', 'c2366.txt']
-                file_paths = [f"{directory_path}/{f}" for f in default_files]
+    cache_key = None
+    if remote:
+        # For remote files, use provided file list or default names
+        if file_list:
+            file_paths = [f"{directory_path}/{f}" if not f.startswith(directory_path) else f for f in file_list]
         else:
-            # List local files
-            import glob
-            pattern_path = os.path.join(directory_path, pattern)
-            file_paths = glob.glob(pattern_path)
+            # Default elastic constant files
+            file_paths = [f"{directory_path}/{f}" for f in DEFAULT_ELASTIC_FILES]
+    else:
+        # List local files
+        file_paths = _find_local_files(directory_path, pattern)
         
-        return processor.process_complete_elastic_analysis(file_paths, remote)
+        cache_key = _elastic_cache_key(directory_path, pattern, file_paths)
+        if cache_key in _ELASTIC_RESULTS_CACHE:
+            return _copy_elastic_results(_ELASTIC_RESULTS_CACHE[cache_key])
     
+    processor = ElasticConstantsProcessor(sftp_config)
+    
+    try:
+        results = processor.process_complete_elastic_analysis(file_paths, remote, n_jobs=n_jobs)
     finally:
         processor.close_connections()
+    
+    if cache_key is not None:
+        results['rigidity_matrix'].setflags(write=False)
+        results['compliance_matrix'].setflags(write=False)
+        _ELASTIC_RESULTS_CACHE[cache_key] = results
+        return _copy_elastic_results(results)
+    
+    return results
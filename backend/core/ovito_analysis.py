@@ -4,15 +4,29 @@ OVITO Analysis Core Module - Simplified Version
 Provides core functionality for OVITO-based analysis including DXA and WS
 """
 
+import csv
 import os
 import sys
 import tempfile
 import glob
 import fnmatch
-from typing import List, Dict, Optional, Union, Tuple, Any
+import functools
+import hashlib
+import multiprocessing
+import operator
+import pickle
+import posixpath
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from tqdm import tqdm
+import numpy as np
 import pandas as pd
 
+from ._kernels import ws_site_counts
+from ..utils.sftp_utils import download_file_sftp, list_remote_files, fetch_remote_files
+
 # Handle OVITO imports safely
 OVITO_AVAILABLE = False
 try:
@@ -32,29 +46,330 @@ except ImportError:
     OVITO_AVAILABLE = False
     print("⚠️  OVITO not available. Install with: pip install ovito")
 
-# SFTP placeholder functions - will be replaced with real ones when SFTP is working
-def download_file_sftp(remote_file, local_file, sftp_config):
-    """Placeholder for SFTP download"""
-    print(f"⚠️  SFTP download not available: {remote_file} -> {local_file}")
-    return False
+# Capabilities of the installed OVITO, resolved once instead of on every frame
+_HAS_IMPORT_FILE = 'import_file' in globals()
+_HAS_DXA = 'DislocationAnalysisModifier' in globals()
+_HAS_PTM = 'PolyhedralTemplateMatchingModifier' in globals()
+_HAS_WS = 'WignerSeitzAnalysisModifier' in globals()
+_HAS_LATTICE = _HAS_DXA and hasattr(DislocationAnalysisModifier, 'Lattice')
+
+# Segment length accessor bound once for the per-segment loop
+_segment_length = operator.attrgetter('length')
+
+
+def _segment_burgers(segment) -> Optional[List[float]]:
+    """Burgers vector of a dislocation segment as a list (None if unavailable)"""
+    try:
+        return list(segment.true_burgers_vector)
+    except (AttributeError, TypeError):
+        return None
+
+
+def _requested_frames(frames: Optional[Sequence[int]], count: int, in_range: bool) -> List[int]:
+    """
+    Frame numbers to analyze, as plain ints for the task tuples and cache keys
+    
+    Args:
+        frames: Requested frame numbers (list or integer array), None for all
+        count: Number of frames (or frame files) available
+        in_range: Keep the requested frames below count; otherwise keep the first count entries
+        
+    Returns:
+        Frame numbers
+    """
+    if frames is None:
+        return list(range(count))
+    frames = np.asarray(frames, dtype=np.int64)
+    return (frames[frames < count] if in_range else frames[:count]).tolist()
+
+
+def _default_nproc() -> int:
+    """Half the cores: OVITO already runs its own worker threads inside each process"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _cuda_devices() -> List[str]:
+    """
+    CUDA devices pool workers are spread over, as CUDA_VISIBLE_DEVICES entries
+    
+    Uses the user's CUDA_VISIBLE_DEVICES (captured before any GPU setup in this
+    process narrowed it), else one entry per GPU listed by the NVIDIA driver.
+    
+    Returns:
+        Device identifiers (at least one)
+    """
+    if _USER_CUDA_DEVICES:
+        return [device.strip() for device in _USER_CUDA_DEVICES.split(',') if device.strip()] or ['0']
+    try:
+        count = len(os.listdir('/proc/driver/nvidia/gpus'))
+    except OSError:
+        count = 0
+    return [str(index) for index in range(max(count, 1))]
+
+
+def _iter_frames(frame_fn: Callable, worker: Callable, tasks: List[Tuple[str, str, int]],
+                 gpu_enabled: bool, worker_args: tuple, nproc: Optional[int],
+                 desc: str) -> Iterator[Dict[str, Any]]:
+    """
+    Run a per-frame analysis over (input_file, reference_file, frame) tasks
+    
+    Frames are independent, so with more than one worker they are dispatched
+    to a process pool; results are yielded in task order as they complete.
+    
+    Args:
+        frame_fn: Bound analyzer method used when running in-process
+        worker: Module-level (picklable) equivalent of frame_fn for pool workers
+        tasks: List of (input_file, reference_file, frame) tuples
+        gpu_enabled: Whether pool workers configure GPU acceleration (once, at startup,
+            round-robin over the available CUDA devices)
+        worker_args: Extra arguments passed to every worker call after gpu_enabled
+        nproc: Number of worker processes (None for half the available cores)
+        desc: Progress bar description
+        
+    Yields:
+        Per-frame result dictionaries
+    """
+    if nproc is None:
+        nproc = _default_nproc()
+    
+    if nproc <= 1 or len(tasks) <= 1:
+        for task in tqdm(tasks, desc=desc):
+            yield frame_fn(*task)
+        return
+    
+    # spawn: forking a process that already runs OVITO's thread pool is unsafe
+    context = multiprocessing.get_context('spawn')
+    # Workers take consecutive slots so each GPU gets its share of them
+    gpu_slots = (context.Value('i', 0), _cuda_devices()) if gpu_enabled else None
+    executor = ProcessPoolExecutor(max_workers=min(nproc, len(tasks)), mp_context=context,
+                                   initializer=_worker_init, initargs=(gpu_enabled, gpu_slots))
+    futures = [executor.submit(worker, *task, gpu_enabled, *worker_args) for task in tasks]
+    try:
+        yield from tqdm((future.result() for future in futures), total=len(tasks), desc=desc)
+    finally:
+        # Do not keep computing frames nobody will consume (cancel_futures needs Python 3.9)
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _natural_key(name: str) -> list:
+    """Sort key treating digit runs as numbers, so frame.9 sorts before frame.10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_name_pattern(name_pattern: str):
+    """Compile a glob-style file name pattern to a regex matcher (once per pattern)"""
+    return re.compile(fnmatch.translate(name_pattern)).match
+
+
+def _list_frame_files(pattern: str) -> List[str]:
+    """
+    List the files matching a frame pattern in natural order
+    
+    Shared by the dislocation and vacancy analyzers. The directory is scanned
+    once and the file name pattern is compiled to a regex once per process;
+    patterns with wildcards in the directory part go through glob.
+    
+    Args:
+        pattern: File pattern (e.g. 'dumps/frame.*.dump')
+        
+    Returns:
+        Matching file paths, naturally sorted
+    """
+    base_dir, name_pattern = os.path.split(pattern)
+    if glob.has_magic(base_dir):
+        return sorted(glob.glob(pattern), key=_natural_key)
+    
+    matches = _compile_name_pattern(name_pattern)
+    # Like glob, hidden files only match patterns that start with a dot
+    include_hidden = name_pattern.startswith('.')
+    try:
+        with os.scandir(base_dir or '.') as entries:
+            names = [entry.name for entry in entries
+                     if (include_hidden or not entry.name.startswith('.'))
+                     and matches(entry.name) and entry.is_file()]
+    except OSError:
+        return []
+    
+    return [os.path.join(base_dir, name) for name in sorted(names, key=_natural_key)]
+
+
+# In-memory frame results, least recently used evicted first
+_FRAME_CACHE_SIZE = 1024
+_FRAME_RESULTS_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# Layout version of cached results (bumped when a result field changes shape)
+_FRAME_CACHE_FORMAT = 2
+
+
+def _file_signature(path: str) -> tuple:
+    """Identity of a file on disk: resolved path, modification time and size"""
+    stat = os.stat(path)
+    return (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _frame_cache_key(input_file: str, frame: int, modifier_config: tuple) -> tuple:
+    """Cache key that changes whenever the input file is touched or the modifiers change"""
+    return _file_signature(input_file) + (frame, modifier_config, _FRAME_CACHE_FORMAT)
+
+
+def _frame_cache_path(key: tuple, cache_dir: str) -> str:
+    """On-disk location of a cached frame result"""
+    return os.path.join(cache_dir, hashlib.sha1(repr(key).encode()).hexdigest() + '.pkl')
+
+
+def _cache_lookup(key: tuple, cache_dir: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Cached result for a frame (memory first, then disk), or None"""
+    result = _FRAME_RESULTS_CACHE.get(key)
+    if result is not None:
+        _FRAME_RESULTS_CACHE.move_to_end(key)
+        return dict(result)
+    
+    if cache_dir:
+        try:
+            with open(_frame_cache_path(key, cache_dir), 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        _cache_store(key, result, None)
+        return dict(result)
+    
+    return None
+
+
+def _cache_store(key: tuple, result: Dict[str, Any], cache_dir: Optional[str]) -> None:
+    """Remember a successful frame result in memory and, if configured, on disk"""
+    _FRAME_RESULTS_CACHE[key] = dict(result)
+    _FRAME_RESULTS_CACHE.move_to_end(key)
+    if len(_FRAME_RESULTS_CACHE) > _FRAME_CACHE_SIZE:
+        _FRAME_RESULTS_CACHE.popitem(last=False)
+    
+    if cache_dir:
+        # Best effort: a full or read-only cache directory must not fail the frame
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            path = _frame_cache_path(key, cache_dir)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Could not write frame cache in {cache_dir}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def _analyze_cached(analyzer, input_file: str, frame: int, get_pipeline: Callable,
+                    reference_file: Optional[str] = None, **options) -> Dict[str, Any]:
+    """
+    Analyze one frame, reusing a cached result when the file and modifiers are unchanged
+    
+    Args:
+        analyzer: DislocationAnalysis or WignerSeitzAnalysis instance
+        input_file: Simulation file the frame belongs to
+        frame: Frame number
+        get_pipeline: Callable returning the pipeline (only invoked on a cache miss)
+        reference_file: Reference configuration the pipeline compares against, if any
+        **options: Extraction options passed to the analyzer (part of the cache key)
+        
+    Returns:
+        Result dictionary (failed frames are never cached)
+    """
+    try:
+        modifier_config = analyzer.MODIFIER_CONFIG + tuple(sorted(options.items()))
+        if reference_file:
+            modifier_config += (('reference', _file_signature(reference_file)),)
+        key = _frame_cache_key(input_file, frame, modifier_config)
+    except OSError:
+        key = None
+    
+    if key is not None:
+        cached = _cache_lookup(key, analyzer.cache_dir)
+        if cached is not None:
+            return cached
+    
+    try:
+        pipeline = get_pipeline()
+    except Exception as e:
+        print(f"❌ Error analyzing frame {frame}: {e}")
+        return analyzer._error_result(frame, str(e))
+    
+    result = analyzer._analyze_pipeline_frame(pipeline, frame, **options)
+    if key is not None and 'error' not in result:
+        _cache_store(key, result, analyzer.cache_dir)
+    return result
+
+
+def _iter_remote(analyze: Callable[[str], Iterator[Dict[str, Any]]], input_pattern: str,
+                 sftp_config: Optional[Dict],
+                 frames: Optional[Sequence[int]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Download remote inputs into a scratch directory and analyze them locally
+    
+    For a file pattern with explicit frames only the leading files the local
+    analysis will read (one per requested frame, in natural order) are fetched.
+    
+    Args:
+        analyze: Local analysis generator taking the downloaded file (or pattern) path
+        input_pattern: Remote file or file pattern
+        sftp_config: SFTP configuration with hostname and username
+        frames: Requested frame numbers (None for all)
+        
+    Yields:
+        Analysis results, with source_file pointing back at the remote paths
+    """
+    if not sftp_config:
+        print("❌ SFTP configuration required for remote analysis")
+        return
+    
+    remote_dir = posixpath.dirname(input_pattern)
+    with tempfile.TemporaryDirectory(prefix='ovito_frames_') as local_dir:
+        limit = len(frames) if frames is not None and glob.has_magic(input_pattern) else None
+        local_files = fetch_remote_files(input_pattern, local_dir, sftp_config, limit=limit,
+                                         sort_key=lambda path: _natural_key(posixpath.basename(path)))
+        if not local_files:
+            return
+        
+        if len(local_files) == 1 and not glob.has_magic(input_pattern):
+            local_pattern = local_files[0]
+        else:
+            local_pattern = os.path.join(local_dir, '*')
+        
+        for result in analyze(local_pattern):
+            if result.get('source_file'):
+                result['source_file'] = posixpath.join(remote_dir, os.path.basename(result['source_file']))
+            yield result
+
+
+# Outcome of the first OvitoGPUConfig.setup_gpu() call in this process (None until then)
+_GPU_SETUP_RESULT: Optional[bool] = None
 
-def list_remote_files(pattern, sftp_config):
-    """Placeholder for SFTP file listing"""
-    print(f"⚠️  SFTP file listing not available: {pattern}")
-    return []
+# CUDA_VISIBLE_DEVICES as given by the user, before setup_gpu() overrides it
+_USER_CUDA_DEVICES = os.environ.get('CUDA_VISIBLE_DEVICES')
 
 
 class OvitoGPUConfig:
     """GPU configuration for OVITO analysis"""
     
     @staticmethod
-    def setup_gpu(gpu_id: int = 0, buffer_size: int = 4096) -> bool:
-        """Configure GPU acceleration for OVITO"""
+    def setup_gpu(gpu_id: Union[int, str] = 0, buffer_size: int = 4096) -> bool:
+        """Configure GPU acceleration for OVITO (once per process; later calls return the cached result)"""
+        global _GPU_SETUP_RESULT
+        if _GPU_SETUP_RESULT is not None:
+            return _GPU_SETUP_RESULT
+        
         os.environ['CUDA_VISIBLE_DEVICES'] = str(gpu_id)
         os.environ['OVITO_GPU_ACCELERATION'] = '1'
         os.environ['OVITO_DEFAULT_DEVICE'] = 'cuda'
         os.environ['OVITO_GPU_BUFFER_SIZE'] = str(buffer_size)
-        return OvitoGPUConfig.check_gpu_status()
+        _GPU_SETUP_RESULT = OvitoGPUConfig.check_gpu_status()
+        return _GPU_SETUP_RESULT
     
     @staticmethod
     def check_gpu_status() -> bool:
@@ -77,426 +392,626 @@ class OvitoGPUConfig:
 class DislocationAnalysis:
     """Dislocation analysis using OVITO DXA"""
     
-    def __init__(self, gpu_enabled: bool = True):
+    # Modifier settings that affect results (part of the frame cache key)
+    MODIFIER_CONFIG = ('dxa', 'FCC')
+    
+    def __init__(self, gpu_enabled: bool = True, cache_dir: Optional[str] = None):
         """Initialize dislocation analysis"""
         if not OVITO_AVAILABLE:
             raise ImportError("OVITO is required for dislocation analysis")
         
         self.gpu_enabled = gpu_enabled
+        self.cache_dir = cache_dir  # optional on-disk frame result cache
         if gpu_enabled:
             OvitoGPUConfig.setup_gpu()
     
-    def analyze_dislocation_frame(self, input_file: str, reference_file: str, 
-                                frame: int = 0) -> Dict[str, Any]:
-        """Analyze dislocation in a single frame"""
-        if not OVITO_AVAILABLE:
-            return {
-                'frame': frame,
-                'error': 'OVITO not available',
-                'total_length': 0.0,
-                'segment_count': 0,
-                'dislocation_density': 0.0,
-                'volume': 0.0,
-                'segments': []
-            }
+    def _build_pipeline(self, input_file: str, reference_file: Optional[str] = None):
+        """Import a simulation file and attach the DXA modifier (the reference is not used by DXA)"""
+        # Use safe imports
+        if _HAS_IMPORT_FILE:
+            pipeline = import_file(input_file)
+        else:
+            raise ImportError("OVITO import_file not available")
         
-        try:
-            # Use safe imports
-            if 'import_file' in globals():
-                pipeline = import_file(input_file)
-            else:
-                raise ImportError("OVITO import_file not available")
+        # Use safe DXA modifier creation
+        if _HAS_DXA:
+            dxa = DislocationAnalysisModifier()
             
-            # Use safe DXA modifier creation
-            if 'DislocationAnalysisModifier' in globals():
-                dxa = DislocationAnalysisModifier()
-                
-                # Try to set crystal structure if available
-                try:
-                    if hasattr(DislocationAnalysisModifier, 'Lattice'):
-                        dxa.input_crystal_structure = DislocationAnalysisModifier.Lattice.FCC
-                except:
-                    pass
-            else:
-                raise ImportError("OVITO DislocationAnalysisModifier not available")
+            # Try to set crystal structure if available
+            try:
+                if _HAS_LATTICE:
+                    dxa.input_crystal_structure = DislocationAnalysisModifier.Lattice.FCC
+            except:
+                pass
+        else:
+            raise ImportError("OVITO DislocationAnalysisModifier not available")
+        
+        pipeline.modifiers.append(dxa)
+        return pipeline
+    
+    def _analyze_computed(self, data, frame: int, detail: bool = False) -> Dict[str, Any]:
+        """Extract dislocation results from a computed DataCollection (per-segment details if detail)"""
+        # Extract dislocation network safely
+        dislocation_network = None
+        if hasattr(data, 'dislocations'):
+            dislocation_network = data.dislocations
+        
+        if dislocation_network and hasattr(dislocation_network, 'segments'):
+            segments = dislocation_network.segments
             
-            pipeline.modifiers.append(dxa)
+            segment_count = len(segments)
             
-            # Compute the analysis
-            data = pipeline.compute(frame)
+            # Reduce segment lengths in one array pass (attribute probed once, not per segment)
+            if segment_count and hasattr(segments[0], 'length'):
+                lengths = np.fromiter(map(_segment_length, segments), dtype=np.float64, count=segment_count)
+            else:
+                lengths = np.zeros(segment_count)
+            total_length = float(lengths.sum())
             
-            # Extract dislocation network safely
-            dislocation_network = None
-            if hasattr(data, 'dislocations'):
-                dislocation_network = data.dislocations
+            # Get cell volume safely
+            volume = 0.0
+            if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
+                volume = data.cell.volume
             
-            if dislocation_network and hasattr(dislocation_network, 'segments'):
-                segments = dislocation_network.segments
-                
-                total_length = 0.0
-                segment_count = len(segments)
-                
-                # Calculate total length safely
-                for segment in segments:
-                    if hasattr(segment, 'length'):
-                        total_length += segment.length
-                
-                # Get cell volume safely
-                volume = 0.0
-                if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
-                    volume = data.cell.volume
-                
-                results = {
-                    'frame': frame,
-                    'total_length': total_length,
-                    'segment_count': segment_count,
-                    'dislocation_density': total_length / volume if volume > 0 else 0.0,
-                    'volume': volume,
-                    'segments': []
-                }
-                
-                # Extract segment details safely
-                for i, segment in enumerate(segments):
-                    segment_info = {
+            results = {
+                'frame': frame,
+                'total_length': total_length,
+                'segment_count': segment_count,
+                'dislocation_density': total_length / volume if volume > 0 else 0.0,
+                'volume': volume,
+                'segments': []
+            }
+            
+            # Per-segment details (one dict per segment) only when asked for
+            if detail:
+                results['segments'] = [
+                    {
                         'id': i,
-                        'length': getattr(segment, 'length', 0),
-                        'burgers_vector': None,
+                        'length': float(length),
+                        'burgers_vector': _segment_burgers(segment),
                         'line_direction': None
                     }
-                    
-                    # Try to get Burgers vector
-                    if hasattr(segment, 'true_burgers_vector'):
-                        try:
-                            segment_info['burgers_vector'] = list(segment.true_burgers_vector)
-                        except:
-                            pass
-                    
-                    results['segments'].append(segment_info)
-                
-                return results
-            else:
-                # No dislocations found
-                volume = 0.0
-                if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
-                    volume = data.cell.volume
-                
-                return {
-                    'frame': frame,
-                    'total_length': 0.0,
-                    'segment_count': 0,
-                    'dislocation_density': 0.0,
-                    'volume': volume,
-                    'segments': []
-                }
-                
-        except Exception as e:
-            print(f"❌ Error analyzing frame {frame}: {e}")
+                    for i, (segment, length) in enumerate(zip(segments, lengths))
+                ]
+            
+            return results
+        else:
+            # No dislocations found
+            volume = 0.0
+            if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
+                volume = data.cell.volume
+            
             return {
                 'frame': frame,
-                'error': str(e),
                 'total_length': 0.0,
                 'segment_count': 0,
                 'dislocation_density': 0.0,
-                'volume': 0.0,
+                'volume': volume,
                 'segments': []
             }
     
-    def analyze_trajectory(self, input_pattern: str, reference_file: str,
-                          frames: Optional[List[int]] = None,
-                          remote: bool = False, sftp_config: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Analyze dislocation evolution over multiple frames"""
+    def _error_result(self, frame: int, error: str) -> Dict[str, Any]:
+        """Empty result carrying an error message"""
+        return {
+            'frame': frame,
+            'error': error,
+            'total_length': 0.0,
+            'segment_count': 0,
+            'dislocation_density': 0.0,
+            'volume': 0.0,
+            'segments': []
+        }
+    
+    def _analyze_pipeline_frame(self, pipeline, frame: int, detail: bool = False) -> Dict[str, Any]:
+        """Compute one frame on an already built pipeline"""
+        try:
+            return self._analyze_computed(pipeline.compute(frame), frame, detail)
+        except Exception as e:
+            print(f"❌ Error analyzing frame {frame}: {e}")
+            return self._error_result(frame, str(e))
+    
+    def analyze_dislocation_frame(self, input_file: str, reference_file: str, 
+                                frame: int = 0, detail: bool = False) -> Dict[str, Any]:
+        """Analyze dislocation in a single frame (detail fills 'segments' with one dict per segment)"""
         if not OVITO_AVAILABLE:
-            return [{'frame': 0, 'error': 'OVITO not available', 'total_length': 0.0, 
-                    'segment_count': 0, 'dislocation_density': 0.0, 'volume': 0.0, 'segments': []}]
+            return self._error_result(frame, 'OVITO not available')
         
-        results = []
+        return _analyze_cached(self, input_file, frame, lambda: self._build_pipeline(input_file),
+                               detail=detail)
+    
+    def analyze_trajectory_iter(self, input_pattern: str, reference_file: str,
+                                frames: Optional[Sequence[int]] = None,
+                                remote: bool = False, sftp_config: Optional[Dict] = None,
+                                nproc: Optional[int] = None, detail: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield dislocation evolution results frame by frame as soon as each one is analyzed"""
+        if not OVITO_AVAILABLE:
+            yield {'frame': 0, 'error': 'OVITO not available', 'total_length': 0.0, 
+                   'segment_count': 0, 'dislocation_density': 0.0, 'volume': 0.0, 'segments': []}
+            return
         
-        # Skip remote file handling for now - not working
         if remote:
-            print("⚠️  Remote file processing not available yet")
-            return results
+            yield from _iter_remote(
+                lambda local_pattern: self.analyze_trajectory_iter(local_pattern, reference_file, frames,
+                                                                   nproc=nproc, detail=detail),
+                input_pattern, sftp_config, frames
+            )
+            return
         
         try:
             # Handle local files only
             if os.path.isfile(input_pattern):
                 # Single file with multiple frames
                 try:
-                    if 'import_file' in globals():
-                        pipeline = import_file(input_pattern)
-                        num_frames = getattr(pipeline.source, 'num_frames', 1)
-                        
-                        if frames is None:
-                            frames = list(range(num_frames))
-                        
-                        for frame in tqdm(frames, desc="🔬 Analyzing frames"):
-                            if frame < num_frames:
-                                result = self.analyze_dislocation_frame(input_pattern, reference_file, frame)
-                                results.append(result)
+                    # Build the pipeline once and only re-compute it per frame
+                    pipeline = self._build_pipeline(input_pattern)
+                    num_frames = getattr(pipeline.source, 'num_frames', 1)
+                    
+                    tasks = [(input_pattern, reference_file, frame)
+                             for frame in _requested_frames(frames, num_frames, in_range=True)]
+                    
+                    def analyze_frame(input_file, _reference_file, frame):
+                        return _analyze_cached(self, input_file, frame, lambda: pipeline, detail=detail)
+                    
+                    yield from _iter_frames(analyze_frame, _dislocation_frame_worker, tasks,
+                                            self.gpu_enabled, (self.cache_dir, detail), nproc, "🔬 Analyzing frames")
                 except Exception as e:
                     print(f"❌ Error processing trajectory file: {e}")
             
             else:
                 # Pattern matching for multiple files
-                input_files = glob.glob(input_pattern)
-                input_files.sort()
+                input_files = _list_frame_files(input_pattern)
                 
-                if frames is None:
-                    frames = list(range(len(input_files)))
-                
-                for i, frame in enumerate(tqdm(frames, desc="🔬 Analyzing frames")):
-                    if i < len(input_files):
-                        result = self.analyze_dislocation_frame(input_files[i], reference_file, 0)
-                        result['frame'] = frame
-                        result['source_file'] = input_files[i]
-                        results.append(result)
-            
-            return results
-            
+                frames = _requested_frames(frames, len(input_files), in_range=False)
+                tasks = [(input_file, reference_file, 0) for input_file in input_files[:len(frames)]]
+                results = _iter_frames(functools.partial(self.analyze_dislocation_frame, detail=detail),
+                                       _dislocation_frame_worker, tasks,
+                                       self.gpu_enabled, (self.cache_dir, detail), nproc, "🔬 Analyzing frames")
+                for result, frame, (input_file, _, _) in zip(results, frames, tasks):
+                    result['frame'] = frame
+                    result['source_file'] = input_file
+                    yield result
+        
         except Exception as e:
             print(f"❌ Error in trajectory analysis: {e}")
-            return results
+    
+    def analyze_trajectory(self, input_pattern: str, reference_file: str,
+                           frames: Optional[Sequence[int]] = None,
+                           remote: bool = False, sftp_config: Optional[Dict] = None,
+                           nproc: Optional[int] = None, detail: bool = False) -> List[Dict[str, Any]]:
+        """Analyze dislocation evolution over multiple frames (nproc worker processes, default half the cores)"""
+        return list(self.analyze_trajectory_iter(input_pattern, reference_file, frames, remote, sftp_config,
+                                                 nproc, detail=detail))
 
 
 class WignerSeitzAnalysis:
     """Wigner-Seitz vacancy analysis using OVITO"""
     
-    def __init__(self, gpu_enabled: bool = True):
+    # Modifier settings that affect results (part of the frame cache key)
+    MODIFIER_CONFIG = ('ws', 'ptm')
+    
+    def __init__(self, gpu_enabled: bool = True, cache_dir: Optional[str] = None):
         """Initialize Wigner-Seitz analysis"""
         if not OVITO_AVAILABLE:
             raise ImportError("OVITO is required for Wigner-Seitz analysis")
         
         self.gpu_enabled = gpu_enabled
+        self.cache_dir = cache_dir  # optional on-disk frame result cache
+        self._ref_source = None  # loaded reference configuration
+        self._ref_signature = None
         if gpu_enabled:
             OvitoGPUConfig.setup_gpu()
     
-    def analyze_vacancies_frame(self, input_file: str, reference_file: str,
-                               frame: int = 0) -> Dict[str, Any]:
-        """Analyze vacancies in a single frame"""
-        if not OVITO_AVAILABLE:
-            return {
-                'frame': frame,
-                'error': 'OVITO not available',
-                'total_sites': 0,
-                'occupied_sites': 0,
-                'vacant_sites': 0,
-                'vacancy_concentration': 0.0,
-                'volume': 0.0
-            }
+    def _reference_source(self, reference_file: str):
+        """Reference configuration as a FileSource, parsed once and shared by every pipeline"""
+        signature = _file_signature(reference_file)
+        if self._ref_source is None or self._ref_signature != signature:
+            ref_source = FileSource()
+            ref_source.load(reference_file)
+            self._ref_source, self._ref_signature = ref_source, signature
+        return self._ref_source
+    
+    def _build_pipeline(self, input_file: str, reference_file: Optional[str] = None):
+        """Import a simulation file and attach the PTM and WS modifiers (once per file)"""
+        # Use safe imports
+        if _HAS_IMPORT_FILE:
+            pipeline = import_file(input_file)
+        else:
+            raise ImportError("OVITO import_file not available")
         
+        # Add structure identification if available
         try:
-            # Use safe imports
-            if 'import_file' in globals():
-                pipeline = import_file(input_file)
-            else:
-                raise ImportError("OVITO import_file not available")
-            
-            # Add structure identification if available
+            if _HAS_PTM:
+                ptm = PolyhedralTemplateMatchingModifier()
+                pipeline.modifiers.append(ptm)
+        except:
+            pass
+        
+        # Add Wigner-Seitz analysis
+        if _HAS_WS:
+            ws = WignerSeitzAnalysisModifier()
+            if reference_file:
+                ws.reference = self._reference_source(reference_file)
+            pipeline.modifiers.append(ws)
+        else:
+            raise ImportError("OVITO WignerSeitzAnalysisModifier not available")
+        
+        return pipeline
+    
+    def _analyze_computed(self, data, frame: int) -> Dict[str, Any]:
+        """Extract vacancy results from a computed DataCollection"""
+        # Extract vacancy information safely
+        occupancy = None
+        structure_types = None
+        
+        if hasattr(data, 'particles'):
+            # Try different ways to access Occupancy
             try:
-                if 'PolyhedralTemplateMatchingModifier' in globals():
-                    ptm = PolyhedralTemplateMatchingModifier()
-                    pipeline.modifiers.append(ptm)
+                if hasattr(data.particles, 'Occupancy'):
+                    occupancy = data.particles.Occupancy
+                elif 'Occupancy' in data.particles:
+                    occupancy = data.particles['Occupancy']
             except:
                 pass
             
-            # Add Wigner-Seitz analysis
-            if 'WignerSeitzAnalysisModifier' in globals():
-                ws = WignerSeitzAnalysisModifier()
-                pipeline.modifiers.append(ws)
+            # Try to get structure types
+            try:
+                if hasattr(data.particles, 'Structure Type'):
+                    structure_types = data.particles['Structure Type']
+                elif 'Structure Type' in data.particles:
+                    structure_types = data.particles['Structure Type']
+            except:
+                pass
+        
+        total_sites = 0
+        vacant_sites = 0
+        structure_counts = None
+        if occupancy is not None:
+            occupancy = np.ascontiguousarray(occupancy, dtype=np.int32)
+            total_sites = occupancy.size
+            if structure_types is not None and total_sites and len(structure_types) == total_sites:
+                # Fused pass: vacancy count and structure histogram together
+                structure_types = np.ascontiguousarray(structure_types, dtype=np.int32)
+                vacant_sites, histogram = ws_site_counts(occupancy, structure_types,
+                                                         int(structure_types.max()) + 1)
+                vacant_sites = int(vacant_sites)
+                structure_counts = {t: count for t, count in enumerate(histogram.tolist()) if count}
             else:
-                raise ImportError("OVITO WignerSeitzAnalysisModifier not available")
-            
-            # Compute the analysis
-            data = pipeline.compute(frame)
-            
-            # Extract vacancy information safely
-            occupancy = None
-            structure_types = None
-            
-            if hasattr(data, 'particles'):
-                # Try different ways to access Occupancy
-                try:
-                    if hasattr(data.particles, 'Occupancy'):
-                        occupancy = data.particles.Occupancy
-                    elif 'Occupancy' in data.particles:
-                        occupancy = data.particles['Occupancy']
-                except:
-                    pass
-                
-                # Try to get structure types
-                try:
-                    if hasattr(data.particles, 'Structure Type'):
-                        structure_types = data.particles['Structure Type']
-                    elif 'Structure Type' in data.particles:
-                        structure_types = data.particles['Structure Type']
-                except:
-                    pass
-            
-            total_sites = len(occupancy) if occupancy is not None else 0
-            vacant_sites = 0
-            if occupancy is not None:
-                try:
-                    vacant_sites = sum(1 for occ in occupancy if occ == 0)
-                except:
-                    vacant_sites = 0
-            
-            occupied_sites = total_sites - vacant_sites
-            
-            # Get cell volume
-            volume = 0.0
-            if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
-                volume = data.cell.volume
-            
-            results = {
-                'frame': frame,
-                'total_sites': total_sites,
-                'occupied_sites': occupied_sites,
-                'vacant_sites': vacant_sites,
-                'vacancy_concentration': vacant_sites / total_sites if total_sites > 0 else 0.0,
-                'volume': volume
-            }
-            
-            # Add structure type information if available
-            if structure_types is not None:
-                structure_counts = {}
-                try:
-                    for st in structure_types:
-                        structure_counts[st] = structure_counts.get(st, 0) + 1
-                    results['structure_types'] = structure_counts
-                except:
-                    pass
-            
-            return results
-            
+                vacant_sites = int(np.count_nonzero(occupancy == 0))
+        
+        occupied_sites = total_sites - vacant_sites
+        
+        # Get cell volume
+        volume = 0.0
+        if hasattr(data, 'cell') and hasattr(data.cell, 'volume'):
+            volume = data.cell.volume
+        
+        results = {
+            'frame': frame,
+            'total_sites': total_sites,
+            'occupied_sites': occupied_sites,
+            'vacant_sites': vacant_sites,
+            'vacancy_concentration': vacant_sites / total_sites if total_sites > 0 else 0.0,
+            'volume': volume
+        }
+        
+        # Add structure type information if available
+        if structure_counts is not None:
+            results['structure_types'] = structure_counts
+        elif structure_types is not None:
+            try:
+                types, counts = np.unique(np.asarray(structure_types), return_counts=True)
+                results['structure_types'] = dict(zip(types.tolist(), counts.tolist()))
+            except:
+                pass
+        
+        return results
+    
+    def _error_result(self, frame: int, error: str) -> Dict[str, Any]:
+        """Empty result carrying an error message"""
+        return {
+            'frame': frame,
+            'error': error,
+            'total_sites': 0,
+            'occupied_sites': 0,
+            'vacant_sites': 0,
+            'vacancy_concentration': 0.0,
+            'volume': 0.0
+        }
+    
+    def _analyze_pipeline_frame(self, pipeline, frame: int) -> Dict[str, Any]:
+        """Compute one frame on an already built pipeline"""
+        try:
+            return self._analyze_computed(pipeline.compute(frame), frame)
         except Exception as e:
             print(f"❌ Error analyzing frame {frame}: {e}")
-            return {
-                'frame': frame,
-                'error': str(e),
-                'total_sites': 0,
-                'occupied_sites': 0,
-                'vacant_sites': 0,
-                'vacancy_concentration': 0.0,
-                'volume': 0.0
-            }
+            return self._error_result(frame, str(e))
     
-    def analyze_vacancy_evolution(self, input_pattern: str, reference_file: str,
-                                 frames: Optional[List[int]] = None,
-                                 remote: bool = False, sftp_config: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Analyze vacancy evolution over multiple frames"""
+    def analyze_vacancies_frame(self, input_file: str, reference_file: str,
+                               frame: int = 0) -> Dict[str, Any]:
+        """Analyze vacancies in a single frame"""
         if not OVITO_AVAILABLE:
-            return [{'frame': 0, 'error': 'OVITO not available', 'total_sites': 0, 
-                    'occupied_sites': 0, 'vacant_sites': 0, 'vacancy_concentration': 0.0, 'volume': 0.0}]
+            return self._error_result(frame, 'OVITO not available')
         
-        results = []
+        return _analyze_cached(self, input_file, frame,
+                               lambda: self._build_pipeline(input_file, reference_file), reference_file)
+    
+    def analyze_vacancy_evolution_iter(self, input_pattern: str, reference_file: str,
+                                       frames: Optional[Sequence[int]] = None,
+                                       remote: bool = False, sftp_config: Optional[Dict] = None,
+                                       nproc: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield vacancy evolution results frame by frame as soon as each one is analyzed"""
+        if not OVITO_AVAILABLE:
+            yield {'frame': 0, 'error': 'OVITO not available', 'total_sites': 0, 
+                   'occupied_sites': 0, 'vacant_sites': 0, 'vacancy_concentration': 0.0, 'volume': 0.0}
+            return
         
-        # Skip remote file handling for now
         if remote:
-            print("⚠️  Remote file processing not available yet")
-            return results
+            yield from _iter_remote(
+                lambda local_pattern: self.analyze_vacancy_evolution_iter(local_pattern, reference_file, frames,
+                                                                          nproc=nproc),
+                input_pattern, sftp_config, frames
+            )
+            return
         
         try:
             # Handle local files only
             if os.path.isfile(input_pattern):
                 # Single file with multiple frames
                 try:
-                    if 'import_file' in globals():
-                        pipeline = import_file(input_pattern)
-                        num_frames = getattr(pipeline.source, 'num_frames', 1)
-                        
-                        if frames is None:
-                            frames = list(range(num_frames))
-                        
-                        for frame in tqdm(frames, desc="🔬 Analyzing vacancies"):
-                            if frame < num_frames:
-                                result = self.analyze_vacancies_frame(input_pattern, reference_file, frame)
-                                results.append(result)
+                    # Build the pipeline once and only re-compute it per frame
+                    pipeline = self._build_pipeline(input_pattern, reference_file)
+                    num_frames = getattr(pipeline.source, 'num_frames', 1)
+                    
+                    tasks = [(input_pattern, reference_file, frame)
+                             for frame in _requested_frames(frames, num_frames, in_range=True)]
+                    
+                    def analyze_frame(input_file, reference_file, frame):
+                        return _analyze_cached(self, input_file, frame, lambda: pipeline, reference_file)
+                    
+                    yield from _iter_frames(analyze_frame, _vacancies_frame_worker, tasks,
+                                            self.gpu_enabled, (self.cache_dir,), nproc, "🔬 Analyzing vacancies")
                 except Exception as e:
                     print(f"❌ Error processing trajectory file: {e}")
             
             else:
                 # Pattern matching for multiple files
-                input_files = glob.glob(input_pattern)
-                if not input_files:
-                    # Try fnmatch for more complex patterns
-                    base_dir = os.path.dirname(input_pattern) or '.'
-                    pattern = os.path.basename(input_pattern)
-                    try:
-                        all_files = os.listdir(base_dir)
-                        input_files = [os.path.join(base_dir, f) for f in all_files if fnmatch.fnmatch(f, pattern)]
-                    except:
-                        input_files = []
-                
-                input_files.sort()
-                
-                if frames is None:
-                    frames = list(range(len(input_files)))
+                input_files = _list_frame_files(input_pattern)
                 
-                for i, frame in enumerate(tqdm(frames, desc="🔬 Analyzing vacancies")):
-                    if i < len(input_files):
-                        result = self.analyze_vacancies_frame(input_files[i], reference_file, 0)
-                        result['frame'] = frame
-                        result['source_file'] = input_files[i]
-                        results.append(result)
-            
-            return results
-            
+                frames = _requested_frames(frames, len(input_files), in_range=False)
+                tasks = [(input_file, reference_file, 0) for input_file in input_files[:len(frames)]]
+                results = _iter_frames(self.analyze_vacancies_frame, _vacancies_frame_worker, tasks,
+                                       self.gpu_enabled, (self.cache_dir,), nproc, "🔬 Analyzing vacancies")
+                for result, frame, (input_file, _, _) in zip(results, frames, tasks):
+                    result['frame'] = frame
+                    result['source_file'] = input_file
+                    yield result
+        
         except Exception as e:
             print(f"❌ Error in vacancy evolution analysis: {e}")
-            return results
+    
+    def analyze_vacancy_evolution(self, input_pattern: str, reference_file: str,
+                                  frames: Optional[Sequence[int]] = None,
+                                  remote: bool = False, sftp_config: Optional[Dict] = None,
+                                  nproc: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze vacancy evolution over multiple frames (nproc worker processes, default half the cores)"""
+        return list(self.analyze_vacancy_evolution_iter(input_pattern, reference_file, frames, remote,
+                                                        sftp_config, nproc))
+
+
+def _worker_init(gpu_enabled: bool, gpu_slots: Optional[Tuple[Any, List[str]]] = None) -> None:
+    """Pool initializer: pin the worker to its GPU before it imports any file"""
+    if gpu_enabled:
+        gpu_id: Union[int, str] = 0
+        if gpu_slots is not None:
+            counter, devices = gpu_slots
+            with counter.get_lock():
+                slot = counter.value
+                counter.value += 1
+            gpu_id = devices[slot % len(devices)]
+        OvitoGPUConfig.setup_gpu(gpu_id)
+
+
+# Analyzers built inside pool worker processes, one per (class, gpu_enabled, cache_dir)
+_WORKER_ANALYZERS: Dict[tuple, Any] = {}
+
+# Last pipeline built in each worker process: (analyzer key) -> ((input_file, reference_file), pipeline)
+_WORKER_PIPELINES: Dict[tuple, Tuple[tuple, Any]] = {}
+
+
+def _worker_frame(analyzer_cls: type, input_file: str, frame: int, gpu_enabled: bool,
+                  cache_dir: Optional[str], reference_file: Optional[str] = None,
+                  **options) -> Dict[str, Any]:
+    """Analyze one frame in a pool worker, reusing the pipeline while the input files are unchanged"""
+    key = (analyzer_cls, gpu_enabled, cache_dir)
+    if key not in _WORKER_ANALYZERS:
+        _WORKER_ANALYZERS[key] = analyzer_cls(gpu_enabled=gpu_enabled, cache_dir=cache_dir)
+    analyzer = _WORKER_ANALYZERS[key]
+    
+    def get_pipeline():
+        cached = _WORKER_PIPELINES.get(key)
+        if cached is None or cached[0] != (input_file, reference_file):
+            cached = ((input_file, reference_file), analyzer._build_pipeline(input_file, reference_file))
+            _WORKER_PIPELINES[key] = cached
+        return cached[1]
+    
+    return _analyze_cached(analyzer, input_file, frame, get_pipeline, reference_file, **options)
+
+
+def _dislocation_frame_worker(input_file: str, reference_file: str, frame: int,
+                              gpu_enabled: bool, cache_dir: Optional[str], detail: bool) -> Dict[str, Any]:
+    """Process-pool entry point for DislocationAnalysis frames"""
+    return _worker_frame(DislocationAnalysis, input_file, frame, gpu_enabled, cache_dir, detail=detail)
+
+
+def _vacancies_frame_worker(input_file: str, reference_file: str, frame: int,
+                            gpu_enabled: bool, cache_dir: Optional[str]) -> Dict[str, Any]:
+    """Process-pool entry point for WignerSeitzAnalysis frames"""
+    return _worker_frame(WignerSeitzAnalysis, input_file, frame, gpu_enabled, cache_dir, reference_file)
+
+
+def _write_results_table(df: pd.DataFrame, output_file: str) -> str:
+    """
+    Write a results table as Parquet (for *.parquet paths) or CSV
+    
+    Args:
+        df: Results DataFrame
+        output_file: Output path; the extension selects the format
+        
+    Returns:
+        Path actually written (CSV next to it if pyarrow is missing)
+    """
+    if output_file.endswith('.parquet'):
+        try:
+            df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+            return output_file
+        except ImportError:
+            output_file = os.path.splitext(output_file)[0] + '.csv'
+            print(f"⚠️  pyarrow not available, writing CSV instead: {output_file}")
+    
+    df.to_csv(output_file, index=False)
+    return output_file
+
+
+# Output columns and the defaults used when a result lacks them
+_DISLOCATION_FIELDS = (
+    ('frame', 0), ('total_length', 0.0), ('segment_count', 0), ('dislocation_density', 0.0),
+    ('volume', 0.0), ('source_file', ''), ('error', '')
+)
+_VACANCY_FIELDS = (
+    ('frame', 0), ('total_sites', 0), ('occupied_sites', 0), ('vacant_sites', 0),
+    ('vacancy_concentration', 0.0), ('volume', 0.0), ('source_file', ''), ('error', '')
+)
+
+
+def _results_table(results: List[Dict[str, Any]], fields: Tuple[Tuple[str, Any], ...]) -> pd.DataFrame:
+    """
+    Build a results DataFrame from plain row lists driven by (column, default) fields
+    
+    Args:
+        results: Result dictionaries
+        fields: (column, default) pairs
+        
+    Returns:
+        DataFrame with one column per field, in field order
+    """
+    rows = [[result.get(key, default) for key, default in fields] for result in results]
+    return pd.DataFrame(rows, columns=[key for key, _ in fields])
 
 
-def save_dislocation_results(results: List[Dict[str, Any]], output_file: str) -> None:
-    """Save dislocation analysis results to CSV file"""
+def _append_structure_columns(output_file: str, struct_counts: List[Dict[Any, int]]) -> None:
+    """
+    Add structure_type_* columns to a streamed results CSV
+    
+    The columns are the union over all rows (0 where a type is absent), as for
+    in-memory result lists.
+    
+    Args:
+        output_file: CSV written by _stream_results_csv
+        struct_counts: Structure type counts of each data row, in file order
+    """
+    struct_types = list(dict.fromkeys(
+        struct_type for counts in struct_counts for struct_type in counts
+    ))
+    if not struct_types:
+        return
+    
+    tmp_path = f"{output_file}.{os.getpid()}.tmp"
+    with open(output_file, newline='') as source, open(tmp_path, 'w', newline='') as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target, lineterminator='\n')
+        writer.writerow(next(reader) + [f'structure_type_{struct_type}' for struct_type in struct_types])
+        for row, counts in zip(reader, struct_counts):
+            writer.writerow(row + [counts.get(struct_type, 0) for struct_type in struct_types])
+    os.replace(tmp_path, output_file)
+
+
+def _stream_results_csv(results: Iterable[Dict[str, Any]], output_file: str,
+                        fields: Tuple[Tuple[str, Any], ...], with_structure_types: bool = False) -> int:
+    """
+    Write results to CSV one row at a time as they are produced
+    
+    Structure type counts are kept per row and appended as columns once the
+    last row is in, so types first seen in later frames are not lost.
+    
+    Args:
+        results: Iterable of result dictionaries (e.g. from analyze_trajectory_iter)
+        output_file: Output CSV path (only created once the first row arrives)
+        fields: (column, default) pairs
+        with_structure_types: Add structure_type_* columns from 'structure_types'
+        
+    Returns:
+        Number of rows written
+    """
+    rows_written = 0
+    struct_counts = []
+    output = None
+    try:
+        for result in results:
+            if output is None:
+                output = open(output_file, 'w', newline='')
+                writer = csv.writer(output, lineterminator='\n')
+                writer.writerow([key for key, _ in fields])
+            writer.writerow([result.get(key, default) for key, default in fields])
+            if with_structure_types:
+                struct_counts.append(result.get('structure_types', {}))
+            rows_written += 1
+    finally:
+        if output is not None:
+            output.close()
+            # Also on errors, so the rows written so far carry their structure types
+            _append_structure_columns(output_file, struct_counts)
+    
+    return rows_written
+
+
+def save_dislocation_results(results: Iterable[Dict[str, Any]], output_file: str) -> None:
+    """Save dislocation analysis results to CSV (or Parquet for *.parquet) file; iterators are streamed to CSV"""
+    if not isinstance(results, (list, tuple)):
+        if not output_file.endswith('.parquet'):
+            if _stream_results_csv(results, output_file, _DISLOCATION_FIELDS):
+                print(f"✅ Dislocation results saved to {output_file}")
+            else:
+                print("⚠️  No dislocation results to save")
+            return
+        results = list(results)
+    
     if not results:
         print("⚠️  No dislocation results to save")
         return
     
-    # Prepare data for DataFrame
-    data = []
-    for result in results:
-        row = {
-            'frame': result.get('frame', 0),
-            'total_length': result.get('total_length', 0.0),
-            'segment_count': result.get('segment_count', 0),
-            'dislocation_density': result.get('dislocation_density', 0.0),
-            'volume': result.get('volume', 0.0),
-            'source_file': result.get('source_file', ''),
-            'error': result.get('error', '')
-        }
-        data.append(row)
-    
-    df = pd.DataFrame(data)
-    df.to_csv(output_file, index=False)
+    df = _results_table(results, _DISLOCATION_FIELDS)
+    output_file = _write_results_table(df, output_file)
     print(f"✅ Dislocation results saved to {output_file}")
 
 
-def save_vacancy_results(results: List[Dict[str, Any]], output_file: str) -> None:
-    """Save vacancy analysis results to CSV file"""
+def save_vacancy_results(results: Iterable[Dict[str, Any]], output_file: str) -> None:
+    """Save vacancy analysis results to CSV (or Parquet for *.parquet) file; iterators are streamed to CSV"""
+    if not isinstance(results, (list, tuple)):
+        if not output_file.endswith('.parquet'):
+            if _stream_results_csv(results, output_file, _VACANCY_FIELDS, with_structure_types=True):
+                print(f"✅ Vacancy results saved to {output_file}")
+            else:
+                print("⚠️  No vacancy results to save")
+            return
+        results = list(results)
+    
     if not results:
         print("⚠️  No vacancy results to save")
         return
     
-    # Prepare data for DataFrame
-    data = []
-    for result in results:
-        row = {
-            'frame': result.get('frame', 0),
-            'total_sites': result.get('total_sites', 0),
-            'occupied_sites': result.get('occupied_sites', 0),
-            'vacant_sites': result.get('vacant_sites', 0),
-            'vacancy_concentration': result.get('vacancy_concentration', 0.0),
-            'volume': result.get('volume', 0.0),
-            'source_file': result.get('source_file', ''),
-            'error': result.get('error', '')
-        }
-        
-        # Add structure type counts if available
-        if 'structure_types' in result:
-            for struct_type, count in result['structure_types'].items():
-                row[f'structure_type_{struct_type}'] = count
-        
-        data.append(row)
+    df = _results_table(results, _VACANCY_FIELDS)
     
-    df = pd.DataFrame(data)
-    df.to_csv(output_file, index=False)
+    # Structure type columns are the union over all frames (0 where a type is absent)
+    struct_types = dict.fromkeys(
+        struct_type for result in results for struct_type in result.get('structure_types', ())
+    )
+    if struct_types:
+        struct_counts = {struct_type: np.zeros(len(results), dtype=np.int64) for struct_type in struct_types}
+        for i, result in enumerate(results):
+            for struct_type, count in result.get('structure_types', {}).items():
+                struct_counts[struct_type][i] = count
+        df = df.assign(**{f'structure_type_{struct_type}': counts
+                          for struct_type, counts in struct_counts.items()})
+    
+    output_file = _write_results_table(df, output_file)
     print(f"✅ Vacancy results saved to {output_file}")
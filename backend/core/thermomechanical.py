@@ -6,47 +6,205 @@ Provides functionality for NVE and NVT ensemble simulation post-processing
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import IO, Dict, List, Tuple, Optional, Union
+import functools
+import hashlib
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from ..utils.sftp_utils import SFTPManager
-from ..utils.file_utils import read_data_file, write_output_file
+from ..utils.sftp_utils import open_remote_stream
+from ..utils.file_utils import read_data_file, read_data_stream, write_output_file
 from ..utils.math_utils import (
-    calculate_logarithmic_strain, calculate_engineering_strain,
-    calculate_von_mises_strain, calculate_von_mises_stress,
-    calculate_elastic_strain, calculate_plastic_strain,
-    calculate_work_terms, calculate_cumulative_sum,
-    calculate_beta_parameters, calculate_beta_parameters_nve,
-    filter_data_by_threshold, calculate_averages_above_threshold
+    calculate_cumulative_sum,
+    calculate_beta_parameters, calculate_beta_parameters_nve
+)
+from ._kernels import (
+    make_elastic_plastic_kernel, von_mises_strain_block, von_mises_stress_block
 )
 from ..config.constants import NVE_DATA_HEADERS, NVT_DATA_HEADERS, EV_TO_J, ANGSTROM3_TO_M3
 
+# Pressure tensor columns (Voigt order) and the atm -> Pa conversion with sign flip
+# (LAMMPS outputs pressure, stress = -pressure)
+_PRESSURE_COLUMNS = ('p_1', 'p_2', 'p_3', 'p_4', 'p_5', 'p_6')
+_PRESSURE_TO_STRESS = -101325.0
+
+# Rows from which the independent base stages run in a thread pool
+_PARALLEL_STAGE_MIN_ROWS = 100_000
+
+# Box length columns: 1-3 normal, 4-6 shear (tilt)
+_LENGTH_COLUMNS = ('l_1', 'l_2', 'l_3', 'l_4', 'l_5', 'l_6')
+
+# Strain/stress tensors are carried as one (N, 6) array in Voigt order:
+# column 0..5 holds component 1..6 (e1..e6 / s1..s6), in the processor's dtype
+StrainStress = np.ndarray
+
+
+def _voigt_names(template: str) -> Tuple[str, ...]:
+    """Column names for the six components of a Voigt block (e.g. 'e{}_elastic')"""
+    return tuple(template.format(i + 1) for i in range(6))
+
+
+# Result table layout, in the order the blocks are written by process_complete_analysis
+_RESULT_COLUMNS = (
+    ('step',) + _LENGTH_COLUMNS + ('volume', 'volume_rate')
+    + _voigt_names('e{}') + _voigt_names('s{}')
+    + _voigt_names('e{}_elastic') + _voigt_names('e{}_plastic')
+    + ('von_mises_strain', 'von_mises_stress', 'von_mises_elastic', 'von_mises_plastic',
+       'work_elastic', 'work_plastic', 'internal_energy', 'heat_flow',
+       'Beta_0_diff', 'Beta_0_int', 'Beta_1_diff', 'Beta_1_int')
+)
+
+# Summary table layout: what filter_and_analyze needs with its default columns
+_SUMMARY_COLUMNS = ('step', 'von_mises_strain', 'Beta_0_diff', 'Beta_0_int', 'Beta_1_diff', 'Beta_1_int')
+
+
+def _assemble_results(step: np.ndarray, groups: Tuple[Tuple[np.dtype, Tuple[np.ndarray, ...]], ...],
+                      columns: Tuple[str, ...], index: pd.Index) -> pd.DataFrame:
+    """
+    Write 1-D and (N, k) blocks side by side into preallocated (N, K) arrays
+    
+    Each run of blocks with one dtype goes into a single array that the
+    DataFrame wraps as one block, with no per-column copies; the step
+    column is inserted in front with its own (integer) dtype.
+    
+    Args:
+        step: Step column of the input data
+        groups: (dtype, blocks) pairs in column order, after step
+        columns: Column names (step first)
+        index: Row index of the input data
+        
+    Returns:
+        Results DataFrame
+    """
+    # Adjacent groups of one dtype share an array
+    runs = []
+    for dtype, blocks in groups:
+        dtype = np.dtype(dtype)
+        if runs and runs[-1][0] == dtype:
+            runs[-1][1].extend(blocks)
+        else:
+            runs.append((dtype, list(blocks)))
+    
+    n_rows = len(index)
+    frames = []
+    first_col = 1
+    for dtype, blocks in runs:
+        widths = [1 if block.ndim == 1 else block.shape[1] for block in blocks]
+        results_arr = np.empty((n_rows, sum(widths)), dtype=dtype)
+        col = 0
+        for block, width in zip(blocks, widths):
+            results_arr[:, col:col + width] = block.reshape(n_rows, width)
+            col += width
+        frames.append(pd.DataFrame(results_arr, index=index,
+                                   columns=list(columns[first_col:first_col + col]), copy=False))
+        first_col += col
+    
+    results = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1, copy=False)
+    results.insert(0, columns[0], step)
+    return results
+
+
+def _column_dtypes(headers: Tuple[str, ...]) -> Dict[str, type]:
+    """read_csv dtypes: float64 for the measured columns, step keeps its inferred integer type"""
+    return {name: np.float64 for name in headers if name != 'step'}
+
+
+def _parsed_cache_path(file_path: str, mtime_ns: int, size: int,
+                       headers: Tuple[str, ...], cache_dir: str) -> str:
+    """On-disk location of a parsed simulation file (changes whenever the file does)"""
+    key = f"{file_path}|{mtime_ns}|{size}|{','.join(headers)}"
+    return os.path.join(cache_dir, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.npz')
+
+
+def _read_only_table(step: np.ndarray, values: np.ndarray, headers: Tuple[str, ...]) -> pd.DataFrame:
+    """Simulation table around read-only step and float64 value arrays (safe to share without copies)"""
+    step.setflags(write=False)
+    values.setflags(write=False)
+    data = pd.DataFrame(values, columns=[name for name in headers if name != 'step'], copy=False)
+    data.insert(headers.index('step'), 'step', step)
+    return data
+
+
+# Only the most recent file stays in memory (threshold sweeps re-analyze the same one)
+@functools.lru_cache(maxsize=1)
+def _load_local_cached(file_path: str, mtime_ns: int, size: int,
+                       headers: Tuple[str, ...], cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Parse a local simulation file, memoized by path, modification time and size
+    
+    The returned table is backed by read-only arrays, so callers share it
+    without copies. With a cache_dir the parsed table (step plus the float64
+    columns) is also kept there as .npz, so later processes (e.g. threshold
+    sweeps) load it instead of re-parsing text.
+    """
+    n_values = len(headers) - 1
+    cache_path = _parsed_cache_path(file_path, mtime_ns, size, headers, cache_dir) if cache_dir else None
+    if cache_path:
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                step, values = cached['step'], cached['values']
+            if values.ndim == 2 and values.shape[1] == n_values and len(step) == len(values):
+                return _read_only_table(step, values, headers)
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    # Parse the measured columns straight to float64, then keep them as one 2-D block
+    data = read_data_file(file_path, headers, dtype=_column_dtypes(headers))
+    step = data['step'].to_numpy()
+    values = data[[name for name in headers if name != 'step']].to_numpy(dtype=np.float64)
+    del data
+    
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, step=step, values=values)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    return _read_only_table(step, values, headers)
+
 
 class ThermomechanicalProcessor:
     """
     Base processor for thermomechanical analysis
     """
     
-    def __init__(self, sftp_config: Optional[Dict] = None):
+    def __init__(self, sftp_config: Optional[Dict] = None, dtype: np.dtype = np.float64,
+                 cache_dir: Optional[str] = None):
         """
         Initialize thermomechanical processor
         
         Args:
             sftp_config: SFTP configuration dictionary
+            dtype: Floating-point type of the (N, 6) strain/stress blocks and their result
+                columns; np.float32 halves their memory traffic. Raw columns are still parsed
+                and differenced in float64, and step, box lengths, volume and the Von Mises,
+                work, energy and Beta columns (scales down to ~1e-44) always stay float64
+            cache_dir: Directory for parsed local input files (None to keep them in memory only)
         """
-        self.sftp_manager = SFTPManager() if sftp_config else None
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported dtype {self.dtype}; use np.float32 or np.float64")
+        
+        self.sftp_config = sftp_config
+        self.cache_dir = cache_dir
         self.data = None
         self.processed_data = None
         self.compliance_parameters = None
+        self._ep_kernel = None  # decomposition kernel specialised for compliance_parameters
+        self._vm_order_cache = None  # (processed_data, sort_idx, sorted strain) for threshold queries
         
-    def load_simulation_data(self, file_path: str, remote: bool = False, 
+    def load_simulation_data(self, file_path: Union[str, IO[bytes]], remote: bool = False, 
                            ensemble_type: str = 'nve') -> pd.DataFrame:
         """
         Load simulation data from file
         
         Args:
-            file_path: Path to the simulation data file
+            file_path: Path to the simulation data file, or an open binary stream
+                (e.g. from open_remote_stream) parsed as it is read
             remote: Whether to load from remote server
             ensemble_type: Type of ensemble ('nve' or 'nvt')
             
@@ -56,21 +214,20 @@ class ThermomechanicalProcessor:
         # Choose appropriate headers based on ensemble type
         headers = NVT_DATA_HEADERS if ensemble_type.lower() == 'nvt' else NVE_DATA_HEADERS
         
-        if remote and self.sftp_manager:
-            # Download and process remote file
-            username, hostname, remote_path = self.sftp_manager.parse_sftp_url(file_path)
-            if self.sftp_manager.authenticate(hostname, username):
-                with tempfile.NamedTemporaryFile(mode='w+b', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                self.sftp_manager.download_file(remote_path, temp_path)
-                data = read_data_file(temp_path, headers)
-                os.unlink(temp_path)  # Clean up temp file
-                self.sftp_manager.close()
-                return data
-            else:
-                raise Exception("Failed to authenticate to remote server")
+        if hasattr(file_path, 'read'):
+            return read_data_stream(file_path, headers, getattr(file_path, 'name', ''),
+                                    dtype=_column_dtypes(headers))
+        elif remote and self.sftp_config:
+            # Parse while the bytes arrive instead of round-tripping a temp file
+            with open_remote_stream(file_path, self.sftp_config) as remote_file:
+                return read_data_stream(remote_file, headers, file_path.split(':', 1)[1],
+                                        dtype=_column_dtypes(headers))
         else:
-            return read_data_file(file_path, headers)
+            # Re-analyzing an unchanged file (e.g. threshold sweeps) skips the parse; the
+            # shared frame is read-only, so no defensive copy is needed
+            stat = os.stat(file_path)
+            return _load_local_cached(os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size,
+                                      headers, self.cache_dir)
     
     def set_compliance_parameters(self, S11: float, S12: float, S44: float):
         """
@@ -82,8 +239,10 @@ class ThermomechanicalProcessor:
             S44: S44 compliance parameter
         """
         self.compliance_parameters = (S11, S12, S44)
+        # Compiled once per material; repeated analyses with the same values reuse it
+        self._ep_kernel = make_elastic_plastic_kernel(float(S11), float(S12), float(S44))
     
-    def calculate_strain_components(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    def calculate_strain_components(self, data: pd.DataFrame) -> StrainStress:
         """
         Calculate strain components from simulation data
         
@@ -91,23 +250,21 @@ class ThermomechanicalProcessor:
             data: DataFrame with simulation data
             
         Returns:
-            Dictionary with strain components
+            (N, 6) array of strain increments (first row 0)
         """
-        strains = {}
+        lengths = data[list(_LENGTH_COLUMNS)].to_numpy(dtype=np.float64)
+        strains = np.empty(lengths.shape, dtype=self.dtype)
+        strains[0] = 0.0
         
-        # Logarithmic strains for normal components (using proper column names)
-        strains['e1'] = calculate_logarithmic_strain(np.array(data['l_1'].values))
-        strains['e2'] = calculate_logarithmic_strain(np.array(data['l_2'].values))
-        strains['e3'] = calculate_logarithmic_strain(np.array(data['l_3'].values))
+        # Logarithmic strains for normal components
+        strains[1:, :3] = np.log(lengths[1:, :3] / lengths[:-1, :3])
         
         # Engineering strains for shear components
-        strains['e4'] = calculate_engineering_strain(np.array(data['l_4'].values))
-        strains['e5'] = calculate_engineering_strain(np.array(data['l_5'].values))
-        strains['e6'] = calculate_engineering_strain(np.array(data['l_6'].values))
+        strains[1:, 3:] = lengths[1:, 3:] - lengths[:-1, 3:]
         
         return strains
     
-    def calculate_stress_components(self, data: pd.DataFrame, volume: np.ndarray) -> Dict[str, np.ndarray]:
+    def calculate_stress_components(self, data: pd.DataFrame, volume: np.ndarray) -> StrainStress:
         """
         Calculate stress components from simulation data
         
@@ -116,40 +273,27 @@ class ThermomechanicalProcessor:
             volume: Array of volume values
             
         Returns:
-            Dictionary with stress components
+            (N, 6) array of stress components in Pa
         """
-        stresses = {}
-        
-        # Convert pressure from atm to Pa and calculate stress components
-        # Note: LAMMPS outputs pressure, stress = -pressure
-        conversion_factor = -101325  # atm to Pa conversion with sign flip
-        
-        stresses['s1'] = np.array(data['p_1'].values) * conversion_factor
-        stresses['s2'] = np.array(data['p_2'].values) * conversion_factor
-        stresses['s3'] = np.array(data['p_3'].values) * conversion_factor
-        stresses['s4'] = np.array(data['p_4'].values) * conversion_factor
-        stresses['s5'] = np.array(data['p_5'].values) * conversion_factor
-        stresses['s6'] = np.array(data['p_6'].values) * conversion_factor
-        
-        return stresses
+        # Convert all six pressure columns from atm to Pa in one (N, 6) multiply
+        stresses = data[list(_PRESSURE_COLUMNS)].to_numpy(dtype=np.float64) * _PRESSURE_TO_STRESS
+        return stresses.astype(self.dtype, copy=False)
     
-    def calculate_stress_rates(self, stresses: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    def calculate_stress_rates(self, stresses: StrainStress) -> StrainStress:
         """
         Calculate stress rate components
         
         Args:
-            stresses: Dictionary with stress components
+            stresses: (N, 6) array of stress components
             
         Returns:
-            Dictionary with stress rate components
+            (N, 6) array of stress rate components (first row 0)
         """
-        stress_rates = {}
+        # One row-wise difference over the whole block
+        stress_rates = np.empty_like(stresses)
+        stress_rates[:1] = 0.0
+        np.subtract(stresses[1:], stresses[:-1], out=stress_rates[1:])
         
-        for key, stress_array in stresses.items():
-            # Calculate differences (rates)
-            rate = np.concatenate([[0], np.diff(stress_array)])
-            stress_rates[f'd{key}'] = rate
-            
         return stress_rates
     
     def calculate_volume_and_derivatives(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
@@ -162,113 +306,79 @@ class ThermomechanicalProcessor:
         Returns:
             Tuple of (volume, volume_rate)
         """
-        volume = np.array(data['vol'].values)
-        volume_rate = np.concatenate([[0], np.diff(volume)])
+        # View of the parsed float64 column, no copy (nothing downstream writes to it)
+        volume = data['vol'].to_numpy(dtype=np.float64)
+        volume_rate = np.diff(volume, prepend=volume[:1])
         
         return volume, volume_rate
     
-    def calculate_elastic_plastic_decomposition(self, strains: Dict[str, np.ndarray], 
-                                              stress_rates: Dict[str, np.ndarray]) -> Tuple[Dict, Dict]:
+    def calculate_elastic_plastic_decomposition(self, strains: StrainStress, 
+                                              stress_rates: StrainStress) -> Tuple[StrainStress, StrainStress]:
         """
         Calculate elastic and plastic strain decomposition
         
         Args:
-            strains: Dictionary with total strain components
-            stress_rates: Dictionary with stress rate components
+            strains: (N, 6) array of total strain components
+            stress_rates: (N, 6) array of stress rate components
             
         Returns:
-            Tuple of (elastic_strains, plastic_strains) dictionaries
+            Tuple of (elastic_strains, plastic_strains) (N, 6) arrays
         """
         if self.compliance_parameters is None:
             raise ValueError("Compliance parameters not set. Call set_compliance_parameters first.")
         
-        # Calculate elastic strain increments
-        stress_rate_list = [
-            stress_rates['ds1'], stress_rates['ds2'], stress_rates['ds3'],
-            stress_rates['ds4'], stress_rates['ds5'], stress_rates['ds6']
-        ]
-        
-        elastic_strain_increments = calculate_elastic_strain(stress_rate_list, self.compliance_parameters)
+        if self._ep_kernel is None:
+            self._ep_kernel = make_elastic_plastic_kernel(*map(float, self.compliance_parameters))
         
-        # Calculate cumulative elastic strains
-        elastic_strains = {}
-        for i, key in enumerate(['e1', 'e2', 'e3', 'e4', 'e5', 'e6']):
-            elastic_strains[key] = calculate_cumulative_sum(elastic_strain_increments[i])
-        
-        # Calculate plastic strains
-        total_strain_list = [strains['e1'], strains['e2'], strains['e3'], 
-                           strains['e4'], strains['e5'], strains['e6']]
-        elastic_strain_list = [elastic_strains['e1'], elastic_strains['e2'], elastic_strains['e3'],
-                             elastic_strains['e4'], elastic_strains['e5'], elastic_strains['e6']]
-        
-        plastic_strain_list = calculate_plastic_strain(total_strain_list, elastic_strain_list)
-        
-        plastic_strains = {}
-        for i, key in enumerate(['e1', 'e2', 'e3', 'e4', 'e5', 'e6']):
-            plastic_strains[key] = plastic_strain_list[i]
-        
-        return elastic_strains, plastic_strains
+        # Elastic strain increments, their cumulative sum and the plastic remainder in one fused pass
+        return self._ep_kernel(np.ascontiguousarray(stress_rates, dtype=self.dtype),
+                               np.ascontiguousarray(strains, dtype=self.dtype))
     
-    def calculate_von_mises_quantities(self, strains: Dict[str, np.ndarray], 
-                                     stresses: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    def calculate_von_mises_quantities(self, strains: StrainStress, 
+                                     stresses: StrainStress) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate Von Mises equivalent strain and stress
         
         Args:
-            strains: Dictionary with strain components
-            stresses: Dictionary with stress components
+            strains: (N, 6) array of strain components
+            stresses: (N, 6) array of stress components
             
         Returns:
             Tuple of (von_mises_strain, von_mises_stress)
         """
-        strain_components = [strains['e1'], strains['e2'], strains['e3'], 
-                           strains['e4'], strains['e5'], strains['e6']]
-        stress_components = [stresses['s1'], stresses['s2'], stresses['s3'], 
-                           stresses['s4'], stresses['s5'], stresses['s6']]
-        
-        von_mises_strain = calculate_von_mises_strain(strain_components)
-        von_mises_stress = calculate_von_mises_stress(stress_components)
+        # Row-wise kernels over the Voigt blocks (JIT-compiled when Numba is available)
+        von_mises_strain = von_mises_strain_block(strains)
+        von_mises_stress = von_mises_stress_block(stresses)
         
         return von_mises_strain, von_mises_stress
     
-    def calculate_work_quantities(self, stresses: Dict[str, np.ndarray], 
-                                elastic_strains: Dict[str, np.ndarray],
-                                plastic_strains: Dict[str, np.ndarray],
-                                volume: np.ndarray) -> Dict[str, np.ndarray]:
+    def calculate_work_quantities(self, stresses: StrainStress, 
+                                elastic_strains: StrainStress,
+                                plastic_strains: StrainStress,
+                                volume_m3: np.ndarray) -> Dict[str, np.ndarray]:
         """
         Calculate work quantities (elastic and plastic)
         
         Args:
-            stresses: Dictionary with stress components
-            elastic_strains: Dictionary with elastic strain components
-            plastic_strains: Dictionary with plastic strain components
-            volume: Array of volume values
+            stresses: (N, 6) array of stress components
+            elastic_strains: (N, 6) array of elastic strain components
+            plastic_strains: (N, 6) array of plastic strain components
+            volume_m3: Array of volume values in m³
             
         Returns:
             Dictionary with work quantities
         """
-        # Scale factor for work calculation (volume in m³)
-        scale_factor = volume * ANGSTROM3_TO_M3
-        
-        # Calculate stress components list
-        stress_list = [stresses['s1'], stresses['s2'], stresses['s3'], 
-                      stresses['s4'], stresses['s5'], stresses['s6']]
-        elastic_list = [elastic_strains['e1'], elastic_strains['e2'], elastic_strains['e3'],
-                       elastic_strains['e4'], elastic_strains['e5'], elastic_strains['e6']]
-        plastic_list = [plastic_strains['e1'], plastic_strains['e2'], plastic_strains['e3'],
-                       plastic_strains['e4'], plastic_strains['e5'], plastic_strains['e6']]
-        
-        # Calculate work terms
-        work_elastic_terms = calculate_work_terms(stress_list, elastic_list, 1.0)
-        work_plastic_terms = calculate_work_terms(stress_list, plastic_list, 1.0)
-        
-        # Sum all components and apply volume scaling
-        work_elastic = sum(work_elastic_terms) * scale_factor
-        work_plastic = sum(work_plastic_terms) * scale_factor
-        
-        # Calculate cumulative work
-        work_elastic_cumsum = calculate_cumulative_sum(work_elastic)
-        work_plastic_cumsum = calculate_cumulative_sum(work_plastic)
+        # Row-wise stress·strain contraction in one fused pass, then volume scaling in place
+        # (accumulated in float64 whatever the block dtype: work feeds the Beta ratios)
+        work_elastic = np.einsum('ij,ij->i', stresses, elastic_strains, dtype=np.float64)
+        work_elastic *= volume_m3
+        work_plastic = np.einsum('ij,ij->i', stresses, plastic_strains, dtype=np.float64)
+        work_plastic *= volume_m3
+        
+        # Calculate cumulative work (np.cumsum's sequential order: the diff-based Beta
+        # columns amplify any reordering of this summation)
+        work_elastic_cumsum = calculate_cumulative_sum(work_elastic, out=np.empty_like(work_elastic))
+        work_plastic_cumsum = calculate_cumulative_sum(work_plastic, out=np.empty_like(work_plastic))
         
         return {
             'work_elastic': work_elastic,
@@ -277,31 +387,34 @@ class ThermomechanicalProcessor:
             'work_plastic_cumsum': work_plastic_cumsum
         }
     
-    def calculate_energy_quantities(self, data: pd.DataFrame, volume: np.ndarray) -> Dict[str, np.ndarray]:
+    def calculate_energy_quantities(self, data: pd.DataFrame, volume_m3: np.ndarray) -> Dict[str, np.ndarray]:
         """
         Calculate energy-related quantities
         
         Args:
             data: DataFrame with simulation data
-            volume: Array of volume values
+            volume_m3: Array of volume values in m³
             
         Returns:
             Dictionary with energy quantities
         """
         # Convert energy from eV to J and scale by volume
-        energy_scale = EV_TO_J * volume * ANGSTROM3_TO_M3
+        energy_scale = EV_TO_J * volume_m3
         
-        # Internal energy change (relative to first value)
-        internal_energy = (np.array(data['u'].values) - data['u'].values[0]) * energy_scale
+        # Internal energy change (relative to first value); the reference is read from
+        # the ndarray, not through Series indexing, and the result is scaled in place
+        u = data['u'].to_numpy(dtype=np.float64)
+        internal_energy = np.subtract(u, u[0])
+        internal_energy *= energy_scale
         
         # Heat flow (for NVE: negative kinetic energy change, for NVT: etally)
         if 'etally' in data.columns:
             # NVT ensemble
-            heat_flow = np.array(data['etally'].values) * energy_scale
+            heat_flow = data['etally'].to_numpy(dtype=np.float64) * energy_scale
         else:
             # NVE ensemble - use negative kinetic energy change
-            kinetic_energy = np.array(data['ek'].values) * energy_scale
-            heat_flow = -(kinetic_energy - kinetic_energy[0])
+            heat_flow = data['ek'].to_numpy(dtype=np.float64) * energy_scale
+            np.subtract(heat_flow[0], heat_flow, out=heat_flow)
         
         return {
             'internal_energy': internal_energy,
@@ -344,113 +457,116 @@ class ThermomechanicalProcessor:
             'Beta_1_int': beta_params[3]
         }
     
+    def _calculate_base_quantities(self, data: pd.DataFrame) -> Tuple:
+        """
+        Run the stages that only depend on the raw data: volume, strains, stresses and energies
+        
+        NumPy releases the GIL in these column passes, so above _PARALLEL_STAGE_MIN_ROWS
+        the stages overlap in a thread pool; short trajectories run them inline.
+        
+        Args:
+            data: Input simulation data
+            
+        Returns:
+            Tuple of (volume, volume_rate, volume_m3, strains, stresses, energy_quantities)
+        """
+        if len(data) < _PARALLEL_STAGE_MIN_ROWS:
+            volume, volume_rate = self.calculate_volume_and_derivatives(data)
+            volume_m3 = volume * ANGSTROM3_TO_M3
+            strains = self.calculate_strain_components(data)
+            stresses = self.calculate_stress_components(data, volume)
+            energy_quantities = self.calculate_energy_quantities(data, volume_m3)
+            return volume, volume_rate, volume_m3, strains, stresses, energy_quantities
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            strains_future = executor.submit(self.calculate_strain_components, data)
+            stresses_future = executor.submit(self.calculate_stress_components, data, None)
+            volume, volume_rate = self.calculate_volume_and_derivatives(data)
+            volume_m3 = volume * ANGSTROM3_TO_M3
+            energy_future = executor.submit(self.calculate_energy_quantities, data, volume_m3)
+            return (volume, volume_rate, volume_m3, strains_future.result(), stresses_future.result(),
+                    energy_future.result())
+    
     def process_complete_analysis(self, data: pd.DataFrame, 
-                                ensemble_type: str = 'nve') -> pd.DataFrame:
+                                ensemble_type: str = 'nve', compute_full: bool = True) -> pd.DataFrame:
         """
         Complete thermomechanical analysis pipeline
         
         Args:
             data: Input simulation data
             ensemble_type: Type of ensemble ('nve' or 'nvt')
+            compute_full: If False, only build the summary columns (step, Von Mises
+                strain and the Beta parameters) needed by filter_and_analyze
             
         Returns:
-            DataFrame with all calculated quantities
+            DataFrame with all calculated quantities (or the summary columns)
         """
         if self.compliance_parameters is None:
             raise ValueError("Compliance parameters not set. Call set_compliance_parameters first.")
         
-        # Calculate basic quantities
-        volume, volume_rate = self.calculate_volume_and_derivatives(data)
-        strains = self.calculate_strain_components(data)
-        stresses = self.calculate_stress_components(data, volume)
+        # Calculate basic quantities (independent stages, threaded for long trajectories);
+        # the volume in m³ is computed once and shared by the work and energy stages
+        volume, volume_rate, volume_m3, strains, stresses, energy_quantities = self._calculate_base_quantities(data)
         stress_rates = self.calculate_stress_rates(stresses)
         
         # Elastic-plastic decomposition
         elastic_strains, plastic_strains = self.calculate_elastic_plastic_decomposition(strains, stress_rates)
         
-        # Von Mises quantities
-        von_mises_strain, von_mises_stress = self.calculate_von_mises_quantities(strains, stresses)
-        von_mises_elastic, _ = self.calculate_von_mises_quantities(elastic_strains, stresses)
-        von_mises_plastic, _ = self.calculate_von_mises_quantities(plastic_strains, stresses)
-        
         # Work quantities
-        work_quantities = self.calculate_work_quantities(stresses, elastic_strains, plastic_strains, volume)
-        
-        # Energy quantities
-        energy_quantities = self.calculate_energy_quantities(data, volume)
+        work_quantities = self.calculate_work_quantities(stresses, elastic_strains, plastic_strains, volume_m3)
         
         # TQC parameters
         tqc_parameters = self.calculate_tqc_parameters(work_quantities, energy_quantities, ensemble_type)
+        beta_blocks = (tqc_parameters['Beta_0_diff'], tqc_parameters['Beta_0_int'],
+                       tqc_parameters['Beta_1_diff'], tqc_parameters['Beta_1_int'])
+        
+        von_mises_strain = von_mises_strain_block(strains)
+        
+        if not compute_full:
+            # Summary only: skip the remaining Von Mises kernels and the ~40 full-table columns
+            results = _assemble_results(data['step'].to_numpy(),
+                                        ((np.float64, (von_mises_strain, *beta_blocks)),),
+                                        _SUMMARY_COLUMNS, data.index)
+            self.processed_data = results
+            return results
+        
+        # Von Mises quantities (stress once, strain for the elastic/plastic blocks)
+        von_mises_stress = von_mises_stress_block(stresses)
+        von_mises_elastic = von_mises_strain_block(elastic_strains)
+        von_mises_plastic = von_mises_strain_block(plastic_strains)
         
         # Assemble results
-        results = pd.DataFrame({
-            # Original data
-            'step': data['step'],
-            'l_1': data['l_1'],
-            'l_2': data['l_2'], 
-            'l_3': data['l_3'],
-            'l_4': data['l_4'],
-            'l_5': data['l_5'],
-            'l_6': data['l_6'],
-            'volume': volume,
-            'volume_rate': volume_rate,
-            
-            # Strain components
-            'e1': strains['e1'],
-            'e2': strains['e2'],
-            'e3': strains['e3'],
-            'e4': strains['e4'],
-            'e5': strains['e5'],
-            'e6': strains['e6'],
-            
-            # Stress components
-            's1': stresses['s1'],
-            's2': stresses['s2'],
-            's3': stresses['s3'],
-            's4': stresses['s4'],
-            's5': stresses['s5'],
-            's6': stresses['s6'],
-            
-            # Elastic strains
-            'e1_elastic': elastic_strains['e1'],
-            'e2_elastic': elastic_strains['e2'],
-            'e3_elastic': elastic_strains['e3'],
-            'e4_elastic': elastic_strains['e4'],
-            'e5_elastic': elastic_strains['e5'],
-            'e6_elastic': elastic_strains['e6'],
-            
-            # Plastic strains
-            'e1_plastic': plastic_strains['e1'],
-            'e2_plastic': plastic_strains['e2'],
-            'e3_plastic': plastic_strains['e3'],
-            'e4_plastic': plastic_strains['e4'],
-            'e5_plastic': plastic_strains['e5'],
-            'e6_plastic': plastic_strains['e6'],
-            
-            # Von Mises quantities
-            'von_mises_strain': von_mises_strain,
-            'von_mises_stress': von_mises_stress,
-            'von_mises_elastic': von_mises_elastic,
-            'von_mises_plastic': von_mises_plastic,
-            
-            # Work quantities
-            'work_elastic': work_quantities['work_elastic_cumsum'],
-            'work_plastic': work_quantities['work_plastic_cumsum'],
-            
-            # Energy quantities
-            'internal_energy': energy_quantities['internal_energy'],
-            'heat_flow': energy_quantities['heat_flow'],
-            
-            # TQC parameters
-            'Beta_0_diff': tqc_parameters['Beta_0_diff'],
-            'Beta_0_int': tqc_parameters['Beta_0_int'],
-            'Beta_1_diff': tqc_parameters['Beta_1_diff'],
-            'Beta_1_int': tqc_parameters['Beta_1_int']
-        })
+        # (only the strain/stress blocks use the processor dtype; the rest stays float64)
+        groups = (
+            (np.float64, (data[list(_LENGTH_COLUMNS)].to_numpy(dtype=np.float64), volume, volume_rate)),
+            (self.dtype, (strains, stresses, elastic_strains, plastic_strains)),
+            (np.float64, (von_mises_strain, von_mises_stress, von_mises_elastic, von_mises_plastic,
+                          work_quantities['work_elastic_cumsum'], work_quantities['work_plastic_cumsum'],
+                          energy_quantities['internal_energy'], energy_quantities['heat_flow'],
+                          *beta_blocks)),
+        )
+        results = _assemble_results(data['step'].to_numpy(), groups, _RESULT_COLUMNS, data.index)
         
         self.processed_data = results
         return results
     
+    def _von_mises_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row order of processed_data by Von Mises strain, cached until processed_data changes
+        
+        Returns:
+            Tuple of (sort_idx, sorted_strain); NaN strains sort last and are left out
+            of sorted_strain, so they fall on neither side of any threshold
+        """
+        cached = self._vm_order_cache
+        if cached is None or cached[0] is not self.processed_data:
+            von_mises_strain = self.processed_data['von_mises_strain'].to_numpy()
+            sort_idx = np.argsort(von_mises_strain, kind='stable')
+            n_valid = len(von_mises_strain) - int(np.count_nonzero(np.isnan(von_mises_strain)))
+            cached = (self.processed_data, sort_idx, von_mises_strain[sort_idx[:n_valid]])
+            self._vm_order_cache = cached
+        return cached[1], cached[2]
+    
     def filter_and_analyze(self, threshold: float = 0.002, 
                           analysis_columns: Optional[List[str]] = None) -> Dict:
         """
@@ -469,13 +585,21 @@ class ThermomechanicalProcessor:
         if analysis_columns is None:
             analysis_columns = ['Beta_0_diff', 'Beta_0_int', 'Beta_1_diff', 'Beta_1_int']
         
+        # Binary search in the cached strain order instead of a full comparison pass;
+        # row positions are re-sorted so both selections keep the original row order
+        sort_idx, sorted_strain = self._von_mises_order()
+        cut = np.searchsorted(sorted_strain, threshold, side='right')
+        rows_below = np.sort(sort_idx[:cut])
+        rows_above = np.sort(sort_idx[cut:len(sorted_strain)])
+        
         # Filter data below threshold
-        filtered_data = filter_data_by_threshold(self.processed_data, 'von_mises_strain', threshold)
+        filtered_data = self.processed_data.iloc[rows_below]
         
         # Calculate averages above threshold
-        averages = calculate_averages_above_threshold(
-            self.processed_data, 'von_mises_strain', threshold, analysis_columns
-        )
+        averages = {}
+        if len(rows_above):
+            columns = [col for col in analysis_columns if col in self.processed_data.columns]
+            averages = self.processed_data[columns].iloc[rows_above].mean().to_dict()
         
         return {
             'filtered_data': filtered_data,
@@ -484,7 +608,7 @@ class ThermomechanicalProcessor:
         }
     
     def save_results(self, output_path: str, include_filtered: bool = False, 
-                    threshold: float = 0.002) -> bool:
+                    threshold: float = 0.002, buffer_size: Optional[int] = None) -> bool:
         """
         Save analysis results to file
         
@@ -492,6 +616,7 @@ class ThermomechanicalProcessor:
             output_path: Path for output file
             include_filtered: Whether to include filtered analysis
             threshold: Strain threshold for filtering
+            buffer_size: Write buffer in bytes for the results table (None for default)
             
         Returns:
             True if save successful, False otherwise
@@ -501,22 +626,27 @@ class ThermomechanicalProcessor:
         
         try:
             # Save main results
-            write_output_file(self.processed_data, output_path)
+            write_output_file(self.processed_data, output_path, buffer_size=buffer_size)
             
             # Save filtered analysis if requested
             if include_filtered:
                 analysis = self.filter_and_analyze(threshold)
                 
                 # Create summary file
-                summary_path = output_path.replace('.csv', '_summary.txt').replace('.txt', '_summary.txt')
-                with open(summary_path, 'w') as f:
-                    f.write(f"Thermomechanical Analysis Summary\n")
-                    f.write(f"{'='*40}\n\n")
-                    f.write(f"Strain threshold: {threshold}\n")
-                    f.write(f"Filtered data points: {len(analysis['filtered_data'])}\n\n")
-                    f.write("Final averages (above threshold):\n")
-                    for key, value in analysis['final_averages'].items():
-                        f.write(f"{key}: {value:.6f}\n")
+                summary_path = os.path.splitext(output_path)[0] + '_summary.txt'
+                lines = [
+                    "Thermomechanical Analysis Summary",
+                    '=' * 40,
+                    "",
+                    f"Strain threshold: {threshold}",
+                    f"Filtered data points: {len(analysis['filtered_data'])}",
+                    "",
+                    "Final averages (above threshold):",
+                    *(f"{key}: {value:.6f}" for key, value in analysis['final_averages'].items())
+                ]
+                # Format the whole summary first and write it in one call
+                with open(summary_path, 'w', buffering=1 << 16) as f:
+                    f.write('\n'.join(lines) + '\n')
                 
                 print(f"✅ Summary written to {summary_path}")
             
@@ -527,6 +657,4 @@ class ThermomechanicalProcessor:
             return False
     
     def close_connections(self):
-        """Close SFTP connections"""
-        if self.sftp_manager:
-            self.sftp_manager.close()
+        """Close SFTP connections (remote inputs are streamed per load, so none stay open here)"""
@@ -4,38 +4,52 @@ Main application interface for OVITO workflow backend
 Provides command-line interface and convenience functions
 """
 
-import argparse
+import functools
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
 import sys
 import os
-from typing import Dict, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
-# Add backend to path for both standalone and module execution
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Run as script: make the backend package importable once. Imported as
+# backend.main (or run with -m) the package already resolves on its own.
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# JSON parsing for config and cache files: orjson when installed (parses the
+# raw bytes directly), otherwise the standard library
 try:
-    # Try relative imports first (when run as module)
-    from .processors import process_nve_simulation, process_nvt_simulation, process_simulation_auto, process_dxa_analysis, process_ws_analysis, OVITO_PROCESSORS_AVAILABLE
-    from .processors.simulation_manager import run_complete_simulation_workflow
-    from .utils.ensemble_detector import detect_simulation_ensemble, analyze_data_format
-    from .core.elastic_constants import load_elastic_constants_from_directory
+    from orjson import loads as _json_loads
 except ImportError:
-    # Fall back to absolute imports (when run as script)
-    try:
-        from processors import process_nve_simulation, process_nvt_simulation, process_simulation_auto, process_dxa_analysis, process_ws_analysis, OVITO_PROCESSORS_AVAILABLE
-        from processors.simulation_manager import run_complete_simulation_workflow
-        from utils.ensemble_detector import detect_simulation_ensemble, analyze_data_format
-        from core.elastic_constants import load_elastic_constants_from_directory
-    except ImportError:
-        # Last resort - try with backend prefix
-        from backend.processors import process_nve_simulation, process_nvt_simulation, process_simulation_auto, process_dxa_analysis, process_ws_analysis, OVITO_PROCESSORS_AVAILABLE
-        from backend.processors.simulation_manager import run_complete_simulation_workflow
-        from backend.utils.ensemble_detector import detect_simulation_ensemble, analyze_data_format
-        from backend.core.elastic_constants import load_elastic_constants_from_directory
+    _json_loads = json.loads
+
+# Fixed console text of main()
+_BANNER = "🚀 OVITO Workflow Backend\n" + "=" * 50 + "\n"
+_OK = "\n🎉 Operation completed successfully!"
+_FAIL = "\n❌ Operation failed!"
+
+
+@functools.lru_cache(maxsize=1)
+def _ovito_available() -> bool:
+    """Whether OVITO is installed, found without importing it (the analysis stack is imported per command)"""
+    return importlib.util.find_spec("ovito") is not None
+
+
+def _lazy_import(name: str):
+    """
+    Import a backend submodule when a command first needs it
+    
+    Args:
+        name: Module path relative to the backend package (e.g. 'processors')
+        
+    Returns:
+        The imported module
+    """
+    return importlib.import_module(f".{name}", __package__ or "backend")
 
 
 def create_sftp_config_interactive() -> Dict:
@@ -51,39 +65,156 @@ def create_sftp_config_interactive() -> Dict:
     hostname = input("Hostname: ")
     username = input("Username: ")
     
+    # One interactive login is reused by every remote read in this run
     return {
         'hostname': hostname,
-        'username': username
+        'username': username,
+        'share_session': True
     }
 
 
+def _compliance_cache_file(elastic_dir: str, file_paths: List[str]) -> Optional[str]:
+    """
+    Cache file for the compliance derived from a local elastic directory
+    
+    Every command keys the cache on the same files: the directory's known
+    elastic constant files (ELASTIC_FILE_IDENTIFIERS). The name is a digest
+    of their resolved paths, mtimes and sizes, so editing, touching, adding
+    or removing one selects a new entry.
+    
+    Args:
+        elastic_dir: Local directory containing elastic constant files
+        file_paths: Files the caller computes (or computed) the compliance from
+        
+    Returns:
+        Path of the JSON cache entry (may not exist yet), or None if file_paths
+        is not exactly that file set (e.g. extra '*.txt' files), so the result
+        would differ and must not be shared
+    """
+    known_files = _lazy_import('config').ELASTIC_FILE_IDENTIFIERS
+    key_paths = sorted(os.path.realpath(os.path.join(elastic_dir, name))
+                       for name in os.listdir(elastic_dir) if name in known_files)
+    if not key_paths or key_paths != sorted(os.path.realpath(path) for path in file_paths):
+        return None
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for path in key_paths:
+        stat = os.stat(path)
+        digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    cache_dir = _lazy_import('config').CACHE_DIR
+    return os.path.join(cache_dir, 'compliance', f"{digest.hexdigest()}.json")
+
+
+def _read_cached_compliance(cache_file: str) -> Optional[Tuple[float, float, float]]:
+    """(S11, S12, S44) from a compliance cache entry, or None if absent or unreadable"""
+    try:
+        with open(cache_file, 'rb') as f:
+            params = _json_loads(f.read())
+        return (float(params['S11']), float(params['S12']), float(params['S44']))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_compliance(cache_file: str, params: Dict) -> None:
+    """Persist compliance parameters (best effort; an unwritable cache is ignored)"""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({key: float(params[key]) for key in ('S11', 'S12', 'S44')}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _cached_compliance(elastic_dir: str, n_jobs: int = 1) -> Optional[Tuple[float, float, float]]:
+    """
+    Compliance parameters for a local elastic directory, computed at most once
+    
+    Uses the same '*.txt' file set as the NVE/NVT processors. On a cache miss
+    the elastic constants are calculated here and persisted for later runs
+    (see _compliance_cache_file for when a directory is cacheable).
+    
+    Args:
+        elastic_dir: Local directory containing elastic constant files
+        n_jobs: Worker processes for parsing the files on a cache miss
+        
+    Returns:
+        Tuple of (S11, S12, S44), or None to let the processor handle the directory
+    """
+    file_paths = glob.glob(os.path.join(elastic_dir, '*.txt'))
+    if not file_paths:
+        return None
+    
+    try:
+        cache_file = _compliance_cache_file(elastic_dir, file_paths)
+    except OSError:
+        return None
+    if cache_file is None:
+        return None
+    
+    compliance_params = _read_cached_compliance(cache_file)
+    if compliance_params is not None:
+        print(f"♻️  Using cached compliance parameters for {elastic_dir}")
+        return compliance_params
+    
+    elastic_constants = _lazy_import('core.elastic_constants')
+    try:
+        results = elastic_constants.load_elastic_constants_from_directory(elastic_dir, pattern="*.txt", n_jobs=n_jobs)
+    except Exception:
+        # The processor recomputes and reports the failure
+        return None
+    
+    params = results['compliance_parameters']
+    _write_cached_compliance(cache_file, params)
+    return (params['S11'], params['S12'], params['S44'])
+
+
+_ELASTIC_REPORT_HEADER = "\n✅ Elastic Constants Results:\n" + "=" * 40 + "\n"
+_COMPLIANCE_REPORT_HEADER = "\nCompliance Parameters:\n"
+
+
+def _write_elastic_report(elastic_constants: Dict[str, float], params: Dict[str, float]) -> None:
+    """
+    Write the elastic constant and compliance summary to stdout in one call
+    
+    Args:
+        elastic_constants: Elastic constants (Pa) keyed by identifier
+        params: Compliance parameters with S11, S12 and S44 (Pa⁻¹)
+    """
+    constant_rows = [f"{const}: {value:.2e} Pa\n" for const, value in elastic_constants.items()]
+    compliance_rows = [f"{key}: {params[key]:.2e} Pa⁻¹\n" for key in ('S11', 'S12', 'S44')]
+    sys.stdout.write(_ELASTIC_REPORT_HEADER + "".join(constant_rows)
+                     + _COMPLIANCE_REPORT_HEADER + "".join(compliance_rows))
+
+
 def process_elastic_constants_only(args):
     """Process elastic constants calculation only"""
     print("🔧 Processing elastic constants...")
     
-    sftp_config = None
-    if args.remote:
-        sftp_config = create_sftp_config_interactive()
-    
     try:
-        results = load_elastic_constants_from_directory(
+        elastic_constants = _lazy_import('core.elastic_constants')
+        results = elastic_constants.load_elastic_constants_from_directory(
             args.elastic_dir,
             pattern="c*.txt",
             remote=args.remote,
-            sftp_config=sftp_config,
-            file_list=args.elastic_files.split(',') if args.elastic_files else None
+            sftp_config=args.sftp_config,
+            file_list=_parse_csv_flag(args.elastic_files),
+            n_jobs=args.jobs
         )
         
-        print("\n✅ Elastic Constants Results:")
-        print("=" * 40)
-        for const, value in results['elastic_constants'].items():
-            print(f"{const}: {value:.2e} Pa")
-        
-        print(f"\nCompliance Parameters:")
         params = results['compliance_parameters']
-        print(f"S11: {params['S11']:.2e} Pa⁻¹")
-        print(f"S12: {params['S12']:.2e} Pa⁻¹")
-        print(f"S44: {params['S44']:.2e} Pa⁻¹")
+        _write_elastic_report(results['elastic_constants'], params)
+        
+        # Let a following nve/nvt run on the same files skip the calculation
+        file_paths = glob.glob(os.path.join(args.elastic_dir, 'c*.txt')) if not args.remote else []
+        if file_paths:
+            try:
+                cache_file = _compliance_cache_file(args.elastic_dir, file_paths)
+            except OSError:
+                cache_file = None
+            if cache_file:
+                _write_cached_compliance(cache_file, params)
         
         return True
         
@@ -92,50 +223,86 @@ def process_elastic_constants_only(args):
         return False
 
 
+def _parse_csv_flag(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated flag value such as --elastic-files (None when unset)"""
+    return value.split(',') if value else None
+
+
+def _parse_compliance_flag(value: str) -> Tuple[float, float, float]:
+    """
+    Parse --compliance "S11,S12,S44" without importing numpy
+    
+    Args:
+        value: Comma-separated compliance values
+        
+    Returns:
+        Tuple of (S11, S12, S44)
+        
+    Raises:
+        ValueError: If the value is not exactly three numbers
+    """
+    items = value.split(',')
+    if len(items) != 3:
+        raise ValueError("Need exactly 3 compliance values")
+    values = []
+    for item in items:
+        try:
+            values.append(float(item))
+        except ValueError:
+            raise ValueError(f"Invalid compliance value '{item.strip()}' in '{value}'") from None
+    return tuple(values)
+
+
 def process_simulation_data(args):
     """Process simulation data (NVE or NVT)"""
+    # The nve/nvt subcommand name is the ensemble unless a caller set one
+    args.ensemble = getattr(args, 'ensemble', None) or args.command
     print(f"⚙️  Processing {args.ensemble.upper()} simulation...")
     
-    # Set up SFTP if remote
-    sftp_config = None
-    if args.remote:
-        sftp_config = create_sftp_config_interactive()
-    
     # Set up compliance parameters or elastic constants
     compliance_params = None
     if args.compliance:
         try:
-            values = [float(x.strip()) for x in args.compliance.split(',')]
-            if len(values) != 3:
-                raise ValueError("Need exactly 3 compliance values")
-            compliance_params = (values[0], values[1], values[2])  # Explicit tuple creation
-            print(f"🔧 Using compliance parameters: S11={values[0]:.2e}, S12={values[1]:.2e}, S44={values[2]:.2e}")
+            compliance_params = _parse_compliance_flag(args.compliance)
+            print("🔧 Using compliance parameters: S11={:.2e}, S12={:.2e}, S44={:.2e}".format(*compliance_params))
         except ValueError as e:
             print(f"❌ Error parsing compliance parameters: {e}")
             return False
+    elif args.elastic_dir and not args.remote and not args.no_cache:
+        compliance_params = _cached_compliance(args.elastic_dir, n_jobs=args.jobs)
+    
+    # With --cache-dir, parsed input tables are kept there so repeated runs on one file skip the text parse
+    cache_dir = None if args.no_cache else args.cache_dir
     
     # Choose processor based on ensemble
+    processors = _lazy_import('processors')
     if args.ensemble.lower() == 'nve':
-        success = process_nve_simulation(
+        success = processors.process_nve_simulation(
             args.input_file,
             args.output_file,
             elastic_constants_dir=args.elastic_dir,
-            elastic_files=args.elastic_files.split(',') if args.elastic_files else None,
+            elastic_files=_parse_csv_flag(args.elastic_files),
             remote=args.remote,
-            sftp_config=sftp_config,
+            sftp_config=args.sftp_config,
             compliance_params=compliance_params,
-            strain_threshold=args.threshold
+            strain_threshold=args.threshold,
+            cache_dir=cache_dir,
+            n_jobs=args.jobs,
+            csv_buffer_bytes=args.csv_buffer_mb * 1024 * 1024
         )
     elif args.ensemble.lower() == 'nvt':
-        success = process_nvt_simulation(
+        success = processors.process_nvt_simulation(
             args.input_file,
             args.output_file,
             elastic_constants_dir=args.elastic_dir,
-            elastic_files=args.elastic_files.split(',') if args.elastic_files else None,
+            elastic_files=_parse_csv_flag(args.elastic_files),
             remote=args.remote,
-            sftp_config=sftp_config,
+            sftp_config=args.sftp_config,
             compliance_params=compliance_params,
-            strain_threshold=args.threshold
+            strain_threshold=args.threshold,
+            cache_dir=cache_dir,
+            n_jobs=args.jobs,
+            csv_buffer_bytes=args.csv_buffer_mb * 1024 * 1024
         )
     else:
         print(f"❌ Unknown ensemble type: {args.ensemble}")
@@ -144,49 +311,71 @@ def process_simulation_data(args):
     return success
 
 
+def _frames_array(frames: Optional[List[int]]):
+    """--frames as one contiguous int32 array, built once (None for all frames)"""
+    if not frames:
+        return None
+    np = importlib.import_module('numpy')
+    return np.asarray(frames, dtype=np.int32)
+
+
+@functools.lru_cache(maxsize=None)
+def _gpu_available() -> bool:
+    """Cheap CUDA presence check (NVIDIA driver on Linux, an installed CuPy elsewhere), cached per process"""
+    if sys.platform.startswith('linux'):
+        return os.path.exists('/proc/driver/nvidia/version')
+    return importlib.util.find_spec('cupy') is not None
+
+
+def _use_gpu(args) -> bool:
+    """GPU acceleration for OVITO unless --no-gpu is given or no CUDA device can exist"""
+    if args.no_gpu:
+        return False
+    if not _gpu_available():
+        print("💻 No NVIDIA driver found - skipping the OVITO GPU setup")
+        return False
+    return True
+
+
 def process_dxa_command(args):
     """Process DXA analysis command"""
-    if not OVITO_PROCESSORS_AVAILABLE:
+    if not _ovito_available():
         print("❌ DXA analysis requires OVITO. Install with: pip install ovito")
         return False
     
     print("🔬 Processing DXA (Dislocation Analysis)...")
     
-    sftp_config = None
-    if args.remote:
-        sftp_config = create_sftp_config_interactive()
-    
-    return process_dxa_analysis(
+    dxa_processor = _lazy_import('processors.dxa_processor')
+    return dxa_processor.process_dxa_analysis(
         input_pattern=args.input_pattern,
         reference_file=args.reference_file,
         output_file=args.output_file,
-        frames=args.frames,
+        frames=_frames_array(args.frames),
         remote=args.remote,
-        sftp_config=sftp_config,
-        gpu_enabled=not args.no_gpu
+        sftp_config=args.sftp_config,
+        gpu_enabled=_use_gpu(args),
+        n_jobs=args.jobs
     )
 
 
 def process_ws_command(args):
     """Process WS vacancy analysis command"""
-    if not OVITO_PROCESSORS_AVAILABLE:
+    if not _ovito_available():
         print("❌ WS analysis requires OVITO. Install with: pip install ovito")
         return False
     
     print("🔬 Processing WS (Wigner-Seitz Vacancy Analysis)...")
     
-    sftp_config = None
-    if args.remote:
-        sftp_config = create_sftp_config_interactive()
-    
-    return process_ws_analysis(
+    ws_processor = _lazy_import('processors.ws_processor')
+    return ws_processor.process_ws_analysis(
         input_pattern=args.input_pattern,
         reference_file=args.reference_file,
         output_file=args.output_file,
-        frames=args.frames,
+        frames=_frames_array(args.frames),
         remote=args.remote,
-        sftp_config=sftp_config,
-        gpu_enabled=not args.no_gpu
+        sftp_config=args.sftp_config,
+        gpu_enabled=_use_gpu(args),
+        n_jobs=args.jobs
     )
 
 
@@ -196,13 +385,13 @@ def process_simulation_workflow_command(args):
     
     # Get SFTP configuration
     if hasattr(args, 'config') and args.config and os.path.exists(args.config):
-        import json
-        with open(args.config, 'r') as f:
-            sftp_config = json.load(f)
+        with open(args.config, 'rb') as f:
+            sftp_config = _json_loads(f.read())
     else:
         sftp_config = create_sftp_config_interactive()
     
-    return run_complete_simulation_workflow(
+    simulation_manager = _lazy_import('processors.simulation_manager')
+    return simulation_manager.run_complete_simulation_workflow(
         local_path=args.local_path,
         remote_path=args.remote_path,
         nve_output=args.nve_output,
@@ -217,16 +406,21 @@ def process_auto_command(args):
     print("🔍 Auto-detecting simulation ensemble type...")
     
     # First analyze the file format
-    analysis = analyze_data_format(args.input_file)
-    
-    print(f"📊 File Analysis Results:")
-    print(f"  📁 File: {args.input_file}")
-    print(f"  📏 Size: {analysis['file_size']:,} bytes")
-    print(f"  📊 Columns: {analysis['num_columns']}")
-    print(f"  📋 Has header: {'Yes' if analysis['has_header'] else 'No'}")
-    print(f"  🧪 Has etally: {'Yes' if analysis['has_etally'] else 'No'}")
-    print(f"  📈 Data lines: {analysis['data_lines']}")
-    print(f"  💬 Comment lines: {analysis['comment_lines']}")
+    ensemble_detector = _lazy_import('utils.ensemble_detector')
+    analysis = ensemble_detector.analyze_data_format(args.input_file)
+    
+    # One write for the whole report
+    sys.stdout.write("\n".join((
+        "📊 File Analysis Results:",
+        f"  📁 File: {args.input_file}",
+        f"  📏 Size: {analysis['file_size']:,} bytes",
+        f"  📊 Columns: {analysis['num_columns']}",
+        f"  📋 Has header: {'Yes' if analysis['has_header'] else 'No'}",
+        f"  🧪 Has etally: {'Yes' if analysis['has_etally'] else 'No'}",
+        f"  📈 Data lines: {analysis['data_lines']}",
+        f"  💬 Comment lines: {analysis['comment_lines']}",
+        "",
+    )))
     
     ensemble_type = analysis['ensemble_type']
     print(f"\n🔬 Detected ensemble: {ensemble_type.upper()}")
@@ -236,21 +430,19 @@ def process_auto_command(args):
     else:
         print("⚙️ Using NVE processor...")
     
-    # Get SFTP configuration if needed
-    sftp_config = None
-    if args.remote:
-        sftp_config = create_sftp_config_interactive()
-    
     # Process with auto-detection
-    success = process_simulation_auto(
+    processors = _lazy_import('processors')
+    success = processors.process_simulation_auto(
         simulation_file=args.input_file,
         output_file=args.output_file,
+        ensemble_type=ensemble_type,
         elastic_constants_dir=args.elastic_dir,
-        elastic_files=args.elastic_files.split(',') if args.elastic_files else None,
+        elastic_files=_parse_csv_flag(args.elastic_files),
         remote=args.remote,
-        sftp_config=sftp_config,
+        sftp_config=args.sftp_config,
         compliance_params=None,  # Could add compliance parsing here if needed
-        strain_threshold=getattr(args, 'threshold', 0.001)
+        strain_threshold=getattr(args, 'threshold', 0.001),
+        n_jobs=args.jobs
     )
     
     if success:
@@ -261,106 +453,436 @@ def process_auto_command(args):
     return success
 
 
-def main():
-    """Main command-line interface"""
+def process_batch_auto_command(args):
+    """Process every matching simulation file in a directory with auto-detected ensembles"""
+    print(f"🔍 Auto-detecting and processing {args.pattern} files in {args.input_dir}...")
+    
+    compliance_params = _parse_compliance_flag(args.compliance) if args.compliance else None
+    
+    processors = _lazy_import('processors')
+    results = processors.process_simulation_directory(
+        args.input_dir,
+        args.output_dir,
+        pattern=args.pattern,
+        workers=args.jobs,
+        elastic_constants_dir=args.elastic_dir,
+        compliance_params=compliance_params,
+        strain_threshold=args.threshold
+    )
+    
+    failed = [path for path, success in results.items() if not success]
+    print(f"\n📊 Processed {len(results) - len(failed)}/{len(results)} file(s) into {args.output_dir}")
+    for path in failed:
+        print(f"  ❌ {path}")
+    return bool(results) and not failed
+
+
+# Worker count when --jobs is not given
+_DEFAULT_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Worker count shared by every analysis subcommand: processes for file/frame
+# parallel work and threads for the Numba kernels. Half the cores by default,
+# since OVITO and the parallel kernels run threads of their own.
+_JOBS_ARGUMENT = (('--jobs', '--workers'), {
+    'type': int,
+    'default': None,
+    'help': f'Worker processes (and numeric kernel threads) to use (default: {_DEFAULT_JOBS}); '
+            'an explicit value above 1 also makes BLAS single-threaded',
+})
+
+# Cache and CSV output options shared by the nve and nvt subcommands
+_SIMULATION_OUTPUT_ARGUMENTS = (
+    ('--cache-dir', {
+        'help': 'Keep parsed input tables in this directory so repeated runs on the same file '
+                'skip the text parse (off by default; entries are not evicted, delete the directory to reclaim space)',
+    }),
+    ('--no-cache', {
+        'action': 'store_true',
+        'help': 'Ignore the on-disk caches (compliance from --elastic-dir, --cache-dir)',
+    }),
+    ('--csv-buffer-mb', {
+        'type': int,
+        'default': 8,
+        'help': 'Write buffer for the results CSV in MiB (default: 8)',
+    }),
+)
+
+# Subcommand definitions shared by the argparse parser, the fast path in
+# _parse_fast() and main()'s dispatch: name -> handler, help, description,
+# (flag, flag aliases tuple or dest, options) pairs and the local inputs
+# _check_inputs() verifies before any login, as (dest, 'file' | 'dir' |
+# 'pattern') pairs. Handlers import their processors lazily.
+_SUBCOMMANDS = {
+    'elastic': {
+        'handler': process_elastic_constants_only,
+        'local_inputs': (('elastic_dir', 'dir'),),
+        'help': 'Calculate elastic constants from stress-strain data',
+        'description': 'Calculate elastic constants using linear regression analysis of stress-strain relationships',
+        'arguments': (
+            ('elastic_dir', {
+                'help': 'Directory containing elastic constant files (c1144.txt, c2255.txt, c3366.txt, etc.)',
+            }),
+            ('--elastic-files', {
+                'help': 'Comma-separated list of specific elastic constant files to process',
+            }),
+            ('--remote', {
+                'action': 'store_true',
+                'help': 'Files are located on remote SFTP server (requires interactive authentication)',
+            }),
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'nve': {
+        'handler': process_simulation_data,
+        'local_inputs': (('input_file', 'file'), ('elastic_dir', 'dir')),
+        'help': 'Process NVE (microcanonical) ensemble simulation data',
+        'description': 'Complete thermomechanical analysis for NVE ensemble simulations including elastic-plastic decomposition and TQC analysis',
+        'arguments': (
+            ('input_file', {'help': 'Input simulation data file path (local or remote SFTP)'}),
+            ('output_file', {'help': 'Output results file path (CSV format)'}),
+            ('--elastic-dir', {
+                'help': 'Directory containing elastic constant files for compliance matrix calculation',
+            }),
+            ('--elastic-files', {
+                'help': 'Comma-separated list of elastic constant files (if different from default)',
+            }),
+            ('--compliance', {
+                'help': 'Pre-calculated compliance parameters as "S11,S12,S44" (Pa⁻¹) - skip elastic constants calculation',
+            }),
+            ('--remote', {'action': 'store_true', 'help': 'Input files are on remote SFTP server'}),
+            ('--threshold', {
+                'type': float,
+                'default': 0.002,
+                'help': 'Strain threshold for statistical analysis filtering (default: 0.002)',
+            }),
+            *_SIMULATION_OUTPUT_ARGUMENTS,
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'nvt': {
+        'handler': process_simulation_data,
+        'local_inputs': (('input_file', 'file'), ('elastic_dir', 'dir')),
+        'help': 'Process NVT (canonical) ensemble simulation data',
+        'description': 'Complete thermomechanical analysis for NVT ensemble simulations with temperature control effects',
+        'arguments': (
+            ('input_file', {'help': 'Input simulation data file path (local or remote SFTP)'}),
+            ('output_file', {'help': 'Output results file path (CSV format)'}),
+            ('--elastic-dir', {
+                'help': 'Directory containing elastic constant files for compliance matrix calculation',
+            }),
+            ('--elastic-files', {
+                'help': 'Comma-separated list of elastic constant files (if different from default)',
+            }),
+            ('--compliance', {
+                'help': 'Pre-calculated compliance parameters as "S11,S12,S44" (Pa⁻¹) - skip elastic constants calculation',
+            }),
+            ('--remote', {'action': 'store_true', 'help': 'Input files are on remote SFTP server'}),
+            ('--threshold', {
+                'type': float,
+                'default': 0.002,
+                'help': 'Strain threshold for statistical analysis filtering (default: 0.002)',
+            }),
+            *_SIMULATION_OUTPUT_ARGUMENTS,
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'auto': {
+        'handler': process_auto_command,
+        'local_inputs': (('input_file', 'file'), ('elastic_dir', 'dir')),
+        'help': 'Automatically detect ensemble type (NVE/NVT) and process simulation data',
+        'description': 'Automatically detect simulation ensemble type based on data format and run appropriate analysis',
+        'arguments': (
+            ('input_file', {'help': 'Input simulation data file'}),
+            ('output_file', {'help': 'Output CSV file for analysis results'}),
+            ('--elastic-dir', {
+                'help': 'Directory containing elastic constants files (c1144.txt, c2255.txt, etc.)',
+            }),
+            ('--elastic-files', {
+                'help': 'Comma-separated list of elastic constants files (for remote access)',
+            }),
+            ('--remote', {'action': 'store_true', 'help': 'Input files are on remote SFTP server'}),
+            ('--threshold', {
+                'type': float,
+                'default': 0.001,
+                'help': 'Strain threshold for statistical analysis filtering (default: 0.001)',
+            }),
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'batch-auto': {
+        'handler': process_batch_auto_command,
+        'local_inputs': (('input_dir', 'dir'), ('elastic_dir', 'dir')),
+        'help': 'Auto-detect and process every simulation file in a directory',
+        'description': 'Run the auto-detected NVE/NVT analysis on all matching files of a directory, several files at a time',
+        'arguments': (
+            ('input_dir', {'help': 'Directory containing simulation data files'}),
+            ('output_dir', {'help': 'Directory for the results (one CSV per input file)'}),
+            ('--pattern', {
+                'default': '*.txt',
+                'help': 'File name pattern selecting the simulation files (default: %(default)s)',
+            }),
+            ('--elastic-dir', {
+                'help': 'Directory containing elastic constants files (c1144.txt, c2255.txt, etc.)',
+            }),
+            ('--compliance', {
+                'help': 'Pre-calculated compliance parameters as "S11,S12,S44" (Pa⁻¹) - skip elastic constants calculation',
+            }),
+            ('--threshold', {
+                'type': float,
+                'default': 0.001,
+                'help': 'Strain threshold for statistical analysis filtering (default: 0.001)',
+            }),
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'dxa': {
+        'handler': process_dxa_command,
+        'local_inputs': (('input_pattern', 'pattern'), ('reference_file', 'file')),
+        'help': 'Perform DXA (Dislocation Analysis) using OVITO',
+        'description': 'Analyze dislocation evolution in molecular dynamics simulations using OVITO DXA',
+        'requires_ovito': True,
+        'arguments': (
+            ('input_pattern', {
+                'help': 'Input file pattern (local files or remote SFTP URL pattern)',
+            }),
+            ('reference_file', {'help': 'Reference structure file for DXA'}),
+            ('output_file', {'help': 'Output CSV file for dislocation analysis results'}),
+            ('--frames', {
+                'nargs': '+',
+                'type': int,
+                'help': 'Specific frame numbers to analyze (default: all frames)',
+            }),
+            ('--remote', {'action': 'store_true', 'help': 'Input files are on remote SFTP server'}),
+            ('--no-gpu', {
+                'action': 'store_true',
+                'help': 'Disable GPU acceleration for OVITO processing',
+            }),
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'ws': {
+        'handler': process_ws_command,
+        'local_inputs': (('input_pattern', 'pattern'), ('reference_file', 'file')),
+        'help': 'Perform WS (Wigner-Seitz) vacancy analysis using OVITO',
+        'description': 'Analyze vacancy evolution in molecular dynamics simulations using OVITO Wigner-Seitz analysis',
+        'requires_ovito': True,
+        'arguments': (
+            ('input_pattern', {
+                'help': 'Input file pattern (local files or remote SFTP URL pattern)',
+            }),
+            ('reference_file', {'help': 'Reference structure file for WS analysis'}),
+            ('output_file', {'help': 'Output CSV file for vacancy analysis results'}),
+            ('--frames', {
+                'nargs': '+',
+                'type': int,
+                'help': 'Specific frame numbers to analyze (default: all frames)',
+            }),
+            ('--remote', {'action': 'store_true', 'help': 'Input files are on remote SFTP server'}),
+            ('--no-gpu', {
+                'action': 'store_true',
+                'help': 'Disable GPU acceleration for OVITO processing',
+            }),
+            _JOBS_ARGUMENT,
+        ),
+    },
+    'simulate': {
+        'handler': process_simulation_workflow_command,
+        'local_inputs': (('local_path', 'dir'), ('config', 'file')),
+        'help': 'Complete simulation workflow: upload, run, monitor, and analyze',
+        'description': 'Complete MD simulation workflow from local files to remote HPC server with automatic analysis',
+        'arguments': (
+            ('local_path', {
+                'help': 'Local directory containing input files (*.lmp, in.*.lammps, run.*.sh, dbg.*.sh)',
+            }),
+            ('remote_path', {'help': 'Remote directory to upload files to and run simulation'}),
+            ('nve_output', {'help': 'Output file for NVE/NVT analysis results'}),
+            ('ws_output', {'help': 'Output file for Wigner-Seitz vacancy analysis results'}),
+            ('dxa_output', {'help': 'Output file for DXA dislocation analysis results'}),
+            ('--config', {
+                'help': 'SFTP configuration file (JSON format with hostname, username, etc.)',
+            }),
+        ),
+    },
+}
+
+
+def _check_inputs(args) -> Optional[str]:
+    """
+    Validate arguments that would otherwise only fail after the SFTP login or OVITO setup
+    
+    Local input paths must exist (remote ones cannot be checked before
+    logging in), --compliance must parse, --jobs must be positive and
+    --frames non-negative.
+    
+    Args:
+        args: Parsed command-line arguments
+        
+    Returns:
+        Error message, or None if the arguments look usable
+    """
+    if getattr(args, 'jobs', None) is not None and args.jobs < 1:
+        return f"--jobs must be at least 1 (got {args.jobs})"
+    if getattr(args, 'frames', None) and min(args.frames) < 0:
+        return f"--frames must be non-negative (got {min(args.frames)})"
+    if getattr(args, 'compliance', None):
+        try:
+            _parse_compliance_flag(args.compliance)
+        except ValueError as e:
+            return f"Error parsing compliance parameters: {e}"
+    
+    if getattr(args, 'remote', False):
+        return None
+    for dest, kind in _SUBCOMMANDS[args.command].get('local_inputs', ()):
+        path = getattr(args, dest, None)
+        # 'user@host:/path' URLs are fetched by the readers themselves (as in is_remote_path)
+        if not path or ('@' in path and ':' in path):
+            continue
+        if kind == 'dir' and not os.path.isdir(path):
+            return f"Directory not found: {path}"
+        if kind == 'file' and not os.path.isfile(path):
+            return f"File not found: {path}"
+        if kind == 'pattern' and not glob.glob(path):
+            return f"No files match: {path}"
+    return None
+
+
+def _add_subcommand(subparsers, name: str):
+    """Add one subcommand from _SUBCOMMANDS, skipping OVITO commands when unavailable"""
+    spec = _SUBCOMMANDS[name]
+    if spec.get('requires_ovito') and not _ovito_available():
+        return
+    
+    subparser = subparsers.add_parser(name, help=spec['help'], description=spec['description'])
+    for flag, options in spec['arguments']:
+        subparser.add_argument(*((flag,) if isinstance(flag, str) else flag), **options)
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_spec(name: str) -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, Dict]], Dict]:
+    """
+    Split a subcommand definition into positional dests, an option lookup and defaults
+    
+    Args:
+        name: Subcommand name
+        
+    Returns:
+        Tuple of (positional dests, {flag: (dest, options)}, {dest: default})
+    """
+    positionals = []
+    flags = {}
+    defaults = {'command': name}
+    for flag, options in _SUBCOMMANDS[name]['arguments']:
+        aliases = (flag,) if isinstance(flag, str) else flag
+        if aliases[0].startswith('-'):
+            # argparse names the dest after the first long flag
+            dest = aliases[0].lstrip('-').replace('-', '_')
+            flags.update((alias, (dest, options)) for alias in aliases)
+            defaults[dest] = False if options.get('action') == 'store_true' else options.get('default')
+        else:
+            positionals.append(flag)
+    return tuple(positionals), flags, defaults
+
+
+def _parse_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse a plain subcommand invocation without building an argparse parser
+    
+    Handles exact '--flag value', '--flag v1 v2 ...' (nargs='+') and
+    'store_true' options plus positionals. Anything else - help flags,
+    '--flag=value', abbreviations, values starting with '-', missing or
+    extra positionals, bad types - returns None so argparse can parse it
+    and report errors exactly as before.
+    
+    Args:
+        argv: Command-line arguments without the program name
+        
+    Returns:
+        Parsed arguments, or None to fall back to argparse
+    """
+    name = argv[0] if argv else None
+    spec = _SUBCOMMANDS.get(name)
+    if spec is None or (spec.get('requires_ovito') and not _ovito_available()):
+        return None
+    
+    positional_dests, flags, defaults = _fast_spec(name)
+    values = dict(defaults)
+    positionals = []
+    i, n = 1, len(argv)
+    try:
+        while i < n:
+            token = argv[i]
+            i += 1
+            if not token.startswith('-'):
+                positionals.append(token)
+                continue
+            
+            option = flags.get(token)
+            if option is None:
+                return None
+            dest, options = option
+            if options.get('action') == 'store_true':
+                values[dest] = True
+                continue
+            
+            convert = options.get('type', str)
+            if options.get('nargs') == '+':
+                items = []
+                while i < n and not argv[i].startswith('-'):
+                    items.append(convert(argv[i]))
+                    i += 1
+                if not items:
+                    return None
+                values[dest] = items
+            else:
+                if i >= n or argv[i].startswith('-'):
+                    return None
+                values[dest] = convert(argv[i])
+                i += 1
+    except ValueError:
+        return None
+    
+    if len(positionals) != len(positional_dests):
+        return None
+    values.update(zip(positional_dests, positionals))
+    return SimpleNamespace(**values)
+
+
+def _needs_help(argv: List[str]) -> bool:
+    """Whether this invocation can print the full help text (explicit -h/--help or no arguments)"""
+    return not argv or '-h' in argv or '--help' in argv
+
+
+def _help_epilog() -> str:
+    """Usage examples shown after the top-level help, kept in _help.txt next to this module"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), '_help.txt'),
+              encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str], with_help: bool = False) -> "argparse.ArgumentParser":
+    """
+    Build (once per process) the command-line parser for a subcommand
+    
+    Only the named subparser is constructed; the full set is built when
+    no known subcommand is given so top-level help and usage errors still
+    list every command. Parsing does not modify the parser, so repeated
+    main() calls from batch scripts reuse the cached instance. The usage
+    examples epilog is read from _help.txt only when help can be printed.
+    
+    Args:
+        command: Subcommand being invoked, or None
+        with_help: Attach the usage examples epilog
+        
+    Returns:
+        Configured argument parser
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="OVITO Workflow Backend - Thermomechanical Analysis Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-📋 DETAILED USAGE EXAMPLES:
-
-🔧 Elastic Constants Analysis:
-  # Local files (requires c1144.txt, c2255.txt, c3366.txt, etc.)
-  python main.py elastic ./elastic_data/
-  
-  # Remote SFTP files with specific file list
-  python main.py elastic user@server:/path/to/elastic/ --remote --elastic-files "c1144.txt,c2255.txt,c3366.txt"
-
-⚙️  NVE Simulation Processing:
-  # Local files with elastic constants calculation
-  python main.py nve simulation.txt results.csv --elastic-dir ./elastic_data/ --threshold 0.001
-  
-  # Remote simulation with known compliance parameters
-  python main.py nve user@server:/sim.txt output.csv --remote --compliance "1e-11,-2e-12,3e-11"
-  
-  # High-precision analysis with custom threshold
-  python main.py nve simulation.txt results.csv --elastic-dir ./elastic/ --threshold 0.0005
-
-🌡️  NVT Simulation Processing:
-  # Local NVT ensemble with elastic constants
-  python main.py nvt nvt_simulation.txt nvt_results.csv --elastic-dir ./elastic_data/
-  
-  # Remote NVT with pre-calculated compliance
-  python main.py nvt user@server:/nvt.txt output.csv --remote --compliance "1.2e-11,-1.8e-12,2.9e-11"
-
-🤖 Auto-Detection Processing:
-  # Automatically detect ensemble type (NVE/NVT) and process accordingly
-  python main.py auto simulation.txt results.csv --elastic-dir ./elastic_data/
-  
-  # Remote auto-detection with threshold adjustment
-  python main.py auto user@server:/data.txt output.csv --remote --threshold 0.0005
-  
-  # Auto-detection analyzes file format and uses appropriate processor:
-  # - Files with 'etally' column → NVT processor
-  # - Files without 'etally' column → NVE processor
-
-🔬 DXA Dislocation Analysis (requires OVITO):
-  # Local trajectory analysis
-  python main.py dxa "trajectory*.dump" reference.dump dislocation_results.csv
-  
-  # Remote analysis with specific frames
-  python main.py dxa user@server:/path/traj* reference.dump results.csv --remote --frames 0 100 200
-
-🧪 WS Vacancy Analysis (requires OVITO):
-  # Local trajectory with reference structure
-  python main.py ws "trajectory*.dump" reference.structure vacancy_results.csv
-  
-  # Remote analysis with GPU acceleration disabled
-  python main.py ws user@server:/path/traj* ref.dump results.csv --remote --no-gpu
-
-🎯 Complete Simulation Workflow:
-  # Upload files, run simulation, monitor, and analyze automatically
-  python main.py simulate ./input_files/ /remote/simulation/path/ nve_results.csv ws_results.csv dxa_results.csv
-  
-  # With SFTP configuration file
-  python main.py simulate ./local_files/ /hpc/user/sim001/ nve.csv ws.csv dxa.csv --config sftp_config.json
-  
-  Required input files: *.lmp, in.*.lammps, run.*.sh, dbg.*.sh
-  Monitors for restart.relax completion, then runs analyses on *d2-*.txt and shear/3.dump.shear-II.* files
-  # GPU-accelerated processing
-  python main.py dxa trajectory.dump reference.dump results.csv
-
-🧩 WS Vacancy Analysis (requires OVITO):
-  # Local vacancy evolution analysis
-  python main.py ws "simulation*.dump" perfect_crystal.dump vacancy_results.csv
-  
-  # Remote analysis with frame selection
-  python main.py ws user@server:/path/sim* reference.dump vacancies.csv --remote --frames 0 50 100
-  
-  # CPU-only processing
-  python main.py ws trajectory.dump reference.dump results.csv --no-gpu
-
-�📊 File Format Requirements:
-  Simulation Data: step, l_1, l_2, l_3, l_4, l_5, l_6, p_1, p_2, p_3, p_4, p_5, p_6, vol, ep, ek, u, t, rho, entropy[, etally]
-  Elastic Data: delta_exx, delta_eyy, delta_ezz, delta_exy, delta_eyz, delta_exz, delta_pxx, delta_pyy, delta_pzz, delta_pxy, delta_pyz, delta_pxz
-  OVITO Files: LAMMPS dump files, XYZ, CFG, or any format supported by OVITO
-
-🔐 Remote Access:
-  SFTP URL format: user@hostname:/path/to/file
-  Supports interactive authentication with OTP/2FA
-  Automatic file download and cleanup
-
-🎯 Analysis Features:
-  - Elastic constants calculation with linear regression
-  - Elastic-plastic strain decomposition
-  - Von Mises equivalent stress/strain
-  - Taylor-Quinney coefficient (TQC) analysis
-  - Work and energy balance computations
-  - Statistical filtering and averaging
-  - Dislocation density and evolution tracking (DXA)
-  - Vacancy concentration and structural analysis (WS)
-  - GPU-accelerated OVITO processing
-        """
+        epilog=_help_epilog() if with_help else None
     )
     
     parser.add_argument(
@@ -371,222 +893,75 @@ def main():
     
     subparsers = parser.add_subparsers(dest='command', help='Available analysis commands')
     
-    # Elastic constants command
-    elastic_parser = subparsers.add_parser(
-        'elastic', 
-        help='Calculate elastic constants from stress-strain data',
-        description='Calculate elastic constants using linear regression analysis of stress-strain relationships'
-    )
-    elastic_parser.add_argument(
-        'elastic_dir', 
-        help='Directory containing elastic constant files (c1144.txt, c2255.txt, c3366.txt, etc.)'
-    )
-    elastic_parser.add_argument(
-        '--elastic-files', 
-        help='Comma-separated list of specific elastic constant files to process'
-    )
-    elastic_parser.add_argument(
-        '--remote', 
-        action='store_true', 
-        help='Files are located on remote SFTP server (requires interactive authentication)'
-    )
-    
-    # NVE simulation command
-    nve_parser = subparsers.add_parser(
-        'nve', 
-        help='Process NVE (microcanonical) ensemble simulation data',
-        description='Complete thermomechanical analysis for NVE ensemble simulations including elastic-plastic decomposition and TQC analysis'
-    )
-    nve_parser.add_argument('input_file', help='Input simulation data file path (local or remote SFTP)')
-    nve_parser.add_argument('output_file', help='Output results file path (CSV format)')
-    nve_parser.add_argument(
-        '--elastic-dir', 
-        help='Directory containing elastic constant files for compliance matrix calculation'
-    )
-    nve_parser.add_argument(
-        '--elastic-files', 
-        help='Comma-separated list of elastic constant files (if different from default)'
-    )
-    nve_parser.add_argument(
-        '--compliance', 
-        help='Pre-calculated compliance parameters as "S11,S12,S44" (Pa⁻¹) - skip elastic constants calculation'
-    )
-    nve_parser.add_argument(
-        '--remote', 
-        action='store_true', 
-        help='Input files are on remote SFTP server'
-    )
-    nve_parser.add_argument(
-        '--threshold', 
-        type=float, 
-        default=0.002, 
-        help='Strain threshold for statistical analysis filtering (default: 0.002)'
-    )
-    
-    # NVT simulation command
-    nvt_parser = subparsers.add_parser(
-        'nvt', 
-        help='Process NVT (canonical) ensemble simulation data',
-        description='Complete thermomechanical analysis for NVT ensemble simulations with temperature control effects'
-    )
-    nvt_parser.add_argument('input_file', help='Input simulation data file path (local or remote SFTP)')
-    nvt_parser.add_argument('output_file', help='Output results file path (CSV format)')
-    nvt_parser.add_argument(
-        '--elastic-dir', 
-        help='Directory containing elastic constant files for compliance matrix calculation'
-    )
-    nvt_parser.add_argument(
-        '--elastic-files', 
-        help='Comma-separated list of elastic constant files (if different from default)'
-    )
-    nvt_parser.add_argument(
-        '--compliance', 
-        help='Pre-calculated compliance parameters as "S11,S12,S44" (Pa⁻¹) - skip elastic constants calculation'
-    )
-    nvt_parser.add_argument(
-        '--remote', 
-        action='store_true', 
-        help='Input files are on remote SFTP server'
-    )
-    nvt_parser.add_argument(
-        '--threshold', 
-        type=float, 
-        default=0.002, 
-        help='Strain threshold for statistical analysis filtering (default: 0.002)'
-    )
-    
-    # Auto-detection command
-    auto_parser = subparsers.add_parser(
-        'auto',
-        help='Automatically detect ensemble type (NVE/NVT) and process simulation data',
-        description='Automatically detect simulation ensemble type based on data format and run appropriate analysis'
-    )
-    auto_parser.add_argument('input_file', help='Input simulation data file')
-    auto_parser.add_argument('output_file', help='Output CSV file for analysis results')
-    auto_parser.add_argument(
-        '--elastic-dir', 
-        help='Directory containing elastic constants files (c1144.txt, c2255.txt, etc.)'
-    )
-    auto_parser.add_argument(
-        '--elastic-files', 
-        help='Comma-separated list of elastic constants files (for remote access)'
-    )
-    auto_parser.add_argument(
-        '--remote', 
-        action='store_true', 
-        help='Input files are on remote SFTP server'
-    )
-    auto_parser.add_argument(
-        '--threshold', 
-        type=float, 
-        default=0.001, 
-        help='Strain threshold for statistical analysis filtering (default: 0.001)'
-    )
+    for name in (command,) if command else _SUBCOMMANDS:
+        _add_subcommand(subparsers, name)
     
-    # DXA analysis command
-    if OVITO_PROCESSORS_AVAILABLE:
-        dxa_parser = subparsers.add_parser(
-            'dxa',
-            help='Perform DXA (Dislocation Analysis) using OVITO',
-            description='Analyze dislocation evolution in molecular dynamics simulations using OVITO DXA'
-        )
-        dxa_parser.add_argument('input_pattern', help='Input file pattern (local files or remote SFTP URL pattern)')
-        dxa_parser.add_argument('reference_file', help='Reference structure file for DXA')
-        dxa_parser.add_argument('output_file', help='Output CSV file for dislocation analysis results')
-        dxa_parser.add_argument(
-            '--frames', 
-            nargs='+', 
-            type=int, 
-            help='Specific frame numbers to analyze (default: all frames)'
-        )
-        dxa_parser.add_argument(
-            '--remote', 
-            action='store_true', 
-            help='Input files are on remote SFTP server'
-        )
-        dxa_parser.add_argument(
-            '--no-gpu', 
-            action='store_true', 
-            help='Disable GPU acceleration for OVITO processing'
-        )
-    
-    # WS vacancy analysis command
-    if OVITO_PROCESSORS_AVAILABLE:
-        ws_parser = subparsers.add_parser(
-            'ws',
-            help='Perform WS (Wigner-Seitz) vacancy analysis using OVITO',
-            description='Analyze vacancy evolution in molecular dynamics simulations using OVITO Wigner-Seitz analysis'
-        )
-        ws_parser.add_argument('input_pattern', help='Input file pattern (local files or remote SFTP URL pattern)')
-        ws_parser.add_argument('reference_file', help='Reference structure file for WS analysis')
-        ws_parser.add_argument('output_file', help='Output CSV file for vacancy analysis results')
-        ws_parser.add_argument(
-            '--frames', 
-            nargs='+', 
-            type=int, 
-            help='Specific frame numbers to analyze (default: all frames)'
-        )
-        ws_parser.add_argument(
-            '--remote', 
-            action='store_true', 
-            help='Input files are on remote SFTP server'
-        )
-        ws_parser.add_argument(
-            '--no-gpu', 
-            action='store_true', 
-            help='Disable GPU acceleration for OVITO processing'
-        )
+    return parser
+
+
+# BLAS/OpenMP pools sized at numpy's first import; capped to one thread when
+# --jobs runs several workers so they do not oversubscribe the cores
+_BLAS_THREAD_VARS = ('OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'OMP_NUM_THREADS')
+
+
+def _limit_blas_threads(jobs: Optional[int]) -> None:
+    """Single-threaded BLAS for every worker when more than one is requested (user settings win)"""
+    if jobs and jobs > 1:
+        for var in _BLAS_THREAD_VARS:
+            os.environ.setdefault(var, '1')
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main command-line interface"""
+    if argv is None:
+        argv = sys.argv[1:]
+    # Parse arguments, building an argparse parser only when the fast path declines
+    args = _parse_fast(argv)
+    if args is None:
+        command = argv[0] if argv and argv[0] in _SUBCOMMANDS else None
+        if command and _SUBCOMMANDS[command].get('requires_ovito') and not _ovito_available():
+            # Not registered without OVITO: build every command so the error lists them
+            command = None
+        parser = _build_parser(command, _needs_help(argv))
+        args = parser.parse_args(argv)
+        
+        if not args.command:
+            parser.print_help()
+            return 1
     
-    # Complete simulation workflow command
-    sim_parser = subparsers.add_parser(
-        'simulate',
-        help='Complete simulation workflow: upload, run, monitor, and analyze',
-        description='Complete MD simulation workflow from local files to remote HPC server with automatic analysis'
-    )
-    sim_parser.add_argument('local_path', help='Local directory containing input files (*.lmp, in.*.lammps, run.*.sh, dbg.*.sh)')
-    sim_parser.add_argument('remote_path', help='Remote directory to upload files to and run simulation')
-    sim_parser.add_argument('nve_output', help='Output file for NVE/NVT analysis results')
-    sim_parser.add_argument('ws_output', help='Output file for Wigner-Seitz vacancy analysis results')
-    sim_parser.add_argument('dxa_output', help='Output file for DXA dislocation analysis results')
-    sim_parser.add_argument(
-        '--config', 
-        help='SFTP configuration file (JSON format with hostname, username, etc.)'
-    )
+    # Must run before the command handlers trigger the first numpy import; only an
+    # explicit --jobs limits BLAS, default runs keep its own threading
+    if hasattr(args, 'jobs'):
+        _limit_blas_threads(args.jobs)
+        if args.jobs is None:
+            args.jobs = _DEFAULT_JOBS
     
-    # Parse arguments
-    args = parser.parse_args()
+    sys.stdout.write(_BANNER)
     
-    if not args.command:
-        parser.print_help()
+    # Fail on bad paths or values before asking for a password
+    error = _check_inputs(args) if args.command in _SUBCOMMANDS else None
+    if error:
+        print(f"❌ {error}")
+        print(_FAIL)
         return 1
     
-    print("🚀 OVITO Workflow Backend")
-    print("=" * 50)
-    
     # Execute command
     try:
-        if args.command == 'elastic':
-            success = process_elastic_constants_only(args)
-        elif args.command in ['nve', 'nvt']:
-            args.ensemble = args.command
-            success = process_simulation_data(args)
-        elif args.command == 'auto':
-            success = process_auto_command(args)
-        elif args.command == 'dxa':
-            success = process_dxa_command(args)
-        elif args.command == 'ws':
-            success = process_ws_command(args)
-        elif args.command == 'simulate':
-            success = process_simulation_workflow_command(args)
+        # One interactive login for the whole invocation; every handler reuses it
+        args.sftp_config = create_sftp_config_interactive() if getattr(args, 'remote', False) else None
+        
+        spec = _SUBCOMMANDS.get(args.command)
+        if spec is not None:
+            success = spec['handler'](args)
         else:
             print(f"❌ Unknown command: {args.command}")
             success = False
         
         if success:
-            print("\n🎉 Operation completed successfully!")
+            print(_OK)
             return 0
         else:
-            print("\n❌ Operation failed!")
+            print(_FAIL)
             return 1
             
     except KeyboardInterrupt:
@@ -597,5 +972,28 @@ def main():
         return 1
 
 
+def run(argv: List[str]) -> int:
+    """
+    Run one CLI invocation in-process and return its exit status
+    
+    For batch scripts processing many files from one interpreter: the
+    cached parsers, compiled kernels and SFTP sessions are reused between
+    calls, and usage errors, --help and --version return their status
+    instead of raising SystemExit.
+    
+    Args:
+        argv: Command-line arguments without the program name
+        
+    Returns:
+        Process exit status (0 on success)
+    """
+    try:
+        return main(list(argv))
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+
 if __name__ == "__main__":
     sys.exit(main())
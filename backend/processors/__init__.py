@@ -1,68 +1,236 @@
 #!/usr/bin/env python3
 """
 Processors package for OVITO workflow backend
+
+Exports are imported from their submodules on first access (PEP 562), so
+using one processor does not load the others or the OVITO analysis stack.
 """
 
-from .nve_processor import NVEProcessor, process_nve_simulation
-from .nvt_processor import NVTProcessor, process_nvt_simulation
+import functools
+import glob
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Optional
+
+# Public name -> module defining it (relative to this package)
+_LAZY_EXPORTS = {
+    'NVEProcessor': '.nve_processor',
+    'process_nve_simulation': '.nve_processor',
+    'NVTProcessor': '.nvt_processor',
+    'process_nvt_simulation': '.nvt_processor',
+    'detect_simulation_ensemble': '..utils.ensemble_detector',
+}
+
+# OVITO analysis processors (optional - require OVITO), resolved together
+_OVITO_EXPORTS = ('process_dxa_analysis', 'process_ws_analysis', 'OVITO_PROCESSORS_AVAILABLE')
 
-# Auto-detection utilities
-try:
+
+@functools.lru_cache(maxsize=1024)
+def _detect_cached(simulation_file: str, size: int, mtime_ns: int) -> str:
+    """Ensemble of a local file, cached per (path, size, mtime) so unchanged files are not rescanned"""
     from ..utils.ensemble_detector import detect_simulation_ensemble
-except ImportError:
-    from backend.utils.ensemble_detector import detect_simulation_ensemble
+    return detect_simulation_ensemble(simulation_file, verbose=True)
+
+
+def _detect_ensemble(simulation_file: str) -> str:
+    """Detect a file's ensemble, reusing the result while a local file is unchanged"""
+    try:
+        stat = os.stat(simulation_file)
+    except OSError:
+        from ..utils.ensemble_detector import detect_simulation_ensemble
+        return detect_simulation_ensemble(simulation_file, verbose=True)
+    return _detect_cached(simulation_file, stat.st_size, stat.st_mtime_ns)
 
-def process_simulation_auto(simulation_file: str, output_file: str, **kwargs) -> bool:
+
+def process_simulation_auto(simulation_file: str, output_file: str,
+                            ensemble_type: Optional[str] = None, **kwargs) -> bool:
     """
     Automatically detect ensemble type and process simulation data
     
     Args:
         simulation_file: Path to simulation data file
         output_file: Output file for results
+        ensemble_type: 'nve' or 'nvt' if already detected (skips re-reading the file)
         **kwargs: Additional arguments passed to the processor
-        
+    
     Returns:
         True if processing successful, False otherwise
     """
-    ensemble_type = detect_simulation_ensemble(simulation_file, verbose=True)
+    if ensemble_type is None:
+        ensemble_type = _detect_ensemble(simulation_file)
     
     if ensemble_type == 'nvt':
+        from .nvt_processor import process_nvt_simulation
         print("🌡️ Auto-detected NVT ensemble, using NVT processor...")
         return process_nvt_simulation(simulation_file, output_file, **kwargs)
     else:
+        from .nve_processor import process_nve_simulation
         print("⚙️ Auto-detected NVE ensemble, using NVE processor...")
         return process_nve_simulation(simulation_file, output_file, **kwargs)
 
-# OVITO analysis processors (optional imports - require OVITO)
-OVITO_PROCESSORS_AVAILABLE = False
-process_dxa_analysis = None
-process_ws_analysis = None
 
-try:
-    from .dxa_processor import process_dxa_analysis
-    from .ws_processor import process_ws_analysis
-    OVITO_PROCESSORS_AVAILABLE = True
-except ImportError:
-    OVITO_PROCESSORS_AVAILABLE = False
+def _process_file(ensemble_type: str, simulation_file: str, output_file: str,
+                  kwargs: Dict[str, Any]) -> bool:
+    """Process one file with its ensemble's processor (module-level so pool workers can run it)"""
+    if ensemble_type == 'nvt':
+        from .nvt_processor import process_nvt_simulation as process
+    else:
+        from .nve_processor import process_nve_simulation as process
+    return process(simulation_file, output_file, **kwargs)
+
+
+def _shared_compliance(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Processor arguments with the elastic constants directory resolved to compliance parameters once"""
+    elastic_constants_dir = kwargs.get('elastic_constants_dir')
+    if kwargs.get('compliance_params') or not elastic_constants_dir:
+        return kwargs
+    
+    print("🔍 Calculating elastic constants once for the batch...")
+    from ..core.elastic_constants import ElasticConstantsProcessor, load_elastic_constants_from_directory
+    if kwargs.get('remote'):
+        elastic_results = load_elastic_constants_from_directory(
+            elastic_constants_dir,
+            file_list=kwargs.get('elastic_files'),
+            remote=True,
+            sftp_config=kwargs.get('sftp_config')
+        )
+    else:
+        # The same file selection the processors use for a local directory
+        elastic_results = ElasticConstantsProcessor().process_complete_elastic_analysis(
+            glob.glob(f"{elastic_constants_dir}/*.txt"), False
+        )
+    params = elastic_results['compliance_parameters']
+    return {**kwargs, 'compliance_params': (params['S11'], params['S12'], params['S44'])}
+
+
+def process_simulation_batch(simulation_files: List[str], output_files: List[str],
+                             workers: int = 1, **kwargs) -> Dict[str, bool]:
+    """
+    Detect the ensemble of many simulation files and process them grouped by ensemble
+    
+    The elastic constants of elastic_constants_dir are computed once for
+    the whole batch. With several workers the files are processed in
+    parallel worker processes, each running its numeric kernels on one
+    thread unless n_jobs is given.
+    
+    Args:
+        simulation_files: Paths to simulation data files
+        output_files: Output file for each simulation file
+        workers: Worker processes processing files concurrently
+        **kwargs: Additional arguments passed to the processors
+    
+    Returns:
+        Dictionary mapping each simulation file to whether it was processed successfully
+    """
+    if len(simulation_files) != len(output_files):
+        raise ValueError("simulation_files and output_files must have the same length")
+    
+    groups: Dict[str, List[tuple]] = {}
+    for simulation_file, output_file in zip(simulation_files, output_files):
+        groups.setdefault(_detect_ensemble(simulation_file), []).append((simulation_file, output_file))
+    
+    if len(simulation_files) > 1:
+        kwargs = _shared_compliance(kwargs)
+    
+    if workers > 1 and len(simulation_files) > 1:
+        tasks = [(ensemble_type, simulation_file, output_file)
+                 for ensemble_type, files in groups.items() for simulation_file, output_file in files]
+        kwargs = {'n_jobs': 1, **kwargs}
+        print(f"🚀 Processing {len(tasks)} simulation(s) on {min(workers, len(tasks))} worker processes...")
+        # spawn: the numeric kernels' thread pools do not survive a fork
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            ensemble_types, files, outputs = zip(*tasks)
+            return dict(zip(files, executor.map(_process_file, ensemble_types, files, outputs, repeat(kwargs))))
+    
+    results = {}
+    for ensemble_type, files in groups.items():
+        if ensemble_type == 'nvt':
+            print(f"🌡️ Processing {len(files)} NVT simulation(s)...")
+        else:
+            print(f"⚙️ Processing {len(files)} NVE simulation(s)...")
+        for simulation_file, output_file in files:
+            results[simulation_file] = _process_file(ensemble_type, simulation_file, output_file, kwargs)
+    
+    return results
+
+
+def process_simulation_directory(directory: str, output_dir: str, pattern: str = "*.txt",
+                                 workers: Optional[int] = None, **kwargs) -> Dict[str, bool]:
+    """
+    Process every simulation file in a directory, detecting each file's ensemble
+    
+    Results are written to output_dir as <input name>.csv.
     
-    # Create fallback functions if OVITO is not available
-    def _dxa_fallback(*args, **kwargs):
-        print("❌ DXA analysis requires OVITO. Install with: pip install ovito")
-        return False
+    Args:
+        directory: Directory containing simulation data files
+        output_dir: Directory for the results (created if missing)
+        pattern: File name pattern selecting the simulation files
+        workers: Worker processes (None for half the available cores)
+        **kwargs: Additional arguments passed to the processors
     
-    def _ws_fallback(*args, **kwargs):
-        print("❌ WS analysis requires OVITO. Install with: pip install ovito")
-        return False
+    Returns:
+        Dictionary mapping each simulation file to whether it was processed successfully
+    """
+    simulation_files = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not simulation_files:
+        print(f"⚠️ No files matching {pattern} in {directory}")
+        return {}
     
-    process_dxa_analysis = _dxa_fallback
-    process_ws_analysis = _ws_fallback
+    os.makedirs(output_dir, exist_ok=True)
+    output_files = [os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + '.csv')
+                    for path in simulation_files]
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+    return process_simulation_batch(simulation_files, output_files, workers=workers, **kwargs)
+
+
+def _load_ovito_processors():
+    """Import the DXA/WS processors, or install fallbacks if OVITO cannot be imported"""
+    try:
+        from .dxa_processor import process_dxa_analysis
+        from .ws_processor import process_ws_analysis
+        available = True
+    except ImportError:
+        available = False
+        
+        # Create fallback functions if OVITO is not available
+        def process_dxa_analysis(*args, **kwargs):
+            print("❌ DXA analysis requires OVITO. Install with: pip install ovito")
+            return False
+        
+        def process_ws_analysis(*args, **kwargs):
+            print("❌ WS analysis requires OVITO. Install with: pip install ovito")
+            return False
+    
+    globals().update(process_dxa_analysis=process_dxa_analysis,
+                     process_ws_analysis=process_ws_analysis,
+                     OVITO_PROCESSORS_AVAILABLE=available)
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access and keep it"""
+    if name in _OVITO_EXPORTS:
+        _load_ovito_processors()
+        return globals()[name]
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'NVEProcessor',
-    'NVTProcessor', 
+    'NVTProcessor',
     'process_nve_simulation',
     'process_nvt_simulation',
     'process_simulation_auto',
+    'process_simulation_batch',
+    'process_simulation_directory',
     'detect_simulation_ensemble',
     'process_dxa_analysis',
     'process_ws_analysis',
@@ -6,30 +6,17 @@ Provides high-level interface for dislocation analysis using OVITO
 
 import os
 import sys
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence
 import pandas as pd
 
-# Add parent directory for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-try:
-    from ..core.ovito_analysis import DislocationAnalysis, save_dislocation_results, OVITO_AVAILABLE
-    from ..utils.sftp_utils import SFTPManager
-except ImportError:
-    try:
-        from core.ovito_analysis import DislocationAnalysis, save_dislocation_results, OVITO_AVAILABLE
-        from utils.sftp_utils import SFTPManager
-    except ImportError:
-        from backend.core.ovito_analysis import DislocationAnalysis, save_dislocation_results, OVITO_AVAILABLE
-        from backend.utils.sftp_utils import SFTPManager
+from ..core.ovito_analysis import DislocationAnalysis, save_dislocation_results, OVITO_AVAILABLE
+from ..utils.sftp_utils import SFTPManager
 
 
 def process_dxa_analysis(input_pattern: str, reference_file: str, output_file: str,
-                        frames: Optional[List[int]] = None, remote: bool = False,
-                        sftp_config: Optional[Dict] = None, gpu_enabled: bool = True) -> bool:
+                        frames: Optional[Sequence[int]] = None, remote: bool = False,
+                        sftp_config: Optional[Dict] = None, gpu_enabled: bool = True,
+                        n_jobs: Optional[int] = None) -> bool:
     """
     Process dislocation analysis on simulation data
     
@@ -37,10 +24,11 @@ def process_dxa_analysis(input_pattern: str, reference_file: str, output_file: s
         input_pattern: Pattern for input simulation files
         reference_file: Reference structure file for DXA
         output_file: Output CSV file for results
-        frames: List of frame numbers to analyze (None for all)
+        frames: Frame numbers to analyze, list or int array (None for all)
         remote: Whether files are on remote server
         sftp_config: SFTP configuration if remote=True
         gpu_enabled: Enable GPU acceleration
+        n_jobs: Worker processes analyzing frames in parallel (None for half the cores)
         
     Returns:
         True if processing successful, False otherwise
@@ -64,8 +52,9 @@ def process_dxa_analysis(input_pattern: str, reference_file: str, output_file: s
     print(f"📊 Reference file: {reference_file}")
     print(f"🎯 Output file: {output_file}")
     
-    if frames:
-        print(f"🔢 Analyzing frames: {frames[:5]}{'...' if len(frames) > 5 else ''} ({len(frames)} total)")
+    if frames is not None and len(frames):
+        print(f"🔢 Analyzing frames: {[int(frame) for frame in frames[:5]]}"
+              f"{'...' if len(frames) > 5 else ''} ({len(frames)} total)")
     else:
         print("🔢 Analyzing all available frames")
     
@@ -80,7 +69,8 @@ def process_dxa_analysis(input_pattern: str, reference_file: str, output_file: s
             reference_file=reference_file,
             frames=frames,
             remote=remote,
-            sftp_config=sftp_config
+            sftp_config=sftp_config,
+            nproc=n_jobs
         )
         
         if not results:
@@ -3,11 +3,13 @@
 Processor classes for NVE ensemble simulation analysis
 """
 
-from typing import Dict, Optional, List, Tuple
+import sys
+from typing import IO, Dict, Optional, List, Tuple, Union
 import pandas as pd
 
 from ..core.thermomechanical import ThermomechanicalProcessor
 from ..core.elastic_constants import ElasticConstantsProcessor
+from ..core._kernels import set_num_threads
 
 
 class NVEProcessor:
@@ -15,18 +17,23 @@ class NVEProcessor:
     Processor for NVE (microcanonical) ensemble simulations
     """
     
-    def __init__(self, sftp_config: Optional[Dict] = None):
+    def __init__(self, sftp_config: Optional[Dict] = None, cache_dir: Optional[str] = None,
+                 n_jobs: int = 1):
         """
         Initialize NVE processor
         
         Args:
             sftp_config: SFTP configuration dictionary
+            cache_dir: Directory for parsed local input files (None to disable)
+            n_jobs: Worker processes for parsing elastic constant files
         """
-        self.thermo_processor = ThermomechanicalProcessor(sftp_config)
+        self.sftp_config = sftp_config
+        self.n_jobs = n_jobs
+        self.thermo_processor = ThermomechanicalProcessor(sftp_config, cache_dir=cache_dir)
         self.elastic_processor = ElasticConstantsProcessor(sftp_config)
         self.ensemble_type = 'nve'
         
-    def process_simulation(self, simulation_file: str, 
+    def process_simulation(self, simulation_file: Union[str, IO[bytes]], 
                           elastic_constants_dir: Optional[str] = None,
                           elastic_files: Optional[List[str]] = None,
                           remote: bool = False,
@@ -35,7 +42,7 @@ class NVEProcessor:
         Complete NVE simulation processing pipeline
         
         Args:
-            simulation_file: Path to simulation data file
+            simulation_file: Path to simulation data file, or an open binary stream
             elastic_constants_dir: Directory containing elastic constant files
             elastic_files: List of elastic constant files (if remote)
             remote: Whether files are on remote server
@@ -65,13 +72,14 @@ class NVEProcessor:
                     elastic_constants_dir, 
                     file_list=elastic_files,
                     remote=remote,
-                    sftp_config=None  # Will handle SFTP internally
+                    sftp_config=self.sftp_config,  # Shares the simulation file's login
+                    n_jobs=self.n_jobs
                 )
             else:
                 import glob
                 file_paths = glob.glob(f"{elastic_constants_dir}/*.txt") if elastic_constants_dir else []
                 elastic_results = self.elastic_processor.process_complete_elastic_analysis(
-                    file_paths, remote
+                    file_paths, remote, n_jobs=self.n_jobs
                 )
             
             params = elastic_results['compliance_parameters']
@@ -89,23 +97,25 @@ class NVEProcessor:
         
         return results
     
-    def analyze_and_save(self, simulation_file: str, output_file: str,
+    def analyze_and_save(self, simulation_file: Union[str, IO[bytes]], output_file: str,
                         elastic_constants_dir: Optional[str] = None,
                         elastic_files: Optional[List[str]] = None,
                         remote: bool = False,
                         compliance_params: Optional[Tuple[float, float, float]] = None,
-                        strain_threshold: float = 0.002) -> bool:
+                        strain_threshold: float = 0.002,
+                        csv_buffer_bytes: Optional[int] = None) -> bool:
         """
         Complete analysis and save results
         
         Args:
-            simulation_file: Path to simulation data file
+            simulation_file: Path to simulation data file, or an open binary stream
             output_file: Path for output file
             elastic_constants_dir: Directory containing elastic constant files
             elastic_files: List of elastic constant files (if remote)
             remote: Whether files are on remote server
             compliance_params: Tuple of (S11, S12, S44) if known
             strain_threshold: Strain threshold for filtering analysis
+            csv_buffer_bytes: Write buffer for the results CSV (None for default)
             
         Returns:
             True if successful, False otherwise
@@ -119,7 +129,8 @@ class NVEProcessor:
             
             # Save results with filtered analysis
             success = self.thermo_processor.save_results(
-                output_file, include_filtered=True, threshold=strain_threshold
+                output_file, include_filtered=True, threshold=strain_threshold,
+                buffer_size=csv_buffer_bytes
             )
             
             if success:
@@ -127,9 +138,8 @@ class NVEProcessor:
                 
                 # Print summary statistics
                 analysis = self.thermo_processor.filter_and_analyze(strain_threshold)
-                print(f"\n📈 Summary Statistics (strain > {strain_threshold}):")
-                for key, value in analysis['final_averages'].items():
-                    print(f"   {key}: {value:.6f}")
+                rows = [f"   {key}: {value:.6f}\n" for key, value in analysis['final_averages'].items()]
+                sys.stdout.write(f"\n📈 Summary Statistics (strain > {strain_threshold}):\n" + "".join(rows))
             
             return success
             
@@ -144,19 +154,22 @@ class NVEProcessor:
 
 
 # Convenience function for standalone NVE processing
-def process_nve_simulation(simulation_file: str, 
+def process_nve_simulation(simulation_file: Union[str, IO[bytes]], 
                           output_file: str,
                           elastic_constants_dir: Optional[str] = None,
                           elastic_files: Optional[List[str]] = None,
                           remote: bool = False,
                           sftp_config: Optional[Dict] = None,
                           compliance_params: Optional[Tuple[float, float, float]] = None,
-                          strain_threshold: float = 0.002) -> bool:
+                          strain_threshold: float = 0.002,
+                          cache_dir: Optional[str] = None,
+                          n_jobs: Optional[int] = None,
+                          csv_buffer_bytes: Optional[int] = None) -> bool:
     """
     Standalone function to process NVE simulation
     
     Args:
-        simulation_file: Path to simulation data file
+        simulation_file: Path to simulation data file, or an open binary stream
         output_file: Path for output file
         elastic_constants_dir: Directory containing elastic constant files
         elastic_files: List of elastic constant files (if remote)
@@ -164,15 +177,22 @@ def process_nve_simulation(simulation_file: str,
         sftp_config: SFTP configuration if remote
         compliance_params: Tuple of (S11, S12, S44) if known
         strain_threshold: Strain threshold for filtering analysis
+        cache_dir: Directory for parsed local input files (None to disable)
+        n_jobs: Worker processes for file parsing and threads for the numeric
+            kernels (None keeps the defaults)
+        csv_buffer_bytes: Write buffer for the results CSV (None for default)
         
     Returns:
         True if successful, False otherwise
     """
-    processor = NVEProcessor(sftp_config)
+    if n_jobs:
+        set_num_threads(n_jobs)
+    processor = NVEProcessor(sftp_config, cache_dir=cache_dir, n_jobs=n_jobs or 1)
     try:
         return processor.analyze_and_save(
             simulation_file, output_file, elastic_constants_dir,
-            elastic_files, remote, compliance_params, strain_threshold
+            elastic_files, remote, compliance_params, strain_threshold,
+            csv_buffer_bytes
         )
     finally:
         processor.close_connections()
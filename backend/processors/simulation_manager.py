@@ -15,37 +15,14 @@ import paramiko
 from paramiko import SSHClient, SFTPClient
 import logging
 
-# Add parent directory for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-try:
-    from ..core.ovito_analysis import OVITO_AVAILABLE
-    from ..utils.sftp_utils import SFTPManager
-    from ..utils.ensemble_detector import detect_simulation_ensemble
-    from .nve_processor import process_nve_simulation
-    from .nvt_processor import process_nvt_simulation
-    from .ws_processor import process_ws_analysis
-    from .dxa_processor import process_dxa_analysis
-except ImportError:
-    try:
-        from core.ovito_analysis import OVITO_AVAILABLE
-        from utils.sftp_utils import SFTPManager
-        from utils.ensemble_detector import detect_simulation_ensemble
-        from nve_processor import process_nve_simulation
-        from nvt_processor import process_nvt_simulation
-        from ws_processor import process_ws_analysis
-        from dxa_processor import process_dxa_analysis
-    except ImportError:
-        from backend.core.ovito_analysis import OVITO_AVAILABLE
-        from backend.utils.sftp_utils import SFTPManager
-        from backend.utils.ensemble_detector import detect_simulation_ensemble
-        from backend.processors.nve_processor import process_nve_simulation
-        from backend.processors.nvt_processor import process_nvt_simulation
-        from backend.processors.ws_processor import process_ws_analysis
-        from backend.processors.dxa_processor import process_dxa_analysis
+from ..config.constants import SSH_KEEPALIVE_INTERVAL, RECONNECT_MAX_ATTEMPTS, RECONNECT_MAX_DELAY
+from ..core.ovito_analysis import OVITO_AVAILABLE
+from ..utils.sftp_utils import SFTPManager
+from ..utils.ensemble_detector import detect_simulation_ensemble
+from .nve_processor import process_nve_simulation
+from .nvt_processor import process_nvt_simulation
+from .ws_processor import process_ws_analysis
+from .dxa_processor import process_dxa_analysis
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -68,6 +45,7 @@ class SimulationManager:
         self.ssh_client: Optional[SSHClient] = None
         self.sftp_client: Optional[SFTPClient] = None
         self.connected = False
+        self.reconnects = 0  # successful reconnections after a dropped session
         
     def connect(self) -> bool:
         """
@@ -108,6 +86,8 @@ class SimulationManager:
                     port=port
                 )
             
+            # Keep idle sessions (e.g. while monitoring a job) from being dropped
+            self.ssh_client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
             self.sftp_client = self.ssh_client.open_sftp()
             self.connected = True
             logger.info(f"✅ Connected to {hostname}")
@@ -127,6 +107,35 @@ class SimulationManager:
         self.connected = False
         logger.info("🔌 Disconnected from remote server")
     
+    def _connection_lost(self) -> bool:
+        """Whether the SSH transport has dropped (as opposed to a failed remote operation)"""
+        transport = self.ssh_client.get_transport() if self.ssh_client else None
+        return transport is None or not transport.is_active()
+    
+    def _reconnect(self) -> bool:
+        """
+        Re-establish a dropped connection, retrying with exponential backoff
+        
+        Returns:
+            True once reconnected, False after RECONNECT_MAX_ATTEMPTS failures
+        """
+        for attempt in range(RECONNECT_MAX_ATTEMPTS):
+            delay = min(2 ** attempt, RECONNECT_MAX_DELAY)
+            logger.warning(f"🔄 Connection lost - reconnecting in {delay}s "
+                           f"(attempt {attempt + 1}/{RECONNECT_MAX_ATTEMPTS})")
+            time.sleep(delay)
+            try:
+                self.disconnect()
+            except Exception:
+                pass  # the old session is already broken
+            if self.connect():
+                self.reconnects += 1
+                logger.info(f"✅ Reconnected ({self.reconnects} reconnect(s) so far)")
+                return True
+        
+        logger.error(f"❌ Could not reconnect after {RECONNECT_MAX_ATTEMPTS} attempts")
+        return False
+    
     def upload_simulation_files(self, local_path: str, remote_path: str) -> bool:
         """
         Upload simulation files to remote server
@@ -257,6 +266,9 @@ class SimulationManager:
             
         Returns:
             True if simulation completed, False otherwise
+        
+        Raises:
+            Exception: If the connection dropped (so it is not mistaken for a missing file)
         """
         if not self.connected or not self.sftp_client:
             return False
@@ -266,12 +278,17 @@ class SimulationManager:
             self.sftp_client.stat(restart_file)
             return True
         except IOError:
+            if self._connection_lost():
+                raise
             return False
     
     def monitor_simulation(self, remote_path: str, job_id: str, check_interval: int = 3600) -> bool:
         """
         Monitor simulation progress by checking for completion file
         
+        A dropped connection is re-established (with backoff) and
+        monitoring continues rather than aborting the workflow.
+        
         Args:
             remote_path: Remote directory to monitor
             job_id: Job ID for reference
@@ -288,7 +305,16 @@ class SimulationManager:
             check_count += 1
             logger.info(f"🔍 Check #{check_count}: Looking for restart.relax...")
             
-            if self.check_simulation_completion(remote_path):
+            try:
+                completed = self.check_simulation_completion(remote_path)
+            except Exception:
+                if not self._connection_lost():
+                    raise
+                if not self._reconnect():
+                    return False
+                continue
+            
+            if completed:
                 logger.info("✅ Simulation completed! restart.relax file found")
                 return True
             
@@ -316,27 +342,16 @@ class SimulationManager:
             # Create local download directory
             os.makedirs(local_download_path, exist_ok=True)
             
-            # Download restart.relax file
-            restart_file = f"{remote_path}/restart.relax"
-            local_restart = os.path.join(local_download_path, "restart.relax")
-            self.sftp_client.get(restart_file, local_restart)
-            logger.info("📄 Downloaded restart.relax")
-            
-            # Download *d2-*.txt files
-            stdin, stdout, stderr = self.ssh_client.exec_command(f"ls {remote_path}/*d2-*.txt")
-            d2_files = stdout.read().decode().strip().split('\n')
-            
-            for d2_file in d2_files:
-                if d2_file:
-                    filename = os.path.basename(d2_file)
-                    local_file = os.path.join(local_download_path, filename)
-                    self.sftp_client.get(d2_file, local_file)
-                    logger.info(f"📄 Downloaded {filename}")
-            
-            # Download shear directory
-            shear_remote = f"{remote_path}/shear"
-            shear_local = os.path.join(local_download_path, "shear")
-            self._download_directory_recursive(shear_remote, shear_local)
+            # After a dropped connection, reconnect and start over (at most
+            # RECONNECT_MAX_ATTEMPTS times); files already downloaded completely are skipped
+            for restart in range(RECONNECT_MAX_ATTEMPTS + 1):
+                try:
+                    self._download_results_once(remote_path, local_download_path)
+                    break
+                except Exception:
+                    if (restart == RECONNECT_MAX_ATTEMPTS or not self._connection_lost()
+                            or not self._reconnect()):
+                        raise
             
             logger.info("✅ Results downloaded successfully")
             return True
@@ -345,6 +360,59 @@ class SimulationManager:
             logger.error(f"❌ Failed to download results: {e}")
             return False
     
+    def _download_results_once(self, remote_path: str, local_download_path: str):
+        """Download restart.relax, the *d2-*.txt files and the shear directory"""
+        # Download restart.relax file
+        restart_file = f"{remote_path}/restart.relax"
+        local_restart = os.path.join(local_download_path, "restart.relax")
+        self._download_file(restart_file, local_restart)
+        
+        # Download *d2-*.txt files
+        stdin, stdout, stderr = self.ssh_client.exec_command(f"ls {remote_path}/*d2-*.txt")
+        d2_files = stdout.read().decode().strip().split('\n')
+        
+        for d2_file in d2_files:
+            if d2_file:
+                filename = os.path.basename(d2_file)
+                local_file = os.path.join(local_download_path, filename)
+                self._download_file(d2_file, local_file)
+        
+        # Download shear directory
+        shear_remote = f"{remote_path}/shear"
+        shear_local = os.path.join(local_download_path, "shear")
+        self._download_directory_recursive(shear_remote, shear_local)
+    
+    def _download_file(self, remote_file: str, local_file: str,
+                       attrs: Optional[paramiko.SFTPAttributes] = None):
+        """
+        Download one file unless an identical copy (same size and mtime) is already present
+        
+        The local copy takes the remote modification time, so a resumed
+        download recognises the files it has already fetched.
+        
+        Args:
+            remote_file: Path to file on remote server
+            local_file: Local destination path
+            attrs: Remote file attributes if already known (e.g. from a listing)
+        """
+        if attrs is None:
+            attrs = self.sftp_client.stat(remote_file)
+        
+        filename = os.path.basename(local_file)
+        try:
+            local_stat = os.stat(local_file)
+        except OSError:
+            local_stat = None
+        if (local_stat is not None and attrs.st_size == local_stat.st_size
+                and attrs.st_mtime is not None and int(local_stat.st_mtime) == int(attrs.st_mtime)):
+            logger.info(f"⏭️ {filename} already downloaded")
+            return
+        
+        self.sftp_client.get(remote_file, local_file)
+        if attrs.st_mtime is not None:
+            os.utime(local_file, (attrs.st_atime or attrs.st_mtime, attrs.st_mtime))
+        logger.info(f"📄 Downloaded {filename}")
+    
     def _download_directory_recursive(self, remote_dir: str, local_dir: str):
         """Recursively download directory contents"""
         if not self.sftp_client:
@@ -360,10 +428,11 @@ class SimulationManager:
                 if hasattr(item, 'st_mode') and item.st_mode and (item.st_mode & 0o040000):  # Directory
                     self._download_directory_recursive(remote_item, local_item)
                 else:  # File
-                    self.sftp_client.get(remote_item, local_item)
-                    logger.info(f"📄 Downloaded {item.filename}")
+                    self._download_file(remote_item, local_item, item)
                     
         except Exception as e:
+            if self._connection_lost():
+                raise  # let download_results reconnect and resume
             logger.warning(f"⚠️ Error downloading directory {remote_dir}: {e}")
 
 
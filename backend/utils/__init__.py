@@ -3,8 +3,10 @@
 Utility modules for OVITO workflow backend
 """
 
-from .sftp_utils import SFTPManager
-from .file_utils import read_data_file, write_output_file, validate_file_access
+from .sftp_utils import SFTPManager, get_sftp_client
+from .file_utils import (
+    read_data_file, read_data_bytes, read_data_stream, write_output_file, validate_file_access
+)
 from .math_utils import (
     calculate_logarithmic_strain, calculate_engineering_strain,
     calculate_von_mises_strain, calculate_von_mises_stress,
@@ -16,7 +18,10 @@ from .math_utils import (
 
 __all__ = [
     'SFTPManager',
+    'get_sftp_client',
     'read_data_file',
+    'read_data_bytes',
+    'read_data_stream',
     'write_output_file', 
     'validate_file_access',
     'calculate_logarithmic_strain',
@@ -4,9 +4,52 @@ Ensemble Detection Utility
 Automatically detects simulation ensemble type (NVE/NVT) based on data file format
 """
 
+import mmap
 import os
 import sys
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
+
+# Leading lines inspected by analyze_data_format, and the initial byte window
+# searched for them (doubled until enough newlines are found)
+_ANALYSIS_SAMPLE_LINES = 100
+_SAMPLE_WINDOW_BYTES = 1 << 16
+
+
+def _sample_lines(data_file: str, max_lines: int) -> List[str]:
+    """
+    Return the first lines of a file without walking it line by line
+    
+    The file is memory-mapped and newlines are located with a vectorized
+    byte comparison over a window at the start of the file, so only the
+    pages holding the sample are read however large the file is.
+    
+    Args:
+        data_file: Path to the data file
+        max_lines: Number of leading lines to return
+        
+    Returns:
+        Decoded lines (without line terminators)
+    """
+    with open(data_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            window = min(_SAMPLE_WINDOW_BYTES, len(mm))
+            while True:
+                newlines = np.flatnonzero(np.frombuffer(mm, dtype=np.uint8, count=window) == 0x0A)
+                if len(newlines) >= max_lines:
+                    end = int(newlines[max_lines - 1])
+                    break
+                if window == len(mm):
+                    end = len(mm)
+                    break
+                window = min(window * 2, len(mm))
+            sample = mm[:end]
+    
+    return sample.decode('utf-8', errors='replace').split('\n')[:max_lines]
+
 
 def detect_simulation_ensemble(data_file: str, verbose: bool = False) -> str:
     """
@@ -111,43 +154,40 @@ def analyze_data_format(data_file: str) -> dict:
     analysis['file_size'] = os.path.getsize(data_file)
     
     try:
-        with open(data_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                if line_num > 100:  # Limit analysis to first 100 lines
-                    break
-                
-                line = line.strip()
-                if not line:
-                    continue
-                
-                if line.startswith('#'):
-                    analysis['comment_lines'] += 1
-                    # Check comment lines for etally
-                    if 'etally' in line.lower():
-                        analysis['has_etally'] = True
-                        analysis['ensemble_type'] = 'nvt'
-                    continue
-                
-                # Check for etally in any line
-                if 'etally' in line.lower():
+        for line in _sample_lines(data_file, _ANALYSIS_SAMPLE_LINES):
+            line = line.strip()
+            if not line:
+                continue
+            
+            lowered = line.lower()
+            if line.startswith('#'):
+                analysis['comment_lines'] += 1
+                # Check comment lines for etally
+                if 'etally' in lowered:
                     analysis['has_etally'] = True
                     analysis['ensemble_type'] = 'nvt'
-                
-                # Check if this looks like a header
-                if any(keyword in line.lower() for keyword in ['step', 'time', 'temp', 'press', 'vol']):
-                    analysis['has_header'] = True
-                    analysis['num_columns'] = len(line.split())
-                    continue
-                
-                # Try to parse as numerical data
-                try:
-                    values = line.split()
-                    float_values = [float(val) for val in values]
-                    analysis['data_lines'] += 1
-                    if analysis['num_columns'] == 0:
-                        analysis['num_columns'] = len(values)
-                except ValueError:
-                    continue
+                continue
+            
+            # Check for etally in any line
+            if 'etally' in lowered:
+                analysis['has_etally'] = True
+                analysis['ensemble_type'] = 'nvt'
+            
+            # Check if this looks like a header
+            if any(keyword in lowered for keyword in ['step', 'time', 'temp', 'press', 'vol']):
+                analysis['has_header'] = True
+                analysis['num_columns'] = len(line.split())
+                continue
+            
+            # Try to parse as numerical data
+            try:
+                values = line.split()
+                float_values = [float(val) for val in values]
+                analysis['data_lines'] += 1
+                if analysis['num_columns'] == 0:
+                    analysis['num_columns'] = len(values)
+            except ValueError:
+                continue
     
     except Exception:
         pass
@@ -5,9 +5,10 @@ Supports both local and remote files, CSV and TXT formats
 """
 
 import pandas as pd
+import io
 import os
 import tempfile
-from typing import List, Optional
+from typing import IO, List, Optional, Sequence
 from ..config.constants import SUPPORTED_FORMATS, CSV_DELIMITER, DEFAULT_DELIMITER, COMMENT_CHAR
 from .sftp_utils import is_remote_path, download_remote_file
 
@@ -32,7 +33,34 @@ def determine_file_format(file_path: str) -> str:
         return 'txt'
 
 
-def read_data_file(file_path: str, headers: List[str], **kwargs) -> pd.DataFrame:
+def _build_read_params(file_format: str, headers: Sequence[str], **kwargs) -> dict:
+    """
+    Build pandas read_csv parameters for the given file format
+    
+    Args:
+        file_format: File format ('csv' or 'txt')
+        headers: Column headers for the data
+        **kwargs: Additional arguments for pandas read_csv
+        
+    Returns:
+        Dictionary of read_csv keyword arguments
+    """
+    read_params = {
+        'comment': COMMENT_CHAR,
+        'names': headers,
+        'engine': 'c',
+        **kwargs
+    }
+    
+    if file_format == 'csv':
+        read_params['sep'] = CSV_DELIMITER
+    else:  # txt format
+        read_params['sep'] = r'\s+'
+    
+    return read_params
+
+
+def read_data_file(file_path: str, headers: Sequence[str], **kwargs) -> pd.DataFrame:
     """
     Read data file with automatic format detection
     
@@ -66,17 +94,8 @@ def read_data_file(file_path: str, headers: List[str], **kwargs) -> pd.DataFrame
         # Determine format and read accordingly
         file_format = determine_file_format(actual_file_path)
         
-        # Set default parameters
-        read_params = {
-            'comment': COMMENT_CHAR,
-            'names': headers,
-            **kwargs
-        }
-        
-        if file_format == 'csv':
-            read_params['sep'] = CSV_DELIMITER
-        else:  # txt format
-            read_params['delim_whitespace'] = True
+        # Set default parameters (C parser, memory-mapped local file)
+        read_params = _build_read_params(file_format, headers, **{'memory_map': True, **kwargs})
         
         # Read the file
         data = pd.read_csv(actual_file_path, **read_params)
@@ -97,20 +116,66 @@ def read_data_file(file_path: str, headers: List[str], **kwargs) -> pd.DataFrame
                 print(f"⚠️ Warning: Could not delete temporary file: {e}")
 
 
-def write_output_file(data: pd.DataFrame, output_path: str, separator: str = '\t') -> bool:
+def read_data_stream(stream: IO, headers: Sequence[str], file_name: str = '', **kwargs) -> pd.DataFrame:
+    """
+    Read data from an open file-like object (e.g. a remote SFTP file)
+    
+    Args:
+        stream: Readable file-like object, text or binary
+        headers: Column headers for the data
+        file_name: Original file name, used for format detection and messages
+        **kwargs: Additional arguments for pandas read_csv
+        
+    Returns:
+        DataFrame containing the data
+    """
+    read_params = _build_read_params(determine_file_format(file_name), headers, **kwargs)
+    data = pd.read_csv(stream, **read_params)
+    
+    print(f"✅ Successfully read {len(data)} rows from {os.path.basename(file_name)}")
+    return data
+
+
+def read_data_bytes(content: bytes, headers: Sequence[str], file_name: str = '', **kwargs) -> pd.DataFrame:
+    """
+    Read data from in-memory file content (e.g. streamed over SFTP)
+    
+    Args:
+        content: Raw file content
+        headers: Column headers for the data
+        file_name: Original file name, used for format detection and messages
+        **kwargs: Additional arguments for pandas read_csv
+        
+    Returns:
+        DataFrame containing the data
+    """
+    return read_data_stream(io.BytesIO(content), headers, file_name, **kwargs)
+
+
+def write_output_file(data: pd.DataFrame, output_path: str, separator: str = '\t',
+                      buffer_size: Optional[int] = None) -> bool:
     """
     Write processed data to output file
     
+    pandas formats the rows in chunks; a large buffer_size lets each chunk
+    reach the disk in a few large writes instead of one per 8 KiB block.
+    
     Args:
         data: DataFrame to write
         output_path: Path for output file
         separator: Column separator (default: tab)
+        buffer_size: Write buffer in bytes (None for the default file buffering)
         
     Returns:
         True if write successful, False otherwise
     """
     try:
-        data.to_csv(output_path, sep=separator, index=False)
+        if buffer_size:
+            # newline='' as pandas uses when it opens the path itself
+            with open(output_path, 'w', newline='', buffering=buffer_size) as f:
+                data.to_csv(f, sep=separator, index=False)
+        else:
+            data.to_csv(output_path, sep=separator, index=False)
         print(f"✅ Results written to {output_path}")
         return True
         
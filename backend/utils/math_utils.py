@@ -6,7 +6,7 @@ Contains functions for strain calculations, stress transformations, and statisti
 
 import numpy as np
 import pandas as pd
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 from ..config.constants import SMALL_NUMBER
 
 
@@ -149,17 +149,21 @@ def calculate_work_terms(stress_components: List[np.ndarray],
     return work_terms
 
 
-def calculate_cumulative_sum(incremental_values: np.ndarray) -> np.ndarray:
+def calculate_cumulative_sum(incremental_values: np.ndarray, 
+                             out: Optional[np.ndarray] = None,
+                             axis: Optional[int] = None) -> np.ndarray:
     """
     Calculate cumulative sum of incremental values
     
     Args:
         incremental_values: Array of incremental values
+        out: Optional output array (may be incremental_values itself for an in-place sum)
+        axis: Axis to sum along (None flattens the input first; 0 sums (N, k) arrays down the rows)
         
     Returns:
         Array of cumulative sums
     """
-    return np.cumsum(incremental_values)
+    return np.cumsum(incremental_values, axis=axis, out=out)
 
 
 def calculate_beta_parameters(work_plastic: np.ndarray, 
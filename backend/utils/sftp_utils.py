@@ -5,19 +5,67 @@ Handles authentication, downloading, and connection management
 """
 
 import paramiko
+import atexit
+import contextlib
 import getpass
 import tempfile
+import fnmatch
 import os
-from typing import Optional, Tuple
-from ..config.constants import DEFAULT_SFTP_PORT, OTP_LENGTH
+import posixpath
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple
+from ..config.constants import (
+    DEFAULT_SFTP_PORT, OTP_LENGTH, DEFAULT_MAX_UNCONFIRMED_READS,
+    DEFAULT_SFTP_BUFFER_SIZE, MAX_SFTP_DOWNLOAD_WORKERS
+)
+
+
+# Authenticated transports shared by SFTPManager(share_session=True) instances,
+# keyed by (hostname, username), so one interactive login serves a whole run
+_SHARED_TRANSPORTS: Dict[Tuple[str, str], paramiko.Transport] = {}
+
+# Main SFTP channel of each shared transport, reused by every sharing manager
+# instead of opening (and closing) a fresh channel per processor call
+_SHARED_CLIENTS: Dict[Tuple[str, str], paramiko.SFTPClient] = {}
+
+
+def _shared_client(key: Tuple[str, str], transport: paramiko.Transport) -> paramiko.SFTPClient:
+    """Pooled SFTP channel on a shared transport, reopened if it was closed"""
+    client = _SHARED_CLIENTS.get(key)
+    channel = client.get_channel() if client is not None else None
+    if channel is None or channel.closed:
+        client = paramiko.SFTPClient.from_transport(transport)
+        if client is None:
+            raise Exception("Failed to create SFTP client")
+        _SHARED_CLIENTS[key] = client
+    return client
 
 
 class SFTPManager:
     """Manages SFTP connections and file operations"""
     
-    def __init__(self):
+    def __init__(self, share_session: bool = False):
+        """
+        Initialize SFTP manager
+        
+        Args:
+            share_session: Reuse (and register) a process-wide authenticated
+                transport and SFTP channel for the same hostname and username
+                instead of logging in again; close() then leaves both open
+        """
         self.transport: Optional[paramiko.Transport] = None
         self.sftp: Optional[paramiko.SFTPClient] = None
+        self.share_session = share_session
+        self._owns_transport = False
+        # Remote path -> size from stat_many(), so reads skip their own stat
+        self._file_sizes: Dict[str, int] = {}
+    
+    @classmethod
+    def from_config(cls, sftp_config: Optional[Dict]) -> 'SFTPManager':
+        """Create a manager honouring the config's optional 'share_session' flag"""
+        return cls(share_session=bool(sftp_config and sftp_config.get('share_session')))
         
     def parse_sftp_url(self, sftp_url: str) -> Tuple[str, str, str]:
         """
@@ -48,9 +96,24 @@ class SFTPManager:
         Returns:
             True if authentication successful, False otherwise
         """
+        key = (hostname, username)
+        shared = _SHARED_TRANSPORTS.get(key) if self.share_session else None
+        if shared is not None and shared.is_active():
+            try:
+                self.sftp = _shared_client(key, shared)
+                self.transport = shared
+                self._owns_transport = False
+                return True
+            except Exception:
+                pass
+            # The shared session went stale; log in again below
+            _SHARED_TRANSPORTS.pop(key, None)
+            _SHARED_CLIENTS.pop(key, None)
+        
         try:
             print(f"Connecting to {hostname}...")
             self.transport = paramiko.Transport((hostname, DEFAULT_SFTP_PORT))
+            self._owns_transport = True
             self.transport.connect()
             
             # Interactive authentication handler
@@ -84,6 +147,11 @@ class SFTPManager:
             
             if self.sftp is None:
                 raise Exception("Failed to create SFTP client")
+            
+            if self.share_session:
+                _SHARED_TRANSPORTS[key] = self.transport
+                _SHARED_CLIENTS[key] = self.sftp
+                self._owns_transport = False
                 
             print("✅ Authentication successful!")
             return True
@@ -93,24 +161,39 @@ class SFTPManager:
             self.close()
             return False
     
-    def download_file(self, remote_path: str, local_path: str) -> bool:
+    def download_file(self, remote_path: str, local_path: str,
+                      sftp: Optional[paramiko.SFTPClient] = None,
+                      max_unconfirmed_reads: int = DEFAULT_MAX_UNCONFIRMED_READS,
+                      buffer_size: int = DEFAULT_SFTP_BUFFER_SIZE) -> bool:
         """
         Download file from remote server
         
+        The whole file is requested up front with up to max_unconfirmed_reads
+        reads in flight, so high-latency links are not limited to one
+        round trip per chunk.
+        
         Args:
             remote_path: Path to file on remote server
             local_path: Local path to save the file
+            sftp: SFTP channel to download through (defaults to the main session)
+            max_unconfirmed_reads: Read requests kept outstanding
+            buffer_size: Bytes per read request
             
         Returns:
             True if download successful, False otherwise
         """
-        if self.sftp is None:
+        sftp = sftp or self.sftp
+        if sftp is None:
             print("❌ SFTP connection not established")
             return False
         
         try:
             print(f"Downloading {remote_path}...")
-            self.sftp.get(remote_path, local_path)
+            with sftp.open(remote_path, 'rb', bufsize=buffer_size) as remote_file:
+                remote_file.prefetch(remote_file.stat().st_size,
+                                     max_concurrent_requests=max_unconfirmed_reads)
+                with open(local_path, 'wb') as local_file:
+                    shutil.copyfileobj(remote_file, local_file, length=1 << 20)
             print(f"✅ Downloaded to {local_path}")
             return True
             
@@ -118,6 +201,183 @@ class SFTPManager:
             print(f"❌ Download failed: {str(e)}")
             return False
     
+    def download_files(self, remote_paths: List[str], local_dir: str,
+                       max_workers: int = MAX_SFTP_DOWNLOAD_WORKERS,
+                       max_unconfirmed_reads: int = DEFAULT_MAX_UNCONFIRMED_READS,
+                       buffer_size: int = DEFAULT_SFTP_BUFFER_SIZE) -> List[Optional[str]]:
+        """
+        Download several files concurrently over one authenticated transport
+        
+        Each worker thread opens one SFTP channel and reuses it for every file
+        it fetches, so a long file list costs one channel handshake per worker
+        rather than per file; each transfer is pipelined via prefetch.
+        
+        Args:
+            remote_paths: Paths of files on remote server
+            local_dir: Local directory to save the files in (by base name)
+            max_workers: Maximum concurrent downloads
+            max_unconfirmed_reads: Read requests kept outstanding per file
+            buffer_size: Bytes per read request
+            
+        Returns:
+            Local path for each remote path, or None where the download failed
+        """
+        worker_state = threading.local()
+        channels: List[paramiko.SFTPClient] = []
+        channels_lock = threading.Lock()
+        
+        def worker_channel() -> paramiko.SFTPClient:
+            channel = getattr(worker_state, 'channel', None)
+            if channel is None:
+                channel = self.open_sftp_channel()
+                worker_state.channel = channel
+                with channels_lock:
+                    channels.append(channel)
+            return channel
+        
+        def fetch(remote_path: str) -> Optional[str]:
+            local_path = os.path.join(local_dir, posixpath.basename(remote_path))
+            try:
+                channel = worker_channel()
+            except Exception as e:
+                print(f"❌ Download failed: {str(e)}")
+                return None
+            ok = self.download_file(remote_path, local_path, channel,
+                                    max_unconfirmed_reads, buffer_size)
+            return local_path if ok else None
+        
+        try:
+            if len(remote_paths) <= 1:
+                return [fetch(path) for path in remote_paths]
+            
+            # Transfers are I/O-bound, so threads overlap the network round trips
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(remote_paths))) as executor:
+                return list(executor.map(fetch, remote_paths))
+        finally:
+            for channel in channels:
+                channel.close()
+    
+    def list_files(self, pattern: str) -> List[str]:
+        """
+        List remote files whose names match a glob-style pattern
+        
+        Args:
+            pattern: Remote path pattern (e.g. '/scratch/run/dump.*')
+            
+        Returns:
+            Matching remote file paths, sorted
+        """
+        if self.sftp is None:
+            print("❌ SFTP connection not established")
+            return []
+        
+        remote_dir, file_pattern = posixpath.split(pattern)
+        names = fnmatch.filter(self.sftp.listdir(remote_dir or '.'), file_pattern)
+        return sorted(posixpath.join(remote_dir, name) if remote_dir else name for name in names)
+    
+    def is_connected(self) -> bool:
+        """Check whether an authenticated SFTP session is open"""
+        return (self.sftp is not None and self.transport is not None 
+                and self.transport.is_active())
+    
+    def open_sftp_channel(self) -> paramiko.SFTPClient:
+        """
+        Open an additional SFTP channel on the authenticated transport
+        
+        Lets worker threads read concurrently without re-authenticating.
+        The caller is responsible for closing the returned client.
+        
+        Returns:
+            New SFTP client sharing this connection
+        """
+        if not self.is_connected():
+            raise Exception("SFTP connection not established")
+        
+        sftp = paramiko.SFTPClient.from_transport(self.transport)
+        if sftp is None:
+            raise Exception("Failed to create SFTP client")
+        return sftp
+    
+    def open_remote(self, remote_path: str, sftp: Optional[paramiko.SFTPClient] = None,
+                    max_unconfirmed_reads: int = DEFAULT_MAX_UNCONFIRMED_READS,
+                    buffer_size: int = DEFAULT_SFTP_BUFFER_SIZE) -> paramiko.SFTPFile:
+        """
+        Open a remote file for streaming reads with the whole file prefetched
+        
+        Consumers (e.g. pandas.read_csv) can parse while bytes are still
+        arriving, without a local copy. The caller closes the returned file.
+        
+        Args:
+            remote_path: Path to file on remote server
+            sftp: SFTP channel to read through (defaults to the main session)
+            max_unconfirmed_reads: Read requests kept outstanding
+            buffer_size: Bytes per read request
+            
+        Returns:
+            Open binary file-like object
+        """
+        sftp = sftp or self.sftp
+        if sftp is None:
+            raise Exception("SFTP connection not established")
+        
+        remote_file = sftp.open(remote_path, 'rb', bufsize=buffer_size)
+        remote_file.prefetch(remote_file.stat().st_size, max_concurrent_requests=max_unconfirmed_reads)
+        return remote_file
+    
+    def read_bytes(self, remote_path: str, 
+                   sftp: Optional[paramiko.SFTPClient] = None) -> bytes:
+        """
+        Read a remote file's content into memory without touching local disk
+        
+        Args:
+            remote_path: Path to file on remote server
+            sftp: SFTP channel to read through (defaults to the main session)
+            
+        Returns:
+            File content
+        """
+        sftp = sftp or self.sftp
+        if sftp is None:
+            raise Exception("SFTP connection not established")
+        
+        with sftp.open(remote_path, 'rb') as remote_file:
+            remote_file.prefetch(self._file_sizes.get(remote_path))
+            return remote_file.read()
+    
+    def stat_many(self, remote_paths: List[str]) -> Dict[str, int]:
+        """
+        Look up the sizes of many remote files with one listing per directory
+        
+        Sizes are remembered for read_bytes(), whose prefetch would otherwise
+        stat every file in a separate round trip. Files not found in their
+        directory listing are left out (and stat'ed when read).
+        
+        Args:
+            remote_paths: Paths to files on remote server
+            
+        Returns:
+            Dictionary mapping remote path to size in bytes
+        """
+        if self.sftp is None:
+            raise Exception("SFTP connection not established")
+        
+        wanted: Dict[str, set] = {}
+        for remote_path in remote_paths:
+            wanted.setdefault(posixpath.dirname(remote_path), set()).add(posixpath.basename(remote_path))
+        
+        sizes = {}
+        for remote_dir, names in wanted.items():
+            try:
+                entries = self.sftp.listdir_attr(remote_dir or '.')
+            except IOError:
+                continue
+            for entry in entries:
+                if entry.filename in names and entry.st_size is not None:
+                    sizes[posixpath.join(remote_dir, entry.filename)] = entry.st_size
+        
+        self._file_sizes.update(sizes)
+        return sizes
+    
     def download_from_url(self, sftp_url: str, local_path: str) -> bool:
         """
         Download file directly from SFTP URL
@@ -144,13 +404,45 @@ class SFTPManager:
             self.close()
     
     def close(self):
-        """Close SFTP and transport connections"""
+        """Close SFTP and transport connections (a shared session stays open)"""
+        self._file_sizes.clear()
         if self.sftp:
-            self.sftp.close()
+            if self._owns_transport:
+                self.sftp.close()
             self.sftp = None
         if self.transport:
-            self.transport.close()
+            if self._owns_transport:
+                self.transport.close()
             self.transport = None
+            self._owns_transport = False
+
+
+def get_sftp_client(sftp_config: Dict) -> Optional[paramiko.SFTPClient]:
+    """
+    Pooled SFTP client for a configuration, logging in only on first use
+    
+    Args:
+        sftp_config: SFTP configuration with hostname and username
+        
+    Returns:
+        Live SFTP client shared for the rest of the process, or None if
+        authentication failed (the pool owns it; do not close it)
+    """
+    sftp_manager = SFTPManager(share_session=True)
+    if not sftp_manager.authenticate(sftp_config['hostname'], sftp_config['username']):
+        return None
+    return sftp_manager.sftp
+
+
+@atexit.register
+def close_shared_sessions():
+    """Close every session shared through SFTPManager(share_session=True)"""
+    while _SHARED_CLIENTS:
+        _, client = _SHARED_CLIENTS.popitem()
+        client.close()
+    while _SHARED_TRANSPORTS:
+        _, transport = _SHARED_TRANSPORTS.popitem()
+        transport.close()
 
 
 def is_remote_path(path: str) -> bool:
@@ -206,14 +498,53 @@ def download_file_sftp(remote_path: str, local_path: str, sftp_config: dict) ->
     Returns:
         True if download successful, False otherwise
     """
+    sftp_manager = SFTPManager.from_config(sftp_config)
     try:
-        sftp_manager = SFTPManager()
         if sftp_manager.authenticate(sftp_config['hostname'], sftp_config['username']):
-            return sftp_manager.download_file(remote_path, local_path)
+            return sftp_manager.download_file(
+                remote_path, local_path,
+                max_unconfirmed_reads=sftp_config.get('max_unconfirmed_reads', DEFAULT_MAX_UNCONFIRMED_READS),
+                buffer_size=sftp_config.get('buffer_size', DEFAULT_SFTP_BUFFER_SIZE)
+            )
         return False
     except Exception as e:
         print(f"❌ Error downloading file: {e}")
         return False
+    finally:
+        sftp_manager.close()
+
+
+@contextlib.contextmanager
+def open_remote_stream(sftp_url: str, sftp_config: Optional[Dict] = None) -> Iterator[IO[bytes]]:
+    """
+    Open a remote file for streaming reads, without a local copy
+    
+    The file is prefetched asynchronously, so a parser reading from the
+    stream overlaps with the transfer. With 'share_session' in the config the
+    pooled login is reused and stays open afterwards.
+    
+    Args:
+        sftp_url: Remote file as 'user@host:/path/file'
+        sftp_config: SFTP configuration; optional 'max_unconfirmed_reads' and
+            'buffer_size' tune the transfer
+        
+    Yields:
+        Open binary file-like object
+    """
+    sftp_config = sftp_config or {}
+    sftp_manager = SFTPManager.from_config(sftp_config)
+    try:
+        username, hostname, remote_path = sftp_manager.parse_sftp_url(sftp_url)
+        if not sftp_manager.authenticate(hostname, username):
+            raise Exception("Failed to authenticate to remote server")
+        with sftp_manager.open_remote(
+            remote_path,
+            max_unconfirmed_reads=sftp_config.get('max_unconfirmed_reads', DEFAULT_MAX_UNCONFIRMED_READS),
+            buffer_size=sftp_config.get('buffer_size', DEFAULT_SFTP_BUFFER_SIZE)
+        ) as remote_file:
+            yield remote_file
+    finally:
+        sftp_manager.close()
 
 
 def list_remote_files(pattern: str, sftp_config: dict) -> list:
@@ -227,42 +558,59 @@ def list_remote_files(pattern: str, sftp_config: dict) -> list:
     Returns:
         List of matching remote file paths
     """
+    sftp_manager = SFTPManager.from_config(sftp_config)
     try:
-        sftp_manager = SFTPManager()
         if sftp_manager.authenticate(sftp_config['hostname'], sftp_config['username']):
-            # For now, return a simple list - this would need proper implementation
-            # based on the pattern and remote directory listing
-            import fnmatch
-            
-            # Extract directory and pattern
-            if '/' in pattern:
-                remote_dir = '/'.join(pattern.split('/')[:-1])
-                file_pattern = pattern.split('/')[-1]
-            else:
-                remote_dir = '.'
-                file_pattern = pattern
-            
-            try:
-                # List files in remote directory
-                if sftp_manager.sftp is not None:
-                    files = sftp_manager.sftp.listdir(remote_dir)
-                    matching_files = []
-                    
-                    for file in files:
-                        if fnmatch.fnmatch(file, file_pattern):
-                            if remote_dir == '.':
-                                matching_files.append(file)
-                            else:
-                                matching_files.append(f"{remote_dir}/{file}")
-                    
-                    return matching_files
-                else:
-                    print("❌ SFTP connection not established")
-                    return []
-            except Exception as e:
-                print(f"❌ Error listing remote files: {e}")
-                return []
+            return sftp_manager.list_files(pattern)
+        return []
+    except Exception as e:
+        print(f"❌ Error listing remote files: {e}")
         return []
+    finally:
+        sftp_manager.close()
+
+
+def fetch_remote_files(pattern: str, local_dir: str, sftp_config: dict,
+                       limit: Optional[int] = None,
+                       sort_key: Optional[Callable[[str], object]] = None) -> List[str]:
+    """
+    List and download all remote files matching a pattern over one session
+    
+    Args:
+        pattern: Remote path pattern (a plain path fetches that one file)
+        local_dir: Local directory to save the files in
+        sftp_config: SFTP configuration with hostname and username; optional
+            'max_unconfirmed_reads', 'buffer_size' and 'max_workers' tune the transfer
+            and 'share_session' reuses the process-wide login
+        limit: Download only the first limit matches (None for all)
+        sort_key: Ordering of the matches before limit is applied (default: sorted paths)
+        
+    Returns:
+        Local paths of the downloaded files, in that order
+    """
+    sftp_manager = SFTPManager.from_config(sftp_config)
+    try:
+        if not sftp_manager.authenticate(sftp_config['hostname'], sftp_config['username']):
+            return []
+        
+        remote_paths = sftp_manager.list_files(pattern)
+        if not remote_paths:
+            print(f"⚠️  No remote files match {pattern}")
+            return []
+        if sort_key is not None:
+            remote_paths.sort(key=sort_key)
+        if limit is not None:
+            remote_paths = remote_paths[:limit]
+        
+        local_paths = sftp_manager.download_files(
+            remote_paths, local_dir,
+            max_workers=sftp_config.get('max_workers', MAX_SFTP_DOWNLOAD_WORKERS),
+            max_unconfirmed_reads=sftp_config.get('max_unconfirmed_reads', DEFAULT_MAX_UNCONFIRMED_READS),
+            buffer_size=sftp_config.get('buffer_size', DEFAULT_SFTP_BUFFER_SIZE)
+        )
+        return [path for path in local_paths if path is not None]
     except Exception as e:
-        print(f"❌ Error in list_remote_files: {e}")
+        print(f"❌ Error fetching remote files: {e}")
         return []
+    finally:
+        sftp_manager.close()